@@ -0,0 +1,88 @@
+using System.IO;
+using System.Linq;
+using System.Text;
+using System.Threading.Tasks;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Running;
+using DemoV3;
+using DemoV3.Model;
+using Microsoft.AspNetCore.Http;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace DiscriminatorBenchmark
+{
+    /// <summary>
+    /// compares the dispatch of oneOf request bodies in the generated functions of DemoV3:
+    /// parsing the body into a JObject and converting it with ToObject (the former FunctionSwitchTemplate),
+    /// and reading the discriminator with a forward-only reader before deserializing into the mapped type.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class DiscriminatorDispatch
+    {
+        [Params(1, 100, 10000)]
+        public int Emails { get; set; }
+
+        [Params(true, false)]
+        public bool DiscriminatorFirst { get; set; }
+
+        private byte[] _body;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var emails = JsonConvert.SerializeObject(Enumerable.Range(0, Emails).Select(i => $"user{i}@example.com"));
+            var properties = new[]
+            {
+                "\"name\":\"Jane Doe\"",
+                "\"address\":{\"street\":\"Main Street 1\",\"postalCode\":\"12345\",\"city\":\"Springfield\",\"country\":\"US\"}",
+                "\"birthdate\":\"1990-01-31\"",
+                $"\"emails\":{emails}"
+            };
+            var json = DiscriminatorFirst
+                ? "{\"type\":\"simple\"," + string.Join(",", properties) + "}"
+                : "{" + string.Join(",", properties) + ",\"type\":\"simple\"}";
+            _body = Encoding.UTF8.GetBytes(json);
+        }
+
+        private HttpRequest Request()
+        {
+            var context = new DefaultHttpContext();
+            context.Request.Body = new MemoryStream(_body, false);
+            context.Request.ContentLength = _body.Length;
+            return context.Request;
+        }
+
+        [Benchmark(Baseline = true)]
+        public async Task<AnyUser> JObjectToObject()
+        {
+            var request = Request();
+            var jObject = await DemoV3Functions.ParseJson<JObject>(request);
+            var discriminator = jObject["type"]?.ToString();
+            return discriminator switch
+            {
+                "simple" => (AnyUser)DemoV3Functions.ToObject<User>(jObject),
+                "guest" => DemoV3Functions.ToObject<GuestUser>(jObject),
+                _ => null
+            };
+        }
+
+        [Benchmark]
+        public async Task<AnyUser> ReadDiscriminator()
+        {
+            var request = Request();
+            var discriminator = await DemoV3Functions.ReadDiscriminator(request, "type");
+            return discriminator switch
+            {
+                "simple" => (AnyUser)await DemoV3Functions.ParseJson<User>(request),
+                "guest" => await DemoV3Functions.ParseJson<GuestUser>(request),
+                _ => null
+            };
+        }
+    }
+
+    public static class Program
+    {
+        public static void Main(string[] args) => BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args);
+    }
+}
@@ -0,0 +1,60 @@
+"""
+compares the time to load large YAML and JSON specs with prance's default parser and with caffoa's loaders.
+
+usage: python benchmarks/load_benchmark.py [--size-mb 10] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import yaml
+from prance.util import formats
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from caffoa import loaders  # noqa: E402
+from spec_generator import SpecSize, create_spec  # noqa: E402
+
+
+def create_documents(size_mb: float):
+    """
+    returns a YAML and a JSON document of at least the given size
+    """
+    schemas = 100
+    while True:
+        spec, _ = create_spec(SpecSize(schemas=schemas, properties=15, external_schemas=0, paths=schemas // 2))
+        yaml_text, json_text = yaml.safe_dump(spec, sort_keys=False), json.dumps(spec, indent=2)
+        smallest = min(len(yaml_text), len(json_text))
+        if smallest >= size_mb * 1024 * 1024:
+            return yaml_text, json_text
+        schemas = int(schemas * size_mb * 1024 * 1024 / smallest) + 100
+
+
+def measure(func, text: str, file_name: str, repeat: int) -> float:
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text, file_name)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=float, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    yaml_text, json_text = create_documents(args.size_mb)
+    print(f"backends: yaml={loaders.YAML_BACKEND}, json={loaders.JSON_BACKEND}")
+    for name, text, file_name in [("YAML", yaml_text, "spec.yml"), ("JSON", json_text, "spec.json")]:
+        size = len(text.encode("utf-8")) / 1024 / 1024
+        default = measure(formats.parse_spec, text, file_name, args.repeat)
+        fast = measure(loaders.parse_spec, text, file_name, args.repeat)
+        print(f"{name} {size:6.1f} MiB: prance {default * 1000:10.1f} ms, caffoa {fast * 1000:10.1f} ms "
+              f"({default / fast:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
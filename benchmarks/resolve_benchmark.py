@@ -0,0 +1,62 @@
+"""
+compares the time and peak memory of resolving a spec twice (one parser for the model, one for the functions)
+with the single shared resolution pass of OpenApiFile.
+
+usage: python benchmarks/resolve_benchmark.py [path/to/openapi.yml] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+from prance import ResolvingParser
+from prance.util.resolver import RESOLVE_HTTP, RESOLVE_FILES, TRANSLATE_EXTERNAL
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from caffoa.openapi_file import OpenApiFile  # noqa: E402
+from caffoa.path_parser import PathParser  # noqa: E402
+
+
+def double_parse(path: str):
+    model_parser = ResolvingParser(path, strict=False, resolve_types=RESOLVE_HTTP | RESOLVE_FILES,
+                                   resolve_method=TRANSLATE_EXTERNAL)
+    function_parser = ResolvingParser(path, strict=False)
+    PathParser(function_parser).parse()
+    return model_parser, function_parser
+
+
+def single_parse(path: str):
+    handler = OpenApiFile(path, 3, dict())
+    PathParser(handler.function_parser()).parse()
+    return handler.model_parser()
+
+
+def measure(func, path: str, repeat: int):
+    func(path)  # warm up imports and validator caches
+    times = list()
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        func(path)
+        times.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("spec", nargs="?",
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "../tests/openapi.yml"))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for name, func in [("double parse", double_parse), ("single parse", single_parse)]:
+        duration, peak = measure(func, args.spec, args.repeat)
+        print(f"{name:15} {duration * 1000:10.1f} ms {peak / 1024 / 1024:10.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+times each phase of the generation for synthetic specs, and writes the results to a json file,
+so that the numbers can be compared between releases.
+
+usage: python benchmarks/run_benchmarks.py [--sizes small,medium,large] [--output benchmark_results.json]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from caffoa import duplication_handler, output  # noqa: E402
+from caffoa.function_writer import FunctionWriter  # noqa: E402
+from caffoa.interface_writer import InterfaceWriter  # noqa: E402
+from caffoa.model_parser import ModelParser  # noqa: E402
+from caffoa.model_writer import ModelWriter  # noqa: E402
+from caffoa.openapi_file import OpenApiFile  # noqa: E402
+from caffoa.path_parser import PathParser  # noqa: E402
+from spec_generator import PRESETS, write_spec  # noqa: E402
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.phases = dict()
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        yield
+        self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def run(spec_file: str, output_folder: str) -> dict:
+    duplication_handler.init("overwrite")
+    output.init()
+    timer = PhaseTimer()
+    handler = OpenApiFile(spec_file, 3, dict())
+    with timer.phase("resolve"):
+        spec = handler.parser()
+    model_parser = ModelParser()
+    with timer.phase("model_parser.parse"):
+        model = model_parser.parse(spec)
+    path_parser = PathParser(spec)
+    path_parser.known_types = model_parser.known_types
+    with timer.phase("path_parser.parse"):
+        endpoints = path_parser.parse(True)
+
+    model_writer = ModelWriter(3, "Benchmark.Model", os.path.join(output_folder, "Model"))
+    with timer.phase("model_writer.write"):
+        model_writer.write(model)
+    interface_writer = InterfaceWriter(3, "Benchmark", "Benchmark", output_folder)
+    interface_writer.imports.append(model_writer.namespace)
+    with timer.phase("interface_writer.write"):
+        interface_writer.write(endpoints)
+    function_writer = FunctionWriter(3, "Benchmark", "Benchmark", output_folder, interface_writer.interface_name)
+    function_writer.imports.append(model_writer.namespace)
+    os.makedirs(function_writer.error_folder, exist_ok=True)
+    with timer.phase("function_writer.write"):
+        function_writer.write(endpoints)
+    return dict(phases=timer.phases, models=len(model), endpoints=len(endpoints))
+
+
+def caffoa_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("caffoa")
+    except Exception:
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="small,medium", help=f"comma separated list of {', '.join(PRESETS)}")
+    parser.add_argument("--repeat", type=int, default=3, help="the fastest of all runs is reported")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+    results = dict(caffoa=caffoa_version(),
+                   python=platform.python_version(),
+                   platform=platform.platform(),
+                   date=datetime.datetime.now().isoformat(timespec="seconds"),
+                   sizes=dict())
+    for size_name in args.sizes.split(","):
+        size = PRESETS[size_name.strip()]
+        with tempfile.TemporaryDirectory() as folder:
+            spec_file = write_spec(os.path.join(folder, "spec"), size)
+            runs = [run(spec_file, os.path.join(folder, f"output{i}")) for i in range(args.repeat)]
+        phases = {name: min(result["phases"][name] for result in runs) for name in runs[0]["phases"]}
+        results["sizes"][size_name] = dict(spec=vars(size), models=runs[0]["models"],
+                                           endpoints=runs[0]["endpoints"], phases=phases,
+                                           total=sum(phases.values()))
+        print(f"{size_name}: {runs[0]['models']} models, {runs[0]['endpoints']} endpoints")
+        for name, duration in phases.items():
+            print(f"  {name:30} {duration * 1000:10.1f} ms")
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
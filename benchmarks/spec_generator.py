@@ -0,0 +1,170 @@
+"""
+creates synthetic openapi specs of configurable size for benchmarking caffoa.
+
+usage: python benchmarks/spec_generator.py output_folder [--schemas N] [--properties N] [--paths N] ...
+"""
+import argparse
+import os
+from typing import Tuple
+
+import yaml
+
+
+class SpecSize:
+    def __init__(self, schemas: int = 100, properties: int = 10, enum_every: int = 5, all_of_every: int = 4,
+                 one_of_every: int = 10, external_schemas: int = 10, paths: int = 50):
+        self.schemas = schemas
+        self.properties = properties
+        self.enum_every = enum_every
+        self.all_of_every = all_of_every
+        self.one_of_every = one_of_every
+        self.external_schemas = external_schemas
+        self.paths = paths
+
+
+PRESETS = {
+    "small": SpecSize(schemas=20, properties=5, external_schemas=2, paths=10),
+    "medium": SpecSize(schemas=200, properties=10, external_schemas=20, paths=100),
+    "large": SpecSize(schemas=1500, properties=15, external_schemas=100, paths=750),
+}
+
+PRIMITIVES = [
+    dict(type="string"),
+    dict(type="integer"),
+    dict(type="integer", format="int64"),
+    dict(type="number"),
+    dict(type="boolean"),
+    dict(type="string", format="date"),
+    dict(type="string", format="date-time"),
+    dict(type="string", format="uuid"),
+    dict(type="array", items=dict(type="string")),
+    dict(type="object", additionalProperties=dict(type="string")),
+]
+
+EXTERNAL_FILE = "shared.openapi.yml"
+
+
+def _external_ref(number: int) -> str:
+    return f"{EXTERNAL_FILE}#/components/schemas/shared{number}"
+
+
+def _properties(size: SpecSize, number: int) -> dict:
+    properties = dict()
+    for prop in range(size.properties):
+        name = f"prop{prop}"
+        if size.enum_every and prop % size.enum_every == size.enum_every - 1:
+            properties[name] = dict(type="string", enum=[f"value{i}" for i in range(5)], default="value0")
+        elif prop == 1 and number > 0:
+            properties[name] = {"$ref": f"#/components/schemas/schema{number - 1}"}
+        elif prop == 2 and size.external_schemas:
+            properties[name] = {"$ref": _external_ref(number % size.external_schemas)}
+        else:
+            properties[name] = dict(PRIMITIVES[(number + prop) % len(PRIMITIVES)],
+                                    description=f"property {prop} of schema {number}")
+    return properties
+
+
+def create_spec(size: SpecSize) -> Tuple[dict, dict]:
+    """
+    returns the main spec, and the spec with the shared external schemas
+    """
+    schemas = dict()
+    schemas["error"] = dict(type="object", properties=dict(message=dict(type="string")), required=["message"])
+    for number in range(size.schemas):
+        schema = dict(type="object", description=f"schema number {number}",
+                      properties=_properties(size, number), required=["prop0"])
+        schemas[f"schema{number}"] = schema
+        if size.all_of_every and number % size.all_of_every == 0:
+            schemas[f"schema{number}WithId"] = {"allOf": [
+                {"$ref": f"#/components/schemas/schema{number}"},
+                dict(type="object", properties=dict(id=dict(type="string", format="uuid")))
+            ]}
+    one_of_schemas = list()
+    if size.one_of_every:
+        for number in range(0, size.schemas - 1, size.one_of_every):
+            first, second = f"schema{number}", f"schema{number + 1}"
+            for child in [first, second]:
+                schemas[child]["properties"]["kind"] = dict(type="string", enum=[child], default=child)
+            schemas[f"any{number}"] = dict(
+                oneOf=[{"$ref": f"#/components/schemas/{first}"}, {"$ref": f"#/components/schemas/{second}"}],
+                discriminator=dict(propertyName="kind", mapping={
+                    first: f"#/components/schemas/{first}",
+                    second: f"#/components/schemas/{second}",
+                }))
+            one_of_schemas.append(f"any{number}")
+
+    error_response = {"$ref": "#/components/responses/error"}
+    paths = dict()
+    for number in range(size.paths):
+        schema = f"schema{number % max(size.schemas, 1)}"
+        body = {"$ref": f"#/components/schemas/{schema}"}
+        if one_of_schemas and number % 3 == 2:
+            body = {"$ref": f"#/components/schemas/{one_of_schemas[number % len(one_of_schemas)]}"}
+        content = lambda ref: {"application/json": dict(schema=ref)}
+        paths[f"/items{number}"] = dict(
+            get=dict(operationId=f"items{number}-list", description=f"list items {number}",
+                     responses={"200": dict(description="list", content=content(
+                         dict(type="array", items={"$ref": f"#/components/schemas/{schema}"}))),
+                         "400": error_response}),
+            post=dict(operationId=f"items{number}-create", description=f"create item {number}",
+                      requestBody=dict(content=content(body)),
+                      responses={"201": dict(description="created",
+                                             content=content({"$ref": f"#/components/schemas/{schema}"})),
+                                 "400": error_response}),
+        )
+        paths[f"/items{number}/{{itemId}}"] = dict(
+            parameters=[dict(name="itemId", description="the id", required=True, schema=dict(type="string", format="uuid"))],
+            get=dict(operationId=f"items{number}-get", description=f"get item {number}",
+                     responses={"200": dict(description="item",
+                                            content=content({"$ref": f"#/components/schemas/{schema}"})),
+                                "404": dict(description="not found")}),
+            put=dict(operationId=f"items{number}-put", description=f"update item {number}",
+                     requestBody=dict(content=content({"$ref": f"#/components/schemas/{schema}"})),
+                     responses={"200": dict(description="updated",
+                                            content=content({"$ref": f"#/components/schemas/{schema}"})),
+                                "201": dict(description="created",
+                                            content=content({"$ref": f"#/components/schemas/{schema}"}))}),
+            delete=dict(operationId=f"items{number}-delete", description=f"delete item {number}",
+                        responses={"204": dict(description="deleted")}),
+        )
+        for parameter in paths[f"/items{number}/{{itemId}}"]["parameters"]:
+            parameter["in"] = "path"
+
+    spec = dict(openapi="3.0.2", info=dict(title="Benchmark API", version="1.0"),
+                components=dict(schemas=schemas, responses=dict(error=dict(
+                    description="Error", content={"application/json": dict(schema={"$ref": "#/components/schemas/error"})}))),
+                paths=paths)
+    shared = dict(openapi="3.0.2", info=dict(title="Shared", version="1.0"), paths=dict(),
+                  components=dict(schemas={f"shared{number}": dict(
+                      type="object", properties=dict(name=dict(type="string"), value=dict(type="number")))
+                      for number in range(size.external_schemas)}))
+    return spec, shared
+
+
+def write_spec(folder: str, size: SpecSize) -> str:
+    """
+    writes the spec files to the folder and returns the path to the main spec
+    """
+    os.makedirs(folder, exist_ok=True)
+    spec, shared = create_spec(size)
+    with open(os.path.join(folder, EXTERNAL_FILE), "w", encoding="utf-8") as f:
+        yaml.safe_dump(shared, f, sort_keys=False)
+    file_name = os.path.join(folder, "benchmark.openapi.yml")
+    with open(file_name, "w", encoding="utf-8") as f:
+        yaml.safe_dump(spec, f, sort_keys=False)
+    return file_name
+
+
+def main():
+    defaults = SpecSize()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("folder")
+    for name, value in vars(defaults).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=value)
+    args = parser.parse_args()
+    size = SpecSize(**{name: getattr(args, name) for name in vars(defaults)})
+    print(write_spec(args.folder, size))
+
+
+if __name__ == "__main__":
+    main()
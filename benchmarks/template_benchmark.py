@@ -0,0 +1,60 @@
+"""
+renders 10k model properties with the compiled templates of the template registry,
+and compares it with plain str.format on the same template text.
+
+usage: python benchmarks/template_benchmark.py [--properties N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from caffoa.model import MemberData  # noqa: E402
+from caffoa.model_writer import ModelWriter  # noqa: E402
+
+
+def create_properties(count: int):
+    properties = list()
+    for i in range(count):
+        prop = MemberData(f"property_{i}")
+        prop.typename = "string" if i % 2 else "int"
+        prop.description = f"description of property {i}"
+        prop.is_required = i % 3 == 0
+        if i % 5 == 0:
+            prop.enums = {'"a"': "a", '"b"': "b"} if i % 2 else {1: "1", 2: "2"}
+        properties.append(prop)
+    return properties
+
+
+def render(writer: ModelWriter, properties: list) -> float:
+    start = time.perf_counter()
+    for prop in properties:
+        writer.format_property(prop)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    properties = create_properties(args.properties)
+
+    compiled = ModelWriter(3, "Benchmark", "unused")
+    plain = ModelWriter(3, "Benchmark", "unused")
+    plain.prop_template = plain.prop_template.text
+    plain.enum_prop_template = plain.enum_prop_template.text
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        ModelWriter(3, "Benchmark", "unused")
+    print(f"{'writer creation':20} {(time.perf_counter() - start):10.4f} ms per writer")
+    for name, writer in [("str.format", plain), ("compiled", compiled)]:
+        duration = min(render(writer, properties) for _ in range(args.repeat))
+        print(f"{name:20} {duration * 1000:10.1f} ms for {args.properties} properties")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,35 @@
 import argparse
-import glob
-import logging
-import os
+from typing import List, Optional
 
-import yaml
+from caffoa import profiler
+from caffoa.generator import load_config, create_cache, create_handler, generate
+from caffoa.watcher import Watcher
 
-from caffoa import duplication_handler
-from caffoa.openapi_file import OpenApiFile
 
-
-def execute():
+def execute(arguments: Optional[List[str]] = None):
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", default="caffoa.yml", help="Path to config file (Default: caffoa.yml)")
-    parser.add_argument('--clean', action='store_true', help="remove all files with the pattern *.generated.cs")
-    args = parser.parse_args()
-    with open(args.config, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    if not "services" in data:
-        raise Warning("no services in config file.")
-    services = data["services"]
-    if type(services) != list:
-        raise Warning("services should be list")
-    try:
-        settings = data["config"]
-        if type(settings) != dict:
-            raise Warning("config should be key/values pairs")
-    except KeyError:
-        settings = dict()
-    version = settings.get("version", 1)
-    duplication_handler.init(settings.get("duplicates", "overwrite"))
-
-    if settings.get('clearGeneratedFiles', args.clean):
-        old_files = glob.glob('**/*.generated.cs', recursive=True)
-        for file in old_files:
-            logging.info(f"Removing {file}")
-            os.unlink(file)
-
-
-    for number, config in enumerate(services):
-        if not "apiPath" in config:
-            raise Warning(f"apiPath is required for service #{number}")
-        api_config = settings.copy()
-        api_config.update(config.get("config", dict()))
-        handler = OpenApiFile(config["apiPath"], version, api_config)
-        if "model" in config:
-            handler.create_model(config["model"])
-
-        if "function" in config:
-            handler.create_function(config["function"])
+    parser.add_argument('--clean', action='store_true',
+                        help="remove files generated by earlier runs that are not generated anymore")
+    parser.add_argument('--no-cache', action='store_true', help="do not use or update the cache of resolved specs")
+    parser.add_argument('--full', action='store_true',
+                        help="render all files, even if their inputs did not change since the last run")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="number of worker processes that resolve and parse services in parallel (Default: 1)")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running, and regenerate the services whose config or spec files change")
+    parser.add_argument('--profile', nargs='?', const="caffoa-profile.json", default=None,
+                        help="record time and memory per service and phase, and write them to the given json file "
+                             "(Default: caffoa-profile.json)")
+    args = parser.parse_args(arguments)
+    profiler.init(args.profile is not None)
+    if args.watch:
+        Watcher(args).run()
+        return
+    with profiler.phase("config load"):
+        services, settings = load_config(args.config)
+    cache = create_cache(settings, args)
+    handlers = [create_handler(number, config, settings, cache) for number, config in enumerate(services)]
+    generate(handlers, services, settings, args)
+    if args.profile is not None:
+        profiler.get().write_report(args.profile)
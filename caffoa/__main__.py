@@ -1,5 +1,4 @@
 import logging
-import time
 
 from caffoa import execute
 if __name__ == "__main__":
@@ -10,8 +9,6 @@ if __name__ == "__main__":
     Please check https://github.com/claasd/caffoa.net for a replacement dotnet tool
     --- DEPRECATION WARNING ---
     """)
-
-    time.sleep(5.0)
     execute()
     logging.warning("""
      --- DEPRECATION WARNING ---
@@ -19,5 +16,3 @@ if __name__ == "__main__":
     Please check https://github.com/claasd/caffoa.net for a replacement dotnet tool
     --- DEPRECATION WARNING ---
     """)
-
-    time.sleep(5.0)
@@ -1,16 +1,69 @@
+import glob
 import os
+from typing import Iterable, Optional
+
+from caffoa import manifest, output, templates
+from caffoa.converter import capitalize_first
+from caffoa.manifest import fingerprint
+from caffoa.templates import Template
+
+NEWTONSOFT = "newtonsoft"
+SYSTEM_TEXT_JSON = "systemTextJson"
+
+
+def check_serializer(serializer: str, version: int):
+    if serializer not in (NEWTONSOFT, SYSTEM_TEXT_JSON):
+        raise Warning(f"unknown serializer '{serializer}', use '{NEWTONSOFT}' or '{SYSTEM_TEXT_JSON}'")
+    if serializer == SYSTEM_TEXT_JSON and version < 3:
+        raise Warning(f"serializer '{SYSTEM_TEXT_JSON}' needs version 3")
 
 
 class BaseWriter:
-    def __init__(self, version: int):
+    def __init__(self, version: int, serializer: str = NEWTONSOFT):
+        check_serializer(serializer, version)
         self.version = version
-        self.template_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"data/v{version}")
-        self.base_template_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"data/base")
+        self.serializer = serializer
+
+    def load_template(self, name, per_serializer: bool = False) -> Template:
+        """
+        loads a template. Templates that depend on the serializer are named after it for all serializers
+        but newtonsoft, e.g. 'ModelTemplate.SystemTextJson.cs'
+        """
+        if per_serializer and self.serializer != NEWTONSOFT:
+            base, extension = os.path.splitext(name)
+            name = f"{base}.{capitalize_first(self.serializer)}{extension}"
+        return templates.load(self.version, name)
+
+    def inputs_hash(self, *data) -> str:
+        """
+        hash of all writer settings (including the loaded templates) and the passed data
+        """
+        return fingerprint(vars(self), *data)
+
+    @staticmethod
+    def is_unchanged(file_name: str, inputs: str) -> bool:
+        if manifest.get() is not None and manifest.get().is_current(file_name, inputs):
+            output.get().skipped += 1
+            return True
+        return False
+
+    @staticmethod
+    def write_file(file_name: str, content: str, inputs: str, sources: Optional[dict] = None):
+        output.write(file_name, content)
+        if manifest.get() is not None:
+            manifest.get().record(file_name, inputs, sources)
 
-    def load_template(self, name):
-        path = os.path.join(self.template_folder, name)
-        if not os.path.exists(path):
-            path = os.path.join(self.base_template_folder, name)
+    @staticmethod
+    def write_file_stream(file_name: str, chunks: Iterable[str], inputs: str, sources: Optional[dict] = None):
+        output.write_stream(file_name, chunks)
+        if manifest.get() is not None:
+            manifest.get().record(file_name, inputs, sources)
 
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read()
+    @staticmethod
+    def remove_stale_shards(folder: str, class_name: str):
+        """
+        removes partial files of the class from an earlier run with a different split (or with split before)
+        """
+        if manifest.get() is not None:
+            pattern = os.path.join(glob.escape(os.path.abspath(folder)), f"{glob.escape(class_name)}.*.generated.cs")
+            manifest.get().remove_stale_matching(pattern)
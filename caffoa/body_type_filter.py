@@ -1,22 +1,63 @@
+import fnmatch
+import re
 from typing import Optional
 
 from caffoa.model import EndPoint
 
 
 class BodyTypeFilter:
+    """
+    matches endpoints against the requestBodyType config. The config is compiled once into lookup tables,
+    if multiple filters match, the first one in the config wins.
+
+    A filter can contain methods, operations (operationIds, may contain * and ? wildcards),
+    operationPatterns (regular expressions for operationIds) and paths (path prefixes).
+    """
+
     def __init__(self, config: list):
         self.config = config
-
-    def _match_filter(self, endpoint: EndPoint) -> Optional[str]:
-        for item in self.config:
+        self.types = list()
+        self.methods = dict()
+        self.operations = dict()
+        self.paths = dict()
+        self.patterns = list()  # (index, compiled pattern) in the order of the config
+        for index, item in enumerate(config):
+            self.types.append(item["type"])
             filter = item.get("filter", dict())
             for method in filter.get("methods", list()):
-                if method.lower() == endpoint.method:
-                    return item["type"]
+                self.methods.setdefault(method.lower(), index)
             for operation in filter.get("operations", list()):
-                if operation == endpoint.operation:
-                    return item["type"]
-        return None
+                if any(c in operation for c in "*?["):
+                    self.patterns.append((index, re.compile(fnmatch.translate(operation))))
+                else:
+                    self.operations.setdefault(operation, index)
+            for pattern in filter.get("operationPatterns", list()):
+                try:
+                    self.patterns.append((index, re.compile(pattern)))
+                except re.error as e:
+                    raise Warning(f"invalid operationPattern '{pattern}' in requestBodyType #{index + 1}: {e}")
+            for path in filter.get("paths", list()):
+                self.paths.setdefault(str(path).strip("/"), index)
+
+    def _match_filter(self, endpoint: EndPoint) -> Optional[str]:
+        matches = [self.methods.get(endpoint.method), self.operations.get(endpoint.operation)]
+        if self.paths:
+            prefix = ""
+            for part in endpoint.path.split("/"):
+                prefix = f"{prefix}/{part}" if prefix else part
+                matches.append(self.paths.get(prefix))
+            matches.append(self.paths.get(""))
+        matches = [index for index in matches if index is not None]
+        best = min(matches) if matches else len(self.types)
+        for index, pattern in self.patterns:
+            if index >= best:
+                break
+            if pattern.fullmatch(endpoint.operation):
+                best = index
+                break
+        if best == len(self.types):
+            return None
+        return self.types[best]
 
     def body_type(self, endpoint: EndPoint) -> Optional[str]:
         return self._match_filter(endpoint)
@@ -27,4 +68,6 @@ class BodyTypeFilter:
             return list()
         if type.lower() == "jobject":
             return ["Newtonsoft.Json.Linq"]
+        if type.lower() in ("jsonobject", "jsonnode"):
+            return ["System.Text.Json.Nodes"]
         return list()
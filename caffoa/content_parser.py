@@ -2,14 +2,15 @@ from typing import Optional
 
 from caffoa.converter import is_primitive, parse_type
 from caffoa.model import BodyConfig
-from caffoa.object_parser import BaseObjectParser
+from caffoa.naming import ClassNaming
 
 
 class ContentParser:
-    def __init__(self, known_types: dict, prefix: str, suffix: str):
+    def __init__(self, known_types: dict, prefix: str, suffix: str, naming: Optional[ClassNaming] = None):
         self.known_types = known_types
         self.suffix = suffix
         self.prefix = prefix
+        self.naming = naming if naming is not None else ClassNaming(prefix, suffix)
 
     def parse_content_list(self, content: dict, one_of_schemas: dict):
         schema = self.get_schema(content)
@@ -91,7 +92,7 @@ class ContentParser:
         return None
 
     def name_for_ref(self, ref):
-        name = BaseObjectParser(self.prefix, self.suffix).class_name_from_ref(ref)
+        name = self.naming.class_name_from_ref(ref)
         if name in self.known_types:
             return dict(self.known_types[name])["type"]
         return name
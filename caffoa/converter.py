@@ -56,6 +56,34 @@ def parse_type(schema: dict, nullable: bool = False) -> str:
     return f"{type}{suffix}"
 
 
+CLR_TYPE_NAMES = {"string": "String", "int": "Int32", "long": "Int64", "ulong": "UInt64", "uint": "UInt32",
+                  "double": "Double", "bool": "Boolean", "object": "Object"}
+
+
+def type_info_name(type: str) -> str:
+    """
+    name of the JsonTypeInfo property that the System.Text.Json source generator creates for a C# type,
+    e.g. 'IEnumerableUser' for 'IEnumerable<User>' or 'NullableInt32' for 'int?'
+    """
+    type = type.strip()
+    if type.endswith("?"):
+        return "Nullable" + type_info_name(type[:-1])
+    if type.endswith("[]"):
+        return type_info_name(type[:-2]) + "Array"
+    if "<" in type:
+        name, arguments = type.split("<", 1)
+        depth = 0
+        parts = [""]
+        for char in arguments[:-1]:
+            if char == "," and depth == 0:
+                parts.append("")
+                continue
+            depth += (char == "<") - (char == ">")
+            parts[-1] += char
+        return type_info_name(name) + "".join(type_info_name(part) for part in parts)
+    return CLR_TYPE_NAMES.get(type, type.split(".")[-1])
+
+
 def get_response_type(endpoint: EndPoint) -> Optional[MethodResult]:
     responses = endpoint.responses
     type = None
@@ -0,0 +1,28 @@
+using System;
+using System.Globalization;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace {NAMESPACE} {{
+    /// <summary>
+    /// custom converter to create date formats.
+    /// By default, System.Text.Json only supports DateTime formats.
+    /// </summary>
+    public class CustomJsonDateConverter : JsonConverter<DateTime>
+    {{
+        private const string DateFormat = "yyyy-MM-dd";
+
+        public override DateTime Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {{
+            if (DateTime.TryParseExact(reader.GetString(), DateFormat, CultureInfo.InvariantCulture,
+                    DateTimeStyles.None, out var date))
+                return date;
+            return reader.GetDateTime();
+        }}
+
+        public override void Write(Utf8JsonWriter writer, DateTime value, JsonSerializerOptions options)
+        {{
+            writer.WriteStringValue(value.ToString(DateFormat, CultureInfo.InvariantCulture));
+        }}
+    }}
+}}
@@ -0,0 +1,18 @@
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+
+namespace {NAMESPACE}
+{{
+    /// AUTOGENERATED BY caffoa
+    /// <summary>
+    /// Interface for service factory, useful if you need to create a service based on header or other data
+    /// </summary>
+    public interface {CLASSNAME}Factory
+    {{
+        /// <summary>
+        /// returns the actual instance that handles requests
+        /// </summary>
+        public {CLASSNAME} Instance(HttpRequest request);
+    }}
+}}
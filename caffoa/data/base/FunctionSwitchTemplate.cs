@@ -1,5 +1,4 @@
-var jObject = await ParseJson<JObject>(request.Body);
-                var discriminator = jObject["{DISC}"]?.ToString();
+var discriminator = await ReadDiscriminator(request, "{DISC}");
                 {VALUE} discriminator switch
                 {{{{
                     {CASES},
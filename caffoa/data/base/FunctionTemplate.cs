@@ -1,10 +1,14 @@
 using System;
+using System.Buffers;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
+using System.Text;
+using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.AspNetCore.Http;
 using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.WebUtilities;
 using Microsoft.Azure.WebJobs;
 using Microsoft.Azure.WebJobs.Extensions.Http;
 using Microsoft.Extensions.Logging;
@@ -15,7 +19,7 @@ using Newtonsoft.Json.Linq;
 namespace {NAMESPACE}
 {{
     /// AUTO GENERATED CLASS
-    public class {CLASSNAME}
+    public {PARTIAL}class {CLASSNAME}
     {{
         private readonly ILogger<{CLASSNAME}> _logger;
         private readonly {INTERFACENAME} _service;
@@ -24,18 +28,93 @@ namespace {NAMESPACE}
             _service = service;
         }}
 {METHODS}
+        /// <summary>
+        /// parses the request body without reading it into a string. JsonTextReader reads synchronously, so the
+        /// whole body is buffered first (in memory, and in a temporary file for large bodies) and then deserialized
+        /// from the buffer. The buffered body can be read again, e.g. for exception logging
+        /// </summary>
+        public static async Task<T> ParseJson<T>(HttpRequest request)
+        {{
+            request.EnableBuffering();
+            await request.Body.DrainAsync(CancellationToken.None);
+            request.Body.Position = 0;
+            return DeserializeJson<T>(request.Body);
+        }}
+
+        /// <summary>
+        /// parses a json stream. The stream is copied to memory first, as it might not allow synchronous reads
+        /// </summary>
         public static async Task<T> ParseJson<T>(Stream s)
         {{
-            string requestBody = String.Empty;
-            using (StreamReader streamReader =  new  StreamReader(s))
-                requestBody = await streamReader.ReadToEndAsync();
-            if (string.IsNullOrWhiteSpace(requestBody))
-                throw {JSON_ERROR_CLASS}.NoContent();
+            using var buffer = new MemoryStream();
+            await s.CopyToAsync(buffer);
+            buffer.Position = 0;
+            return DeserializeJson<T>(buffer);
+        }}
+
+        private static T DeserializeJson<T>(Stream s)
+        {{
+            using var streamReader = new StreamReader(s, Encoding.UTF8, true, 1024, leaveOpen: true);
+            using var jsonReader = new JsonTextReader(streamReader) {{ ArrayPool = JsonCharArrayPool.Instance, CloseInput = false }};
             try {{
-                return JsonConvert.DeserializeObject<T>(requestBody);
+                if (jsonReader.Read())
+                {{
+                    var serializer = JsonSerializer.CreateDefault();
+                    serializer.CheckAdditionalContent = true;
+                    return serializer.Deserialize<T>(jsonReader);
+                }}
             }} catch (Exception e) {{
                 throw {JSON_ERROR_CLASS}.FromException(e);
             }}
+            throw {JSON_ERROR_CLASS}.NoContent();
+        }}
+
+        /// <summary>
+        /// reads the discriminator of a oneOf body with a forward-only reader, without materializing the body.
+        /// Reading stops at the discriminator, afterwards the buffered body is rewound for ParseJson
+        /// </summary>
+        public static async Task<string> ReadDiscriminator(HttpRequest request, string propertyName)
+        {{
+            request.EnableBuffering();
+            await request.Body.DrainAsync(CancellationToken.None);
+            request.Body.Position = 0;
+            var hasContent = false;
+            try {{
+                using var streamReader = new StreamReader(request.Body, Encoding.UTF8, true, 1024, leaveOpen: true);
+                using var jsonReader = new JsonTextReader(streamReader)
+                {{
+                    ArrayPool = JsonCharArrayPool.Instance, CloseInput = false, DateParseHandling = DateParseHandling.None
+                }};
+                hasContent = jsonReader.Read();
+                if (hasContent && jsonReader.TokenType == JsonToken.StartObject)
+                {{
+                    while (jsonReader.Read() && jsonReader.TokenType == JsonToken.PropertyName)
+                    {{
+                        if ((string)jsonReader.Value == propertyName)
+                        {{
+                            jsonReader.Read();
+                            return jsonReader.Value?.ToString();
+                        }}
+                        jsonReader.Skip();
+                    }}
+                    if (jsonReader.TokenType != JsonToken.EndObject)
+                        throw new JsonReaderException("Unexpected end of content while reading the discriminator");
+                }}
+            }} catch (Exception e) {{
+                throw {JSON_ERROR_CLASS}.FromException(e);
+            }} finally {{
+                request.Body.Position = 0;
+            }}
+            if (!hasContent)
+                throw {JSON_ERROR_CLASS}.NoContent();
+            return null;
+        }}
+
+        private class JsonCharArrayPool : IArrayPool<char>
+        {{
+            public static readonly JsonCharArrayPool Instance = new JsonCharArrayPool();
+            public char[] Rent(int minimumLength) => ArrayPool<char>.Shared.Rent(minimumLength);
+            public void Return(char[] array) => ArrayPool<char>.Shared.Return(array);
         }}
 
         public static T ToObject<T>(JObject jObject)
@@ -47,38 +126,73 @@ namespace {NAMESPACE}
             }}
         }}
 
+        /// <summary>
+        /// settings for the request payload that is logged with unhandled exceptions.
+        /// Set LogPayload to false or PayloadSampleRate to 0 to never read the payload
+        /// </summary>
+        public static bool LogPayload {{ get; set; }} = {PAYLOAD_ENABLED};
+        public static int MaxPayloadBytes {{ get; set; }} = {PAYLOAD_MAX_BYTES};
+        public static double PayloadSampleRate {{ get; set; }} = {PAYLOAD_SAMPLE_RATE};
+        [ThreadStatic] private static Random _payloadSampler;
+
         public void LogException(Exception e, HttpRequest request, string functionName, string route, string operation,
             params (string, object)[] namedParams)
         {{
-            var debugInformation = new Dictionary<string,  string>();
-            debugInformation["Error"] = e.Message;
-            debugInformation["ExecptionType"] = e.GetType().Name;
-            debugInformation["FunctionName"] = functionName;
-            debugInformation["Route"] = route;
-            debugInformation["Operation"] = operation;
-            foreach (var (name,value) in namedParams)
+            var scope = new Dictionary<string, object>
+            {{
+                ["FunctionName"] = functionName,
+                ["Route"] = route,
+                ["Operation"] = operation,
+                ["ExecptionType"] = e.GetType().Name
+            }};
+            foreach (var (name, value) in namedParams)
             {{
-                debugInformation["p_" + name] = value.ToString();
+                scope["p_" + name] = value;
+            }}
+            if (LogPayload && MaxPayloadBytes > 0 && PayloadSampleRate > 0
+                && (PayloadSampleRate >= 1 || (_payloadSampler ??= new Random()).NextDouble() < PayloadSampleRate))
+            {{
+                scope["Payload"] = GetPayloadForExceptionLogging(request, out var truncated);
+                scope["PayloadTruncated"] = truncated;
+            }}
+            using (_logger.BeginScope(scope))
+            {{
+                _logger.LogCritical(e, "{{FunctionName}} failed: {{Error}}", functionName, e.Message);
             }}
-            debugInformation["Payload"] = GetPayloadForExceptionLogging(request);
-            _logger.LogCritical(JsonConvert.SerializeObject(debugInformation));
         }}
 
-        private static string GetPayloadForExceptionLogging(HttpRequest req)
+        /// <summary>
+        /// returns the first MaxPayloadBytes of the payload as base64. If ParseJson buffered the body,
+        /// it is read again from the start, otherwise the rest of the body is read
+        /// </summary>
+        private static string GetPayloadForExceptionLogging(HttpRequest req, out bool truncated)
         {{
+            truncated = false;
+            byte[] buffer = null;
 	        try
 	        {{
-		        if (req.ContentLength == 0)
+		        if (req.ContentLength == 0 || req.Body == null)
                     return "no payload";
-
-                using var ms = new MemoryStream();
-                req.Body.CopyTo(ms);
-                return Convert.ToBase64String(ms.ToArray());
+                if (req.Body.CanSeek)
+                    req.Body.Position = 0;
+                var maxBytes = MaxPayloadBytes;
+                buffer = ArrayPool<byte>.Shared.Rent(maxBytes);
+                var length = 0;
+                int read;
+                while (length < maxBytes && (read = req.Body.Read(buffer, length, maxBytes - length)) > 0)
+                    length += read;
+                truncated = length == maxBytes && (req.ContentLength == null || req.ContentLength > maxBytes);
+                return Convert.ToBase64String(buffer, 0, length);
 	        }}
 	        catch (Exception e)
 	        {{
 		        return "error while reading payload: " + e.Message;
 	        }}
+	        finally
+	        {{
+		        if (buffer != null)
+			        ArrayPool<byte>.Shared.Return(buffer);
+	        }}
         }}
     }}
 }}
\ No newline at end of file
@@ -0,0 +1,45 @@
+using System;
+using System.Collections.Generic;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+{IMPORTS}
+namespace {NAMESPACE} {{
+    /// AUTOGENERED BY caffoa ///
+    /// <summary>
+    /// source generated serialization for all models, request bodies and responses.
+    /// Add a partial class with [JsonSourceGenerationOptions] to change the serialization options
+    /// </summary>
+    [JsonSerializable(typeof(JsonObject))]
+    [JsonSerializable(typeof(JsonNode))]
+    [JsonSerializable(typeof(Dictionary<string, string>))]
+    [JsonSerializable(typeof(string))]
+    [JsonSerializable(typeof(int))]
+    [JsonSerializable(typeof(long))]
+    [JsonSerializable(typeof(double))]
+    [JsonSerializable(typeof(bool))]
+    [JsonSerializable(typeof(Guid))]
+    [JsonSerializable(typeof(DateTime))]
+    [JsonSerializable(typeof(IEnumerable<string>))]
+    [JsonSerializable(typeof(IEnumerable<int>))]
+    [JsonSerializable(typeof(IEnumerable<long>))]
+    [JsonSerializable(typeof(IEnumerable<double>))]
+    [JsonSerializable(typeof(IEnumerable<bool>))]
+    [JsonSerializable(typeof(IEnumerable<Guid>))]
+    [JsonSerializable(typeof(IEnumerable<DateTime>))]
+    {TYPES}
+    public partial class {NAME} : JsonSerializerContext {{
+        /// <summary>
+        /// Merges other into target. Objects are merged recursively, arrays and null values replace existing values
+        /// </summary>
+        public static void Merge(JsonNode target, JsonNode other) {{
+            if (target is not JsonObject targetObject || other is not JsonObject otherObject)
+                return;
+            foreach (var property in otherObject) {{
+                if (property.Value is JsonObject otherChild && targetObject[property.Key] is JsonObject targetChild)
+                    Merge(targetChild, otherChild);
+                else
+                    targetObject[property.Key] = property.Value?.DeepClone();
+            }}
+        }}
+    }}
+}}
@@ -0,0 +1,8 @@
+using System.Text.Json.Serialization;
+
+namespace {NAMESPACE} {{
+    {DESCRIPTION}{DERIVED_TYPES}
+    public interface {NAME} {{
+        string {TYPE} {{ get; }}
+    }}
+}}
@@ -0,0 +1,2 @@
+        {DESCRIPTION}{JSON_EXTRA}[JsonPropertyName("{NAMELOWER}"){JSON_PROPERTY_EXTRA}]
+        public virtual {TYPE} {NAMEUPPER} {{ get; set; }}{DEFAULT}
\ No newline at end of file
@@ -0,0 +1,64 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+{IMPORTS}
+namespace {NAMESPACE} {{
+    {DESCRIPTION}public partial class {NAME}{PARENTS} {{
+        public const string {NAME}ObjectName = "{RAWNAME}";
+{PROPERTIES}
+
+        public {NAME} To{NAME}() {{
+            var item = new {NAME}();
+            item.UpdateWith{NAME}(this);
+            return item;
+        }}
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWith{NAME}({NAME} other) {{
+            {UPDATEPROPS}
+        }}
+
+        /// <summary>
+        /// Merges all fields of {NAME} that are present in the passed object with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWith{NAME}({NAME} other) {{
+            {MERGEPROPS}
+        }}
+
+        /// <summary>
+        /// Merges all fields of {NAME} that are present in the passed JsonNode with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWith{NAME}(JsonNode other) {{
+            if (other is JsonObject otherObject)
+            {{
+                foreach (var property in otherObject)
+                    MergeProperty{NAME}(property);
+            }}
+        }}
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties
+        /// </summary>
+        protected bool MergeProperty{NAME}(KeyValuePair<string, JsonNode> property) {{
+            switch (property.Key) {{
+                {MERGECASES}
+            }}
+            return {MERGEPARENT};
+        }}
+
+        void IJsonOnDeserialized.OnDeserialized() {{
+            CheckRequired{NAME}();
+        }}
+
+        /// <summary>
+        /// Throws a JsonException if a required field is null
+        /// </summary>
+        public void CheckRequired{NAME}() {{
+            {REQUIRED_CHECKS}
+        }}
+    }}
+}}
@@ -25,7 +25,12 @@ namespace {NAMESPACE} {{
         /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
         /// </summary>
         public void MergeWith{NAME}({NAME} other, JsonMergeSettings mergeSettings = null) {{
-            MergeWith{NAME}(JObject.FromObject(other), mergeSettings);
+            mergeSettings ??= new JsonMergeSettings()
+            {{
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            }};
+            {MERGEPROPS}
         }}
 
         /// <summary>
@@ -38,9 +43,48 @@ namespace {NAMESPACE} {{
                 MergeArrayHandling = MergeArrayHandling.Replace,
                 MergeNullValueHandling = MergeNullValueHandling.Merge
             }};
-            var sourceObject = JObject.FromObject(this);
-            sourceObject.Merge(other, mergeSettings);
-            UpdateWith{NAME}(sourceObject.ToObject<{NAME}>());
+            if (other is JObject otherObject)
+            {{
+                foreach (var property in otherObject.Properties())
+                    MergeProperty{NAME}(property, mergeSettings);
+            }}
+        }}
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties.
+        /// Like in deserialization, a field whose name only differs in case is used if no name matches exactly
+        /// </summary>
+        protected bool MergeProperty{NAME}(JProperty property, JsonMergeSettings mergeSettings) {{
+            if (property.Value.Type == JTokenType.Null && mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Ignore)
+                return true;
+            if (MergeProperty{NAME}(property.Name, property, mergeSettings))
+                return true;
+            var name = FindPropertyName{NAME}(property.Name);
+            return name != null && MergeProperty{NAME}(name, property, mergeSettings);
         }}
+
+        /// <summary>
+        /// Merges a JSON property into the field with exactly the given JSON name. Returns false for unknown names
+        /// </summary>
+        protected bool MergeProperty{NAME}(string name, JProperty property, JsonMergeSettings mergeSettings) {{
+            switch (name) {{
+                {MERGECASES}
+            }}
+            return {MERGEPARENT};
+        }}
+
+        /// <summary>
+        /// Returns the JSON name of the field that matches the passed name case-insensitively, or null
+        /// </summary>
+        protected static string FindPropertyName{NAME}(string name) {{
+            foreach (var propertyName in {NAME}PropertyNames)
+            {{
+                if (string.Equals(propertyName, name, System.StringComparison.OrdinalIgnoreCase))
+                    return propertyName;
+            }}
+            return {FINDPARENT};
+        }}
+
+        private static readonly string[] {NAME}PropertyNames = {{ {PROPERTYNAMES} }};
     }}
 }}
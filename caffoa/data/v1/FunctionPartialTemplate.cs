@@ -0,0 +1,19 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading.Tasks;
+using System.Net.Http;
+using Microsoft.Azure.WebJobs;
+using Microsoft.Azure.WebJobs.Extensions.Http;
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+
+{IMPORTS}
+namespace {NAMESPACE}
+{{
+    /// AUTO GENERATED CLASS
+    public static partial class {CLASSNAME}
+    {{
+{METHODS}
+    }}
+}}
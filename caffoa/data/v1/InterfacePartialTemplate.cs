@@ -0,0 +1,13 @@
+using System.IO;
+using System.Net.Http;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+
+namespace {NAMESPACE}
+{{
+    /// AUTOGENERATED BY caffoa
+    public partial interface {CLASSNAME}
+    {{
+{METHODS}
+    }}
+}}
@@ -0,0 +1,20 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.Azure.WebJobs;
+using Microsoft.Azure.WebJobs.Extensions.Http;
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+
+{IMPORTS}
+namespace {NAMESPACE}
+{{
+    /// AUTO GENERATED CLASS
+    public partial class {CLASSNAME}
+    {{
+{METHODS}
+    }}
+}}
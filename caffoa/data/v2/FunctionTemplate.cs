@@ -13,7 +13,7 @@ using Newtonsoft.Json;
 namespace {NAMESPACE}
 {{
     /// AUTO GENERATED CLASS
-    public class {CLASSNAME}
+    public {PARTIAL}class {CLASSNAME}
     {{
         private readonly ILogger<{CLASSNAME}> _logger;
         private readonly {INTERFACENAME} _service;
@@ -0,0 +1,13 @@
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using System.IO;
+{IMPORTS}
+namespace {NAMESPACE}
+{{
+    /// AUTOGENERATED BY caffoa
+    public partial interface {CLASSNAME}
+    {{
+{METHODS}
+    }}
+}}
@@ -9,7 +9,7 @@ namespace {NAMESPACE}
     /// <summary>
     /// Interface for services to be implemented to serve the Function implementation
     /// </summary>
-    public interface {CLASSNAME}
+    public {PARTIAL}interface {CLASSNAME}
     {{
 {METHODS}
     }}
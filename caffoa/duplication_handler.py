@@ -1,35 +1,91 @@
+import json
 import logging
+import os
+import tempfile
+from typing import Dict, Optional
+
+REGISTRY_FORMAT = 1
 
 
 class DuplicationHandler:
+    """
+    registry of all generated class names, with the service and namespace that generated them.
+    Reports names that are defined with a different shape by different services.
+    If a file name is given, the registry of the last run is loaded from it and saved again after the run.
+    """
     instance = None
 
-    def __init__(self, mode: str):
+    def __init__(self, mode: str, file_name: Optional[str] = None):
         self.mode = mode.strip().lower()
-        self.names = list()
+        self.file_name = file_name
+        self.names: Dict[str, dict] = dict()
+        self.previous: Dict[str, dict] = dict()
+        self.service = ""
+        if file_name is not None and os.path.exists(file_name):
+            try:
+                with open(file_name, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == REGISTRY_FORMAT:
+                    self.previous = data.get("names", dict())
+            except (ValueError, OSError) as e:
+                logging.warning(f"Ignoring unreadable duplicates file {file_name}: {e}")
+
+    def set_service(self, service: str):
+        self.service = service
 
-    def should_generate(self, name: str):
+    def should_generate(self, name: str, namespace: str = "", shape: Optional[str] = None):
+        entry = self.names.get(name)
+        if entry is None:
+            return True
+        if shape is not None and entry["shape"] is not None and entry["shape"] != shape \
+                and (entry["service"], entry["namespace"]) != (self.service, namespace):
+            logging.warning(f"{name} in {self.service} ({namespace}) differs from {name} "
+                            f"in {entry['service']} ({entry['namespace']})")
         if self.mode == "once":
-            if name in self.names:
-                logging.warning(f"Skipping {name}, already written earlier")
-                return False
+            logging.warning(f"Skipping {name}, already written earlier")
+            return False
         return True
 
-    def store_generated(self, name: str):
-        self.names.append(name)
+    def store_generated(self, name: str, namespace: str = "", shape: Optional[str] = None):
+        previous = self.previous.get(name)
+        if name not in self.names and previous is not None and previous["service"] != self.service:
+            logging.info(f"{name} is now generated by {self.service} instead of {previous['service']}")
+        self.names[name] = dict(service=self.service, namespace=namespace, shape=shape)
+
+    def save(self):
+        if self.file_name is None:
+            return
+        folder = os.path.dirname(os.path.abspath(self.file_name))
+        fd, temp_name = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(dict(version=REGISTRY_FORMAT, names=self.names), f, indent=1, sort_keys=True)
+            os.replace(temp_name, self.file_name)
+        except Exception:
+            os.unlink(temp_name)
+            raise
 
 
 def get() -> DuplicationHandler:
     return DuplicationHandler.instance
 
 
-def init(mode: str):
-    DuplicationHandler.instance = DuplicationHandler(mode)
+def init(mode: str, file_name: Optional[str] = None):
+    DuplicationHandler.instance = DuplicationHandler(mode, file_name)
+
+
+def set_service(service: str):
+    get().set_service(service)
+
+
+def should_generate(name: str, namespace: str = "", shape: Optional[str] = None) -> bool:
+    return get().should_generate(name, namespace, shape)
 
 
-def should_generate(name) -> bool:
-    return get().should_generate(name)
+def store_generated(name: str, namespace: str = "", shape: Optional[str] = None):
+    return get().store_generated(name, namespace, shape)
 
 
-def store_generated(name):
-    return get().store_generated(name)
+def save():
+    if get() is not None:
+        get().save()
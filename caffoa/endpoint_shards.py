@@ -0,0 +1,36 @@
+import re
+from typing import Dict, List, Union
+
+from caffoa.converter import capitalize_first
+from caffoa.model import EndPoint
+
+DEFAULT_SHARD = "Default"
+
+
+def check_split(split: Union[str, int, None]):
+    if split is None or split == "tags":
+        return
+    if isinstance(split, bool) or not isinstance(split, int) or split < 1:
+        raise Warning(f"split must be 'tags' or a positive number of operations per file, not '{split}'")
+
+
+def shard_name(tag: str) -> str:
+    name = "".join(capitalize_first(part) for part in re.split(r"[^0-9A-Za-z]+", tag) if part)
+    return name if name else DEFAULT_SHARD
+
+
+def split_endpoints(endpoints: List[EndPoint], split: Union[str, int]) -> Dict[str, List[EndPoint]]:
+    """
+    groups the endpoints into shards that are written to separate partial files.
+    With 'tags', an operation goes to the shard of its first tag, otherwise the endpoints are split in chunks
+    of the given size, in the order of the spec.
+    """
+    shards = dict()
+    if split == "tags":
+        for ep in endpoints:
+            name = shard_name(ep.tags[0]) if ep.tags else DEFAULT_SHARD
+            shards.setdefault(name, list()).append(ep)
+        return shards
+    for start in range(0, len(endpoints), split):
+        shards[f"Part{start // split + 1}"] = endpoints[start:start + split]
+    return shards
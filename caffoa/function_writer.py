@@ -1,17 +1,21 @@
 import logging
 import os
-from typing import List
+from typing import Iterator, List
 
-from caffoa import duplication_handler
-from caffoa.base_writer import BaseWriter
+from caffoa import duplication_handler, profiler
+from caffoa.base_writer import BaseWriter, NEWTONSOFT, SYSTEM_TEXT_JSON
 from caffoa.body_type_filter import BodyTypeFilter
-from caffoa.converter import get_response_type, is_primitive
-from caffoa.model import EndPoint, Response, MethodResult
+from caffoa.converter import get_response_type, is_primitive, type_info_name
+from caffoa.endpoint_shards import split_endpoints
+from caffoa.manifest import fingerprint
+from caffoa.model import EndPoint, MethodResult
+from caffoa.templates import Template
 
 
 class FunctionWriter(BaseWriter):
-    def __init__(self, version: int, name: str, namespace: str, target_folder: str, interface_name: str):
-        super().__init__(version)
+    def __init__(self, version: int, name: str, namespace: str, target_folder: str, interface_name: str,
+                 serializer: str = NEWTONSOFT):
+        super().__init__(version, serializer)
         self.interface_name = interface_name
         self.version = version
         self.target_folder = target_folder
@@ -22,16 +26,25 @@ class FunctionWriter(BaseWriter):
         self.functions_name = f"{name}Functions"
         self.error_folder = os.path.join(target_folder, "Errors")
         self.error_namespace = namespace + ".Errors"
-        self.request_body_filter = list()
+        self.request_body_filter = BodyTypeFilter(list())
         self.imports = list()
         self.route_prefix = ''
+        self.json_context = None
+        self.payload_logging = {"enabled": True, "maxBytes": 8192, "sampleRate": 1.0}
         self.method_template = self.load_template("FunctionMethod.cs")
-        self.class_template = self.load_template("FunctionTemplate.cs")
+        self.class_template = self.load_template("FunctionTemplate.cs", per_serializer=True)
         self.caffoa_error_template = self.load_template("CaffoaClientError.cs")
         self.client_error_template = self.load_template("ClientErrorTemplate.cs")
         self.generic_client_error_template = self.load_template("GenericClientErrorTemplate.cs")
+        self.switch_template = self.load_template("FunctionSwitchTemplate.cs")
+        self.partial_template = self.load_template("FunctionPartialTemplate.cs", per_serializer=True)
+        self.split = None
 
     def write(self, endpoints: List[EndPoint]):
+        with profiler.phase("rendering"):
+            self.write_files(endpoints)
+
+    def write_files(self, endpoints: List[EndPoint]):
         os.makedirs(self.target_folder, exist_ok=True)
         imports = []
         imports.extend(self.imports)
@@ -43,21 +56,53 @@ class FunctionWriter(BaseWriter):
                 imports.append(json_error_namespace)
 
         json_error_class = self.json_error_handling["class"]
-        function_endpoints = []
-        for ep in endpoints:
-            function_endpoints.append(self.format_endpoint(ep))
-#            imports.extend(BodyTypeFilter(self.request_body_filter).additional_imports(ep))
+#            imports.extend(self.request_body_filter.additional_imports(ep))
         interface_name = self.interface_name + "Factory" if self.version > 1 and self.use_factory else self.interface_name
         imports = [f"using {x};\n" for x in imports]
+        class_params = dict(NAMESPACE=self.namespace,
+                            CLASSNAME=self.functions_name,
+                            INTERFACENAME=interface_name,
+                            IMPORTS="".join(imports),
+                            JSON_ERROR_CLASS=json_error_class,
+                            JSON_CONTEXT=self.json_context,
+                            PAYLOAD_ENABLED="true" if self.payload_logging["enabled"] else "false",
+                            PAYLOAD_MAX_BYTES=int(self.payload_logging["maxBytes"]),
+                            PAYLOAD_SAMPLE_RATE=repr(float(self.payload_logging["sampleRate"])),
+                            PARTIAL="" if self.split is None else "partial ")
         file_name = os.path.abspath(f"{self.target_folder}/{self.functions_name}.generated.cs")
+        if self.split is None:
+            self.write_class(file_name, endpoints, self.class_template, class_params)
+        else:
+            # the main file keeps the constructor and helpers, the methods go to one partial file per shard:
+            self.write_class(file_name, [], self.class_template, class_params)
+            for shard, shard_endpoints in split_endpoints(endpoints, self.split).items():
+                shard_file = os.path.abspath(f"{self.target_folder}/{self.functions_name}.{shard}.generated.cs")
+                self.write_class(shard_file, shard_endpoints, self.partial_template, class_params)
+        self.remove_stale_shards(self.target_folder, self.functions_name)
+
+    def write_class(self, file_name: str, endpoints: List[EndPoint], template: Template, class_params: dict):
+        sources = {f"operation:{ep.operation}": fingerprint(ep) for ep in endpoints}
+        inputs = self.inputs_hash(sources)
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged Functions {file_name}")
+            return
         logging.info(f"Writing Functions to {file_name}")
-        with open(file_name, "w", encoding="utf-8") as f:
-            f.write(self.class_template.format(METHODS="\n\n".join(function_endpoints),
-                                               NAMESPACE=self.namespace,
-                                               CLASSNAME=self.functions_name,
-                                               INTERFACENAME=interface_name,
-                                               IMPORTS="".join(imports),
-                                               JSON_ERROR_CLASS=json_error_class))
+        self.write_file_stream(file_name, self.stream_class(endpoints, template, class_params), inputs, sources)
+
+    def stream_class(self, endpoints: List[EndPoint], template: Template, class_params: dict) -> Iterator[str]:
+        """
+        renders the functions class method by method, so that only one method is held in memory at a time
+        """
+        header, footer = template.sections("METHODS")
+        yield header.format_map(class_params)
+        for index, ep in enumerate(endpoints):
+            if index > 0:
+                yield "\n\n"
+            # the methods are rendered while the file is written, keep the profile phases apart:
+            with profiler.phase("rendering"):
+                method = self.format_endpoint(ep)
+            yield method
+        yield footer.format_map(class_params)
 
     def format_endpoint(self, endpoint: EndPoint) -> str:
         if self.version == 1:
@@ -107,7 +152,7 @@ class FunctionWriter(BaseWriter):
         params = self.default_params(endpoint)
         type = get_response_type(endpoint)
         params['VALUE'] = f"var result = "
-        filtered_body = BodyTypeFilter(self.request_body_filter).body_type(endpoint)
+        filtered_body = self.request_body_filter.body_type(endpoint)
 
         if type is None:
             params['RESULT'] = "result"
@@ -116,12 +161,18 @@ class FunctionWriter(BaseWriter):
             params['VALUE'] = ""
         elif type.name is None:
             params['RESULT'] = f"new StatusCodeResult(result)"
+        elif type.is_simple and self.serializer == SYSTEM_TEXT_JSON:
+            result = self.get_result_handler(type)
+            params['RESULT'] = f"JsonResponse({result}, {self.type_info(type.base)}, {type.code})"
         elif type.is_simple:
             result = self.get_result_handler(type)
             params['RESULT'] = f"new JsonResult({result}) {{StatusCode = {type.code}, SerializerSettings = _service.ResponseSerializerSettings }}"
         elif type.base is None:
             params['RESULT'] = "new StatusCodeResult(code)"
             params['VALUE'] = "var code = "
+        elif self.serializer == SYSTEM_TEXT_JSON:
+            params['RESULT'] = f"JsonResponse(result, {self.type_info(type.base)}, code)"
+            params['VALUE'] = f"var (result, code) = "
         else:
             params['RESULT'] = f"new JsonResult(result) {{StatusCode = code, SerializerSettings = _service.ResponseSerializerSettings  }}"
             params['VALUE'] = f"var (result, code) = "
@@ -134,9 +185,9 @@ class FunctionWriter(BaseWriter):
         if endpoint.needs_content and endpoint.body is not None and endpoint.body.is_selection():
             params = self.v3_params_selection(endpoint, params)
         elif endpoint.needs_content and filtered_body is not None:
-            params['PARAMS'].append(f"await ParseJson<{filtered_body}>(request.Body)")
+            params['PARAMS'].append(self.parse_json_call(filtered_body))
         elif endpoint.needs_content and endpoint.body is not None:
-            params['PARAMS'].append(f"await ParseJson<{endpoint.body.types[0]}>(request.Body)")
+            params['PARAMS'].append(self.parse_json_call(endpoint.body.types[0]))
         elif endpoint.needs_content and self.use_factory:
             params['PARAMS'].append("request.Body")
         if not self.use_factory:
@@ -152,24 +203,34 @@ class FunctionWriter(BaseWriter):
         allowed_values = list()
         for value,typename in endpoint.body.mapping.items():
             option_params = params.copy()
-            option_params.append(f"ToObject<{typename}>(jObject)")
+            option_params.append(self.parse_json_call(typename))
             if not self.use_factory:
                 option_params.append(f"request")
             call_params["PARAMS"] = ", ".join(option_params)
             call = "await _service.{FACTORY_CALL}{NAME}({PARAMS})".format_map(call_params)
             cases.append(f'"{value}" => {call}')
             allowed_values.append(f'"{value}"')
-        template = self.load_template("FunctionSwitchTemplate.cs")
         template_params["CASES"] = ",\n\t\t\t\t\t".join(cases)
         template_params["CASES_ALLOWED_VALUES"] = ", ".join(allowed_values)
         template_params["DISC"] = endpoint.body.discriminator
         template_params["JSON_ERROR_CLASS"] = self.json_error_handling.get("class")
-        template_params["CALL"] = template.format_map(template_params)
+        template_params["CALL"] = self.switch_template.format_map(template_params)
         return template_params
 
 
 
 
+    def type_info(self, type: str) -> str:
+        """
+        the source generated JsonTypeInfo of a type in the JsonSerializerContext of the model
+        """
+        return f"{self.json_context}.Default.{type_info_name(type)}"
+
+    def parse_json_call(self, type: str) -> str:
+        if self.serializer == SYSTEM_TEXT_JSON:
+            return f"await ParseJson(request, {self.type_info(type)})"
+        return f"await ParseJson<{type}>(request)"
+
     def default_params(self, endpoint: EndPoint) -> dict:
         extra_error_info = [f'debugInformation["p_{param.name}"] = {param.name}.ToString();\n\t\t\t\t' for param in
                             endpoint.parameters]
@@ -189,9 +250,12 @@ class FunctionWriter(BaseWriter):
 
     def write_errors(self, endpoints: List[EndPoint]):
         file_name = os.path.abspath(f"{self.error_folder}/CaffoaClientError.generated.cs")
+        inputs = self.inputs_hash()
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged Client Error {file_name}")
+            return
         logging.info(f"Writing Client Error to {file_name}")
-        with open(file_name, "w", encoding="utf-8") as f:
-            f.write(self.caffoa_error_template.format(NAMESPACE=self.error_namespace))
+        self.write_file(file_name, self.caffoa_error_template.format(NAMESPACE=self.error_namespace), inputs)
         return
         error_classes = dict()
         generic_error_classes = dict()
@@ -0,0 +1,136 @@
+import logging
+import os
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional
+
+from caffoa import duplication_handler, loaders, manifest, output, templates, profiler
+from caffoa.openapi_file import OpenApiFile
+from caffoa.spec_cache import SpecCache
+
+
+class _LogCollector(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = list()
+
+    def emit(self, record: logging.LogRecord):
+        # make the record picklable, so it can be passed back to the main process
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+def _service_name(number: int, handler: OpenApiFile) -> str:
+    return f"#{number} {handler.name}"
+
+
+def _prepare_service(handler: OpenApiFile, service: dict, log_level: int,
+                     profile: Optional[str]) -> Tuple[OpenApiFile, List[logging.LogRecord], Optional[dict]]:
+    """
+    worker function for parallel generation: resolves and parses a service, and returns the logs and profile
+    so that the main process can emit them in service order.
+    """
+    profiler.init(profile is not None)
+    profiler.set_service(profile)
+    collector = _LogCollector()
+    root = logging.getLogger()
+    old_handlers, old_level = root.handlers, root.level
+    root.handlers = [collector]
+    root.setLevel(log_level)
+    try:
+        handler.prepare(service)
+    finally:
+        root.handlers = old_handlers
+        root.setLevel(old_level)
+    return handler, collector.records, profiler.results()
+
+
+def _write_service(handler: OpenApiFile, config: dict):
+    if "model" in config:
+        handler.create_model(config["model"])
+
+    if "function" in config:
+        handler.create_function(config["function"])
+
+
+def load_config(file_name: str) -> Tuple[list, dict]:
+    with open(file_name, "r", encoding="utf-8") as f:
+        data = loaders.load_config(f)
+    if not "services" in data:
+        raise Warning("no services in config file.")
+    services = data["services"]
+    if type(services) != list:
+        raise Warning("services should be list")
+    try:
+        settings = data["config"]
+        if type(settings) != dict:
+            raise Warning("config should be key/values pairs")
+    except KeyError:
+        settings = dict()
+    return services, settings
+
+
+def create_cache(settings: dict, args: Namespace) -> Optional[SpecCache]:
+    if settings.get("useCache", True) and not args.no_cache:
+        return SpecCache(settings.get("cacheFolder", ".caffoa-cache"), settings.get("cacheMaxSize", 100))
+    return None
+
+
+def create_handler(number: int, config: dict, settings: dict, cache: Optional[SpecCache]) -> OpenApiFile:
+    if not "apiPath" in config:
+        raise Warning(f"apiPath is required for service #{number}")
+    api_config = settings.copy()
+    api_config.update(config.get("config", dict()))
+    return OpenApiFile(config["apiPath"], settings.get("version", 1), api_config, cache)
+
+
+def generate(handlers: List[OpenApiFile], services: list, settings: dict, args: Namespace):
+    """
+    writes all services in order. Handlers that were already parsed (e.g. in watch mode) are not parsed again.
+    The list of handlers is updated with the parsed handlers.
+    """
+    duplicates_file = settings.get("duplicatesFile")
+    duplication_handler.init(settings.get("duplicates", "overwrite"),
+                             os.path.abspath(duplicates_file) if duplicates_file else None)
+    output.init()
+    if "templateFolder" in settings:
+        templates.add_override_folder(settings["templateFolder"])
+    manifest.init(os.path.abspath(settings.get("manifestFile", ".caffoa-manifest.json")),
+                  settings.get("incremental", True) and not args.full, os.path.abspath(args.config))
+
+    pending = [number for number, handler in enumerate(handlers) if not handler.prepared]
+    if args.jobs > 1 and len(pending) > 1:
+        # the expensive resolving and parsing is done in worker processes. Files are written in the main process
+        # in the order of the services, so that the duplication handler behaves exactly as in a serial run.
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            log_level = logging.getLogger().getEffectiveLevel()
+            futures = {number: executor.submit(_prepare_service, handlers[number], services[number], log_level,
+                                               _service_name(number, handlers[number])
+                                               if profiler.get().enabled else None)
+                       for number in pending}
+            for number, config in enumerate(services):
+                if number in futures:
+                    handlers[number], records, profile_results = futures[number].result()
+                    for record in records:
+                        logging.getLogger(record.name).handle(record)
+                    if profile_results:
+                        profiler.get().merge(profile_results)
+                profiler.set_service(_service_name(number, handlers[number]))
+                duplication_handler.set_service(handlers[number].name)
+                _write_service(handlers[number], config)
+    else:
+        for number, (handler, config) in enumerate(zip(handlers, services)):
+            profiler.set_service(_service_name(number, handler))
+            duplication_handler.set_service(handler.name)
+            handler.prepare(config)
+            _write_service(handler, config)
+    profiler.set_service("")
+    if settings.get('clearGeneratedFiles', False) or args.clean:
+        manifest.remove_stale()
+    manifest.save()
+    duplication_handler.save()
+    output.report()
@@ -1,53 +1,102 @@
 import logging
 import os
-from typing import List
+from typing import Iterator, List
 
-from caffoa.base_writer import BaseWriter
+from caffoa import profiler
+from caffoa.base_writer import BaseWriter, NEWTONSOFT
 from caffoa.body_type_filter import BodyTypeFilter
 from caffoa.converter import get_response_type
+from caffoa.endpoint_shards import split_endpoints
+from caffoa.manifest import fingerprint
 from caffoa.model import EndPoint
+from caffoa.templates import Template
 
 
 class InterfaceWriter(BaseWriter):
-    def __init__(self, version: int, name: str, namespace: str, target_folder: str):
-        super().__init__(version)
+    def __init__(self, version: int, name: str, namespace: str, target_folder: str, serializer: str = NEWTONSOFT):
+        super().__init__(version, serializer)
         self.version = version
         self.target_folder = target_folder
         self.use_factory = True if version >= 3 else False
         self.namespace = namespace
         self.imports = list()
-        self.request_body_filter = list()
+        self.request_body_filter = BodyTypeFilter(list())
         self.interface_name = f"I{name}Service"
         self.interface_method_template = self.load_template("InterfaceMethod.cs")
         self.interface_template = self.load_template("InterfaceTemplate.cs")
-        self.factory_interface_template = self.load_template("FactoryInterfaceTemplate.cs")
+        self.factory_interface_template = self.load_template("FactoryInterfaceTemplate.cs", per_serializer=True)
+        self.partial_template = self.load_template("InterfacePartialTemplate.cs")
+        self.split = None
 
     def write(self, endpoints: List[EndPoint]):
+        with profiler.phase("rendering"):
+            self.write_files(endpoints)
+
+    def write_files(self, endpoints: List[EndPoint]):
         os.makedirs(self.target_folder, exist_ok=True)
+        self.write_interface(endpoints)
+        if self.version > 1 and self.use_factory:
+            self.write_factory_interface()
+
+    def write_interface(self, endpoints: List[EndPoint]):
+        file_name = os.path.abspath(f"{self.target_folder}/{self.interface_name}.generated.cs")
+        if self.split is None:
+            self.write_interface_file(file_name, endpoints, self.interface_template, "")
+        else:
+            # the main file only declares the interface, the methods go to one partial file per shard:
+            self.write_interface_file(file_name, [], self.interface_template, "partial ")
+            for shard, shard_endpoints in split_endpoints(endpoints, self.split).items():
+                shard_file = os.path.abspath(f"{self.target_folder}/{self.interface_name}.{shard}.generated.cs")
+                self.write_interface_file(shard_file, shard_endpoints, self.partial_template, "partial ")
+        self.remove_stale_shards(self.target_folder, self.interface_name)
+
+    def write_interface_file(self, file_name: str, endpoints: List[EndPoint], template: Template, partial: str):
+        sources = {f"operation:{ep.operation}": fingerprint(ep) for ep in endpoints}
+        inputs = self.inputs_hash(sources)
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged Interface {file_name}")
+            return
 
-        interfaces = []
         imports = ["System.Collections.Generic"]
         for ep in endpoints:
-            interfaces.extend(self.format_endpoints(ep))
-            imports.extend(BodyTypeFilter(self.request_body_filter).additional_imports(ep))
+            imports.extend(self.request_body_filter.additional_imports(ep))
         imports.extend(self.imports)
         # remove duplicates but keep order:
         imports = list(dict.fromkeys(imports))
         imports_str = "".join([f"using {imp};\n" for imp in imports])
+        class_params = dict(NAMESPACE=self.namespace, IMPORTS=imports_str, CLASSNAME=self.interface_name,
+                            PARTIAL=partial)
 
-        file_name = os.path.abspath(f"{self.target_folder}/{self.interface_name}.generated.cs")
         logging.info(f"Writing Interface to {file_name}")
-        with open(file_name, "w", encoding="utf-8") as f:
-            f.write(self.interface_template.format(METHODS="\n\n".join(interfaces),
-                                                   NAMESPACE=self.namespace,
-                                                   IMPORTS=imports_str,
-                                                   CLASSNAME=self.interface_name))
-        if self.version > 1 and self.use_factory:
-            file_name = os.path.abspath(f"{self.target_folder}/{self.interface_name}Factory.generated.cs")
-            logging.info(f"Writing Factory Interface to {file_name}")
-            with open(file_name, "w", encoding="utf-8") as f:
-                f.write(self.factory_interface_template.format(NAMESPACE=self.namespace,
-                                                               CLASSNAME=self.interface_name))
+        self.write_file_stream(file_name, self.stream_interface(endpoints, template, class_params), inputs, sources)
+
+    def stream_interface(self, endpoints: List[EndPoint], template: Template, class_params: dict) -> Iterator[str]:
+        """
+        renders the interface method by method, so that only one endpoint is held in memory at a time
+        """
+        header, footer = template.sections("METHODS")
+        yield header.format_map(class_params)
+        first = True
+        for ep in endpoints:
+            # the methods are rendered while the file is written, keep the profile phases apart:
+            with profiler.phase("rendering"):
+                methods = self.format_endpoints(ep)
+            for method in methods:
+                if not first:
+                    yield "\n\n"
+                first = False
+                yield method
+        yield footer.format_map(class_params)
+
+    def write_factory_interface(self):
+        file_name = os.path.abspath(f"{self.target_folder}/{self.interface_name}Factory.generated.cs")
+        inputs = self.inputs_hash()
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged Factory Interface {file_name}")
+            return
+        logging.info(f"Writing Factory Interface to {file_name}")
+        self.write_file(file_name, self.factory_interface_template.format(NAMESPACE=self.namespace,
+                                                                          CLASSNAME=self.interface_name), inputs)
 
     def format_endpoints(self, endpoint: EndPoint) -> List[str]:
         base_params = [f"{param.type} {param.name}" for param in endpoint.parameters]
@@ -65,7 +114,7 @@ class InterfaceWriter(BaseWriter):
         else:
             result = f"<{type.name}>"
         params = base_params.copy()
-        filtered_body = BodyTypeFilter(self.request_body_filter).body_type(endpoint)
+        filtered_body = self.request_body_filter.body_type(endpoint)
         if endpoint.needs_content and filtered_body:
             params.append(f"{filtered_body} payload")
             if not self.use_factory:
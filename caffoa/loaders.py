@@ -0,0 +1,202 @@
+import json
+import logging
+import os
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+from yaml.constructor import ConstructorError
+
+try:
+    import orjson
+except ImportError:  # optional, the json module is used instead
+    orjson = None
+
+# libyaml is optional for PyYAML. Without it, the pure python loader is used
+BaseLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+YAML_BACKEND = "libyaml" if BaseLoader is not yaml.SafeLoader else "pyyaml"
+
+
+class ConfigLoader(BaseLoader):
+    """
+    the same as yaml.safe_load, with libyaml if available
+    """
+
+
+class SpecLoader(BaseLoader):
+    """
+    loads openapi specs with the YAML 1.2 core schema, like the ruamel loader used by prance
+    (e.g. 'yes' and 'on' are strings, '010' is 10). Duplicate keys are errors.
+    """
+
+    def construct_mapping(self, node, deep=False):
+        if isinstance(node, yaml.MappingNode) and not any(key.tag == "tag:yaml.org,2002:merge"
+                                                          for key, _ in node.value):
+            keys = set()
+            for key_node, _ in node.value:
+                if not isinstance(key_node, yaml.ScalarNode):
+                    continue
+                key = (key_node.tag, key_node.value)
+                if key in keys:
+                    raise ConstructorError("while constructing a mapping", node.start_mark,
+                                           f"found duplicate key {key_node.value!r}", key_node.start_mark)
+                keys.add(key)
+        return super().construct_mapping(node, deep=deep)
+
+    def construct_yaml_int(self, node):
+        value = self.construct_scalar(node).replace("_", "")
+        sign = -1 if value[0] == "-" else 1
+        value = value.lstrip("+-")
+        for prefix, base in (("0b", 2), ("0o", 8), ("0x", 16)):
+            if value.startswith(prefix):
+                return sign * int(value[2:], base)
+        return sign * int(value)
+
+
+SpecLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers
+            if tag not in ("tag:yaml.org,2002:bool", "tag:yaml.org,2002:int", "tag:yaml.org,2002:float")]
+    for first, resolvers in BaseLoader.yaml_implicit_resolvers.items()}
+SpecLoader.add_implicit_resolver("tag:yaml.org,2002:bool", re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+                                 list("tTfF"))
+SpecLoader.add_implicit_resolver("tag:yaml.org,2002:int", re.compile(r"""^(?:[-+]?0b[0-1_]+
+    |[-+]?0o?[0-7_]+
+    |[-+]?[0-9_]+
+    |[-+]?0x[0-9a-fA-F_]+)$""", re.X), list("-+0123456789"))
+SpecLoader.add_implicit_resolver("tag:yaml.org,2002:float", re.compile(r"""^(?:
+    [-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+    |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN))$""", re.X), list("-+0123456789."))
+SpecLoader.add_constructor("tag:yaml.org,2002:int", SpecLoader.construct_yaml_int)
+
+
+def load_config(stream) -> Any:
+    return yaml.load(stream, Loader=ConfigLoader)
+
+
+def load_yaml(text: str) -> Any:
+    return yaml.load(text, Loader=SpecLoader)
+
+
+def load_json(text: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or integers with more than 64 bits, that the json module accepts
+    return json.loads(text)
+
+
+def copy_tree(data: Any) -> Any:
+    """
+    copies the dicts and lists of a parsed file. Much faster than deepcopy, as all other values are immutable
+    """
+    if isinstance(data, dict):
+        return {key: copy_tree(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [copy_tree(value) for value in data]
+    return data
+
+
+class ParsedFiles:
+    """
+    process wide cache of parsed spec files, keyed by absolute path and modification time.
+    A file that is referenced by multiple services (or parsed by multiple parsers) is only parsed once.
+    Every caller gets its own copy, as prance modifies the specs while resolving.
+    """
+    instance = None
+
+    def __init__(self):
+        self.entries: Dict[str, Tuple[int, str, Any]] = dict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _mtime(file_name: str) -> Optional[int]:
+        try:
+            return os.stat(file_name).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, file_name: str, text: str) -> Optional[Any]:
+        entry = self.entries.get(os.path.abspath(file_name))
+        # the text is compared as well, in case the file changed within the resolution of the timestamp
+        if entry is None or entry[0] != self._mtime(file_name) or entry[1] != text:
+            self.misses += 1
+            return None
+        self.hits += 1
+        logging.debug(f"Using parsed {file_name} from the cache")
+        return copy_tree(entry[2])
+
+    def store(self, file_name: str, text: str, parsed: Any) -> Any:
+        mtime = self._mtime(file_name)
+        if mtime is None:
+            return parsed
+        self.entries[os.path.abspath(file_name)] = (mtime, text, parsed)
+        return copy_tree(parsed)
+
+
+def parsed_files() -> ParsedFiles:
+    if ParsedFiles.instance is None:
+        ParsedFiles.instance = ParsedFiles()
+    return ParsedFiles.instance
+
+
+def parse_spec(spec_str: str, filename: Optional[str] = None, **kwargs) -> Any:
+    """
+    drop-in replacement for prance.util.formats.parse_spec, that caches parsed local files.
+    """
+    if not filename or kwargs.get("content_type") is not None:
+        return _parse_spec(spec_str, filename, **kwargs)
+    parsed = parsed_files().get(filename, spec_str)
+    if parsed is None:
+        parsed = parsed_files().store(filename, spec_str, _parse_spec(spec_str, filename, **kwargs))
+    return parsed
+
+
+def _parse_spec(spec_str: str, filename: Optional[str] = None, **kwargs) -> Any:
+    """
+    parses with the fastest available backend.
+    Everything that cannot be handled here (unknown file types, parse errors) is passed on to prance.
+    """
+    from prance.util import formats
+    extension = os.path.splitext(filename)[1].lower() if filename else ""
+    try:
+        if extension in (".yml", ".yaml") and kwargs.get("content_type") is None:
+            return load_yaml(spec_str)
+        if extension in (".json", ".js") and kwargs.get("content_type") is None:
+            return load_json(spec_str)
+    except (ValueError, yaml.YAMLError):
+        pass
+    return _prance_parse_spec(formats)(spec_str, filename, **kwargs)
+
+
+def _prance_parse_spec(formats):
+    return getattr(formats, "_caffoa_original_parse_spec", formats.parse_spec)
+
+
+@contextmanager
+def fast_spec_parsing():
+    """
+    lets prance parse the spec and all referenced files with parse_spec while the context is active
+    """
+    from prance.util import formats, url
+    # prance keeps the main spec of each parser in the default cache of fetch_url, without checking the file
+    # for changes. Parsed files are cached here instead, so that changed files are picked up (e.g. in watch mode)
+    defaults = url.fetch_url.__defaults__
+    if defaults and isinstance(defaults[0], dict):
+        defaults[0].clear()
+    if hasattr(formats, "_caffoa_original_parse_spec"):
+        yield  # already active
+        return
+    formats._caffoa_original_parse_spec = formats.parse_spec
+    formats.parse_spec = parse_spec
+    try:
+        yield
+    finally:
+        formats.parse_spec = formats._caffoa_original_parse_spec
+        del formats._caffoa_original_parse_spec
@@ -0,0 +1,129 @@
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Iterable, Optional
+
+MANIFEST_FORMAT = 1
+
+
+def _plain(data):
+    if isinstance(data, dict):
+        return {str(key): _plain(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_plain(value) for value in data]
+    if hasattr(data, "__dict__"):
+        return dict(_type=type(data).__name__, **_plain(vars(data)))
+    return data
+
+
+def fingerprint(*data) -> str:
+    """
+    returns a stable hash of the passed data. Objects are hashed by their attributes.
+    """
+    dump = json.dumps(_plain(data), sort_keys=True, default=str)
+    return hashlib.sha256(dump.encode("utf-8")).hexdigest()
+
+
+class GenerationManifest:
+    """
+    records which files were generated from which inputs, and by which config file.
+    A file does not need to be rendered again if its inputs did not change and nobody touched the file since.
+    """
+    instance = None
+
+    def __init__(self, file_name: str, incremental: bool, config: str = ""):
+        self.file_name = file_name
+        self.incremental = incremental
+        self.config = config
+        self.previous = dict()
+        self.produced = set()
+        if os.path.exists(file_name):
+            try:
+                with open(file_name, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == MANIFEST_FORMAT:
+                    self.previous = data.get("files", dict())
+            except (ValueError, OSError) as e:
+                logging.warning(f"Ignoring unreadable manifest {file_name}: {e}")
+        self.files = dict(self.previous)
+
+    def is_current(self, file_name: str, inputs: str) -> bool:
+        file_name = os.path.abspath(file_name)
+        entry = self.previous.get(file_name)
+        if not self.incremental or entry is None or entry["inputs"] != inputs:
+            return False
+        try:
+            stat = os.stat(file_name)
+        except FileNotFoundError:
+            return False
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime"]:
+            return False
+        self.produced.add(file_name)
+        self.files[file_name] = dict(entry, config=self.config)
+        return True
+
+    def record(self, file_name: str, inputs: str, sources: Optional[dict] = None):
+        file_name = os.path.abspath(file_name)
+        self.produced.add(file_name)
+        stat = os.stat(file_name)
+        self.files[file_name] = dict(inputs=inputs,
+                                     size=stat.st_size,
+                                     mtime=stat.st_mtime_ns,
+                                     sources=sources if sources else dict(),
+                                     config=self.config)
+
+    def remove_stale(self):
+        """
+        removes files that were generated by an earlier run of the same config file, but not by the current one.
+        Files of other config files that share the manifest are kept.
+        """
+        self._remove(file_name for file_name, entry in self.files.items()
+                     if file_name not in self.produced and entry.get("config") == self.config)
+
+    def remove_stale_matching(self, pattern: str):
+        """
+        removes files matching the pattern that were generated by an earlier run, but not by the current one.
+        Used for the partial files of a split class, that would not compile next to the current ones
+        """
+        pattern = os.path.normcase(os.path.abspath(pattern))
+        self._remove(file_name for file_name in self.files
+                     if file_name not in self.produced and fnmatch.fnmatchcase(os.path.normcase(file_name), pattern))
+
+    def _remove(self, file_names: Iterable[str]):
+        for file_name in sorted(file_names):
+            if os.path.exists(file_name):
+                logging.info(f"Removing {file_name}")
+                os.unlink(file_name)
+            del self.files[file_name]
+
+    def save(self):
+        folder = os.path.dirname(os.path.abspath(self.file_name))
+        fd, temp_name = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(dict(version=MANIFEST_FORMAT, files=self.files), f, indent=1, sort_keys=True)
+            os.replace(temp_name, self.file_name)
+        except Exception:
+            os.unlink(temp_name)
+            raise
+
+
+def get() -> Optional[GenerationManifest]:
+    return GenerationManifest.instance
+
+
+def init(file_name: str, incremental: bool = True, config: str = ""):
+    GenerationManifest.instance = GenerationManifest(file_name, incremental, config)
+
+
+def remove_stale():
+    if get() is not None:
+        get().remove_stale()
+
+
+def save():
+    if get() is not None:
+        get().save()
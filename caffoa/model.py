@@ -13,6 +13,7 @@ class MemberData:
         self.description = None
         self.enums = None
         self.is_basic_type = True
+        self.is_interface = False
 
 class ModelData:
     def __init__(self, rawname: str, name: str):
@@ -55,6 +56,7 @@ class EndPoint:
         self.needs_content = needs_content
         self.responses = None
         self.body = None
+        self.tags = list()
 
     def __str__(self):
         return f"{self.method} {self.path} ({self.parameters}) -> {self.responses}"
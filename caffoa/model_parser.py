@@ -4,8 +4,10 @@ import re
 
 from prance import ResolvingParser
 
+from caffoa import profiler
 from caffoa.converter import parse_type, to_camelcase, is_primitive
 from caffoa.model import ModelData, MemberData
+from caffoa.naming import NameIndex, ClassNaming
 from caffoa.object_parser import ObjectParser
 
 
@@ -16,12 +18,19 @@ class ModelParser:
         self.known_types = dict()
         self.excludes = list()
         self.includes = list()
+        self.names: Optional[NameIndex] = None
+        self.naming = ClassNaming("", "")
 
     def parse(self, parser: ResolvingParser) -> List[ModelData]:
         schemas = parser.specification["components"]["schemas"]
-        self.parse_simple_types(schemas)
-        objects = self.parse_objects(schemas)
-        return self.add_interfaces(objects)
+        if self.names is None:
+            self.names = NameIndex(parser.specification)
+        with profiler.phase("simple types"):
+            self.parse_simple_types(schemas)
+        with profiler.phase("object parsing"):
+            objects = self.parse_objects(schemas)
+            self.mark_interface_properties(schemas, objects)
+            return self.add_interfaces(objects)
 
     def parse_simple_types(self, schemas: dict):
         for class_name, schema in schemas.items():
@@ -42,11 +51,32 @@ class ModelParser:
                 continue
             if len(self.includes) > 0 and name not in self.includes:
                 continue
-            objects.append(ObjectParser(name, self.prefix, self.suffix, self.known_types).parse(schema))
+            objects.append(ObjectParser(name, self.prefix, self.suffix, self.known_types,
+                                        self.current_naming()).parse(schema))
         return objects
 
     def class_name(self, name):
-        return self.prefix + to_camelcase(name) + self.suffix
+        return self.current_naming().class_name(name)
+
+    def current_naming(self) -> ClassNaming:
+        # prefix and suffix are set after construction, so the naming is looked up on each use
+        if (self.naming.prefix, self.naming.suffix) != (self.prefix, self.suffix):
+            if self.names is not None:
+                self.naming = self.names.naming(self.prefix, self.suffix)
+            else:
+                self.naming = ClassNaming(self.prefix, self.suffix)
+        return self.naming
+
+    def mark_interface_properties(self, schemas: dict, objects: List[ModelData]):
+        """
+        marks properties that reference a oneOf schema. Their type is an interface, that cannot be copied or merged
+        """
+        interfaces = set(self.class_name(name) for name, schema in schemas.items() if "oneOf" in schema)
+        for item in objects:
+            if item.is_interface():
+                continue
+            for prop in item.properties:
+                prop.is_interface = not prop.is_basic_type and prop.typename in interfaces
 
     def add_interfaces(self, objects: List[ModelData]) -> list:
         interfaces = dict()
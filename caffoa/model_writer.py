@@ -1,44 +1,53 @@
 import logging
 import os
-from typing import List
+from typing import List, Tuple
 
-from caffoa import duplication_handler
-from caffoa.base_writer import BaseWriter
-from caffoa.converter import to_camelcase
+from caffoa import duplication_handler, profiler
+from caffoa.base_writer import BaseWriter, NEWTONSOFT, SYSTEM_TEXT_JSON
+from caffoa.converter import to_camelcase, type_info_name
+from caffoa.manifest import fingerprint
 from caffoa.model import ModelData, MemberData, ModelObjectData, ModelInterfaceData
 
 
 class ModelWriter(BaseWriter):
-    def __init__(self, version: int, namespace: str, output_folder: str):
-        super().__init__(version)
+    def __init__(self, version: int, namespace: str, output_folder: str, serializer: str = NEWTONSOFT):
+        super().__init__(version, serializer)
         self.output_folder = output_folder
         self.namespace = namespace
+        self.json_context = "".join(to_camelcase(part) for part in namespace.split(".")) + "JsonContext"
         self.additional_imports = list()
         self.json_error_handling = {"class": "CaffoaJsonParseError"}
         self.error_namespace = None
-        self.model_template = self.load_template("ModelTemplate.cs")
-        self.prop_template = self.load_template("ModelPropertyTemplate.cs")
-        self.enum_prop_template = self.load_template("ModelEnumPropertyTemplate.cs")
-        self.interface_template = self.load_template("ModelInterfaceTemplate.cs")
+        self.model_template = self.load_template("ModelTemplate.cs", per_serializer=True)
+        self.prop_template = self.load_template("ModelPropertyTemplate.cs", per_serializer=True)
+        self.enum_prop_template = self.load_template("ModelEnumPropertyTemplate.cs", per_serializer=True)
+        self.interface_template = self.load_template("ModelInterfaceTemplate.cs", per_serializer=True)
         self.enum_name = "{uFieldName}{uValueName}Value"
         self.enum_list_name = "AllowedValuesFor{uFieldName}"
         self.check_enums = True if version > 2 else False
 
     def write(self, models: List[ModelData]):
+        with profiler.phase("rendering"):
+            self.write_files(models)
+
+    def write_files(self, models: List[ModelData]):
         os.makedirs(self.output_folder, exist_ok=True)
         dates_in_models = False
         for model in models:
-            if duplication_handler.should_generate(model.name):
+            shape = fingerprint(model)
+            if duplication_handler.should_generate(model.name, self.namespace, shape):
                 if model.is_interface():
                     self.write_interface(model)
                 else:
                     self.write_model(model)
                     if self.dates_in_model(model):
                         dates_in_models = True
-                duplication_handler.store_generated(model.name)
+                duplication_handler.store_generated(model.name, self.namespace, shape)
 
         if dates_in_models:
             self.write_custom_date_converter()
+        if self.serializer == SYSTEM_TEXT_JSON:
+            self.write_json_context(models)
 
     @staticmethod
     def dates_in_model(model: ModelData):
@@ -48,21 +57,32 @@ class ModelWriter(BaseWriter):
         return False
 
     def write_model(self, model: ModelObjectData):
+        file_name = os.path.abspath(self.output_folder + f"/{model.name}.generated.cs")
+        sources = {f"schema:{model.rawname}": fingerprint(model)}
+        inputs = self.inputs_hash(sources)
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged class {model.name} -> {file_name}")
+            return
+
         imports = [f"using {key};\n" for key in model.imports]
+        if self.serializer == SYSTEM_TEXT_JSON:
+            imports.append("using System.Collections.Generic;\n")
         imports.extend([f"using {key};\n" for key in self.additional_imports])
 
         # remove duplicates but keep order:
         imports = list(dict.fromkeys(imports))
-        all_parents = model.interfaces
+        all_parents = list(model.interfaces)
         if model.parent:
             all_parents.insert(0, model.parent)
+        if self.serializer == SYSTEM_TEXT_JSON:
+            all_parents.append("IJsonOnDeserialized")
         parent = f" : {', '.join(all_parents)}" if all_parents else ""
         formatted_properties = []
         for prop in model.properties:
             formatted_properties.append(self.format_property(prop))
         formatted_updater = self.format_updater(model)
+        merge_props, merge_cases, property_names = self.format_merger(model)
 
-        file_name = os.path.abspath(self.output_folder + f"/{model.name}.generated.cs")
         logging.info(f"Writing class {model.name} -> {file_name}")
 
         description = "/// AUTOGENERED BY caffoa ///\n\t"
@@ -70,29 +90,41 @@ class ModelWriter(BaseWriter):
             model_description = model.description.strip().replace("\n", "\n\t/// ")
             description += f"/// <summary>\n\t/// {model_description}\n\t/// </summary>\n\t"
 
-        with open(file_name, "w", encoding="utf-8") as f:
-            f.write(self.model_template.format(NAMESPACE=self.namespace,
-                                               NAME=model.name,
-                                               RAWNAME=model.rawname,
-                                               PROPERTIES="\n\n".join(formatted_properties),
-                                               UPDATEPROPS=formatted_updater,
-                                               IMPORTS="".join(imports),
-                                               PARENTS=parent,
-                                               DESCRIPTION=description))
+        self.write_file(file_name, self.model_template.format(NAMESPACE=self.namespace,
+                                                              NAME=model.name,
+                                                              RAWNAME=model.rawname,
+                                                              PROPERTIES="\n\n".join(formatted_properties),
+                                                              UPDATEPROPS=formatted_updater,
+                                                              MERGEPROPS=merge_props,
+                                                              MERGECASES=merge_cases,
+                                                              MERGEPARENT=self.format_merge_parent(model),
+                                                              FINDPARENT=self.format_find_parent(model),
+                                                              PROPERTYNAMES=property_names,
+                                                              IMPORTS="".join(imports),
+                                                              PARENTS=parent,
+                                                              DESCRIPTION=description,
+                                                              JSON_CONTEXT=self.json_context,
+                                                              REQUIRED_CHECKS=self.format_required_checks(model)),
+                        inputs, sources)
 
     def write_interface(self, model: ModelInterfaceData):
         file_name = os.path.abspath(self.output_folder + f"/{model.name}.generated.cs")
+        sources = {f"schema:{model.rawname}": fingerprint(model)}
+        inputs = self.inputs_hash(sources)
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged class {model.name} -> {file_name}")
+            return
         logging.info(f"Writing class {model.name} -> {file_name}")
         description = "/// AUTOGENERED BY caffoa ///\n\t"
         if model.description is not None:
             model_description = model.description.strip().replace("\n", "\n\t/// ")
             description += f"/// <summary>\n\t/// {model_description}\n\t/// </summary>\n\t"
-        with open(file_name, "w", encoding="utf-8") as f:
-            f.write(self.interface_template.format(
-                NAMESPACE=self.namespace,
-                NAME=model.name,
-                DESCRIPTION=description,
-                TYPE=model.discriminator))
+        self.write_file(file_name, self.interface_template.format(
+            NAMESPACE=self.namespace,
+            NAME=model.name,
+            DESCRIPTION=description,
+            DERIVED_TYPES="\n\t".join(f"[JsonDerivedType(typeof({child}))]" for child in model.children),
+            TYPE=model.discriminator), inputs, sources)
 
     def format_property(self, property: MemberData) -> str:
         extra = ""
@@ -103,7 +135,9 @@ class ModelWriter(BaseWriter):
             default_str = f" = {property.default_value};"
 
         json_property_extra = ""
-        if property.is_required and property.nullable:
+        if property.is_required and self.serializer == SYSTEM_TEXT_JSON:
+            json_property_extra = ", JsonRequired"  # null values are checked after deserialization
+        elif property.is_required and property.nullable:
             json_property_extra = ", Required = Required.AllowNull"
         elif property.is_required:
             json_property_extra = ", Required = Required.Always"
@@ -159,7 +193,7 @@ class ModelWriter(BaseWriter):
             if prop.is_list:
                 if prop.is_basic_type:
                     special_call = ".ToList()"
-            elif not prop.is_basic_type:
+            elif not prop.is_basic_type and not prop.is_interface:
                 special_call = f".To{prop.typename}()"
                 if prop.nullable:
                     special_call = "?" + special_call
@@ -170,12 +204,181 @@ class ModelWriter(BaseWriter):
             formatted = f"UpdateWith{model.parent}(other);{splitter}{formatted}"
         return formatted
 
+    def format_merger(self, model: ModelObjectData) -> Tuple[str, str, str]:
+        """
+        returns the field by field merge of another object, the switch cases that merge a single JSON property
+        and the list of JSON names. Only fields that are present are touched, nested objects are merged instead of replaced
+        """
+        merge_props = list()
+        merge_cases = list()
+        json_names = list()
+        if model.parent:
+            if self.serializer == SYSTEM_TEXT_JSON:
+                merge_props.append(f"MergeWith{model.parent}(other);")
+            else:
+                merge_props.append(f"MergeWith{model.parent}(other, mergeSettings);")
+        for prop in model.properties:
+            if self.serializer == SYSTEM_TEXT_JSON:
+                merge, case = self.format_property_merge_stj(prop)
+            else:
+                merge, case = self.format_property_merge(prop)
+            merge_props.append(merge)
+            merge_cases.append(f'case "{prop.name}":\n\t\t\t\t\t{case}\n\t\t\t\t\treturn true;')
+            json_names.append(f'"{prop.name}"')
+        return "\n\t\t\t".join(merge_props), "\n\t\t\t\t".join(merge_cases), ", ".join(json_names)
+
+    def format_merge_parent(self, model: ModelObjectData) -> str:
+        if not model.parent:
+            return "false"
+        if self.serializer == SYSTEM_TEXT_JSON:
+            return f"MergeProperty{model.parent}(property)"
+        return f"MergeProperty{model.parent}(name, property, mergeSettings)"
+
+    @staticmethod
+    def format_find_parent(model: ModelObjectData) -> str:
+        return f"FindPropertyName{model.parent}(name)" if model.parent else "null"
+
+    @staticmethod
+    def merge_kind(prop: MemberData) -> str:
+        if prop.is_list:
+            return "list"
+        if prop.typename.startswith("Dictionary<"):
+            return "dictionary"
+        if prop.is_interface:
+            # oneOf types are interfaces without merge or copy methods, they are replaced
+            return "interface"
+        if not prop.is_basic_type:
+            return "object"
+        return "value"
+
+    def format_property_merge(self, prop: MemberData) -> Tuple[str, str]:
+        name = to_camelcase(prop.name)
+        type = prop.typename
+        kind = self.merge_kind(prop)
+        merge_null = "mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge"
+        separator = "\n\t\t\t"
+        case_separator = "\n\t\t\t\t\t"
+        if kind == "object":
+            merge = [f"if (other.{name} != null && {name} != null)",
+                     f"    {name}.MergeWith{type}(other.{name}, mergeSettings);",
+                     f"else if (other.{name} != null || {merge_null})",
+                     f"    {name} = other.{name}?.To{type}();"]
+            case = [f"if (property.Value.Type == JTokenType.Object && {name} != null)",
+                    f"    {name}.MergeWith{type}(property.Value, mergeSettings);",
+                    "else",
+                    f"    {name} = property.Value.ToObject<{type}>();"]
+        elif kind in ("list", "dictionary"):
+            container, token_type = ("JArray", "Array") if kind == "list" else ("JObject", "Object")
+            copy = f"other.{name}?.ToList()" if kind == "list" \
+                else f"other.{name} == null ? null : new {type}(other.{name})"
+            # arrays that are not replaced are merged by newtonsoft, like the objects of dictionaries
+            condition = " && mergeSettings.MergeArrayHandling != MergeArrayHandling.Replace" if kind == "list" else ""
+            merge = [f"if (other.{name} != null && {name} != null{condition}) {{",
+                     f"    var merged = {container}.FromObject({name});",
+                     f"    merged.Merge({container}.FromObject(other.{name}), mergeSettings);",
+                     f"    {name} = merged.ToObject<{type}>();",
+                     f"}} else if (other.{name} != null || {merge_null})",
+                     f"    {name} = {copy};"]
+            case = [f"if (property.Value.Type == JTokenType.{token_type} && {name} != null{condition}) {{",
+                    f"    var merged = {container}.FromObject({name});",
+                    "    merged.Merge(property.Value, mergeSettings);",
+                    f"    {name} = merged.ToObject<{type}>();",
+                    "} else",
+                    f"    {name} = property.Value.ToObject<{type}>();"]
+        else:
+            if type == "string" or type.endswith("?") or kind == "interface":
+                merge = [f"if (other.{name} != null || {merge_null})",
+                         f"    {name} = other.{name};"]
+            else:
+                merge = [f"{name} = other.{name};"]
+            case = [f"{name} = property.Value.ToObject<{type}>();"]
+        return separator.join(merge), case_separator.join(case)
+
+    def format_property_merge_stj(self, prop: MemberData) -> Tuple[str, str]:
+        name = to_camelcase(prop.name)
+        type = prop.typename
+        kind = self.merge_kind(prop)
+        type_info = f"{self.json_context}.Default.{type_info_name(type)}"
+        separator = "\n\t\t\t"
+        case_separator = "\n\t\t\t\t\t"
+        if kind == "object":
+            merge = [f"if (other.{name} != null && {name} != null)",
+                     f"    {name}.MergeWith{type}(other.{name});",
+                     "else",
+                     f"    {name} = other.{name}?.To{type}();"]
+            case = [f"if (property.Value is JsonObject && {name} != null)",
+                    f"    {name}.MergeWith{type}(property.Value);",
+                    "else",
+                    f"    {name} = property.Value.Deserialize({type_info});"]
+        elif kind == "dictionary":
+            merge = [f"if (other.{name} != null && {name} != null) {{",
+                     f"    var merged = JsonSerializer.SerializeToNode({name}, {type_info});",
+                     f"    {self.json_context}.Merge(merged, JsonSerializer.SerializeToNode(other.{name}, {type_info}));",
+                     f"    {name} = merged.Deserialize({type_info});",
+                     "} else",
+                     f"    {name} = other.{name} == null ? null : new {type}(other.{name});"]
+            case = [f"if (property.Value is JsonObject && {name} != null) {{",
+                    f"    var merged = JsonSerializer.SerializeToNode({name}, {type_info});",
+                    f"    {self.json_context}.Merge(merged, property.Value);",
+                    f"    {name} = merged.Deserialize({type_info});",
+                    "} else",
+                    f"    {name} = property.Value.Deserialize({type_info});"]
+        elif kind == "list":
+            merge = [f"{name} = other.{name}?.ToList();"]
+            case = [f"{name} = property.Value.Deserialize({type_info});"]
+        else:
+            merge = [f"{name} = other.{name};"]
+            case = [f"{name} = property.Value.Deserialize({type_info});"]
+        return separator.join(merge), case_separator.join(case)
+
+    @staticmethod
+    def format_required_checks(model: ModelObjectData) -> str:
+        """
+        System.Text.Json only checks that required fields are present. Like Required.Always in newtonsoft,
+        required fields that are not nullable must not be null either
+        """
+        checks = list()
+        if model.parent:
+            checks.append(f"CheckRequired{model.parent}();")
+        for prop in model.properties:
+            is_reference = prop.is_list or not prop.is_basic_type or prop.typename == "string" \
+                           or prop.typename.startswith("Dictionary<")
+            if prop.is_required and not prop.nullable and is_reference:
+                checks.append(f'if ({to_camelcase(prop.name)} == null)\n\t\t\t\t'
+                              f'throw new JsonException("Required property \'{prop.name}\' not found in JSON or is null");')
+        return "\n\t\t\t".join(checks)
+
+    def write_json_context(self, models: List[ModelData]):
+        """
+        writes the JsonSerializerContext for System.Text.Json source generation, with all models of the service
+        """
+        template = self.load_template("JsonContextTemplate.cs")
+        file_name = os.path.abspath(self.output_folder + f"/{self.json_context}.generated.cs")
+        names = [model.name for model in models]
+        inputs = self.inputs_hash(names)
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged {self.json_context} -> {file_name}")
+            return
+        types = list()
+        for name in names:
+            types.append(f"[JsonSerializable(typeof({name}))]")
+            types.append(f"[JsonSerializable(typeof(IEnumerable<{name}>))]")
+        imports = [f"using {key};\n" for key in self.additional_imports]
+        logging.info(f"Writing {self.json_context} -> {file_name}")
+        self.write_file(file_name, template.format(NAMESPACE=self.namespace,
+                                                   NAME=self.json_context,
+                                                   TYPES="\n    ".join(types),
+                                                   IMPORTS="".join(dict.fromkeys(imports))), inputs)
+
     def write_custom_date_converter(self):
-        template = self.load_template("DateSerializer.cs")
+        template = self.load_template("DateSerializer.cs", per_serializer=True)
         file_name = os.path.abspath(self.output_folder + f"/CustomJsonDateConverter.generated.cs")
+        inputs = self.inputs_hash(template)
+        if self.is_unchanged(file_name, inputs):
+            logging.info(f"Skipping unchanged CustomJsonDateConverter -> {file_name}")
+            return
         logging.info(f"Writing CustomJsonDateConverter -> {file_name}")
-        with open(file_name, "w", encoding="utf-8") as f:
-            f.write(template.format(NAMESPACE=self.namespace))
+        self.write_file(file_name, template.format(NAMESPACE=self.namespace), inputs)
 
     def format_enum_value(self, typename: str, valuename: str):
         return self.enum_name.format(
@@ -0,0 +1,63 @@
+from typing import Dict, Optional, Tuple
+
+from caffoa.converter import to_camelcase
+from caffoa.ref_resolver import unescape_pointer
+
+SCHEMA_PREFIX = "#/components/schemas/"
+
+
+def schema_name_from_ref(ref: str) -> str:
+    return unescape_pointer(ref.split('/')[-1])
+
+
+class ClassNaming:
+    """
+    class names for one prefix/suffix combination. All names are computed once and memoized.
+    """
+
+    def __init__(self, prefix: str, suffix: str, schema_names: Optional[Dict[str, str]] = None):
+        self.prefix = prefix
+        self.suffix = suffix
+        self.schema_names = schema_names if schema_names is not None else dict()
+        self.class_names = dict()
+
+    def name_from_ref(self, ref: str) -> str:
+        name = self.schema_names.get(ref)
+        if name is None:
+            name = schema_name_from_ref(ref)
+            self.schema_names[ref] = name
+        return name
+
+    def class_name(self, name: str) -> str:
+        class_name = self.class_names.get(name)
+        if class_name is None:
+            class_name = self.prefix + to_camelcase(name) + self.suffix
+            self.class_names[name] = class_name
+        return class_name
+
+    def class_name_from_ref(self, ref: str) -> str:
+        return self.class_name(self.name_from_ref(ref))
+
+
+class NameIndex:
+    """
+    index of all schema names of a spec, built once after resolution.
+    Class names are kept per prefix/suffix combination, so changing the prefix or suffix never returns stale names.
+    """
+
+    def __init__(self, specification: dict):
+        self.schema_names = dict()
+        self.schemas = specification.get("components", dict()).get("schemas", dict())
+        for name in self.schemas:
+            self.schema_names[SCHEMA_PREFIX + name] = name
+        self.namings: Dict[Tuple[str, str], ClassNaming] = dict()
+
+    def naming(self, prefix: str, suffix: str) -> ClassNaming:
+        key = (prefix or "", suffix or "")
+        naming = self.namings.get(key)
+        if naming is None:
+            naming = ClassNaming(key[0], key[1], self.schema_names)
+            for name in self.schemas:
+                naming.class_name(name)
+            self.namings[key] = naming
+        return naming
@@ -4,29 +4,28 @@ from typing import Optional, Tuple
 
 from caffoa.converter import to_camelcase, parse_type, is_date
 from caffoa.model import ModelData, MemberData, ModelObjectData, ModelInterfaceData
+from caffoa.naming import ClassNaming
 
 
 class BaseObjectParser:
-    def __init__(self, prefix: str, suffix: str):
+    def __init__(self, prefix: str, suffix: str, naming: Optional[ClassNaming] = None):
         self.suffix = suffix
         self.prefix = prefix
+        self.naming = naming if naming is not None else ClassNaming(prefix, suffix)
 
     def name_from_ref(self, param: str):
-        if ".yml_schemas_" in param:
-            param = param.split(".yml_schemas_")[-1]
-        name = param.split('/')[-1]
-        return name
+        return self.naming.name_from_ref(param)
 
     def class_name_from_ref(self, param: str):
-        return self.class_name(self.name_from_ref(param))
+        return self.naming.class_name_from_ref(param)
 
     def class_name(self, name):
-        return self.prefix + to_camelcase(name) + self.suffix
+        return self.naming.class_name(name)
 
 
 class ObjectParser(BaseObjectParser):
-    def __init__(self, raw_name, prefix: str, suffix: str, known_types: dict):
-        super().__init__(prefix, suffix)
+    def __init__(self, raw_name, prefix: str, suffix: str, known_types: dict, naming: Optional[ClassNaming] = None):
+        super().__init__(prefix, suffix, naming)
         self.name = raw_name
         self.known_types = known_types
         self.result = ModelObjectData(self.name, self.class_name(self.name))
@@ -1,61 +1,177 @@
-from typing import Any
+import logging
+import os
+from typing import Any, Optional
 
 from prance import ResolvingParser
-from prance.util.resolver import RESOLVE_HTTP, RESOLVE_FILES, TRANSLATE_EXTERNAL
+from prance.util.fs import abspath
+from prance.util.resolver import RESOLVE_HTTP, RESOLVE_FILES, TRANSLATE_EXTERNAL, RefResolver
+from prance.util.url import absurl, fetch_url
 
+from caffoa import loaders, profiler
+from caffoa.base_writer import NEWTONSOFT, SYSTEM_TEXT_JSON
+from caffoa.body_type_filter import BodyTypeFilter
+from caffoa.endpoint_shards import check_split
 from caffoa.function_writer import FunctionWriter
 from caffoa.interface_writer import InterfaceWriter
 from caffoa.model_parser import ModelParser
 from caffoa.model_writer import ModelWriter
+from caffoa.naming import NameIndex
 from caffoa.path_parser import PathParser
+from caffoa.ref_graph import prune_spec
+from caffoa.ref_resolver import LocalRefResolver, rename_translated_schemas
+from caffoa.spec_cache import SpecCache, CachedParser
 
 
 class OpenApiFile:
-    def __init__(self, name: str, version: int, config: dict):
+    def __init__(self, name: str, version: int, config: dict, cache: Optional[SpecCache] = None):
         self.version = version
         self.name = name
         self.base_config = config
-        self._model_parser = None
-        self._function_parser = None
+        self.cache = cache
+        self._parser = None
+        self._names = None
+        self._refs = None
+        self.scope = None
         self.model = None
+        self.endpoints = None
+        self.prepared = False
+        self.keep_resolved = False
         self.imports = list()
+        self.json_context = None
         self.known_types = dict()
 
     def get_config(self, config: dict, name: str, default_value: Any = None):
         return config.get(name, self.base_config.get(name, default_value))
 
-    def model_parser(self):
-        if self._model_parser is None:
-            self._model_parser = ResolvingParser(self.name, strict=False, resolve_types=RESOLVE_HTTP | RESOLVE_FILES,
-                                                 resolve_method=TRANSLATE_EXTERNAL)
-            try:
-                schemas = self._model_parser.specification["components"]["schemas"]
-                for class_name in list(schemas.keys()):
-                    if ".yml_schemas_" in class_name:
-                        new_class_name = class_name.split(".yml_schemas_")[-1]
-                        schemas[new_class_name] = schemas[class_name]
-                        del schemas[class_name]
-            except KeyError:
-                pass  # no schema
-
-        return self._model_parser
+    def parser(self) -> ResolvingParser:
+        """
+        resolves the spec once. External references are translated into the components section,
+        local references are kept and resolved on demand by the parsers.
+        """
+        if self._parser is None:
+            with profiler.phase("spec resolution"):
+                self._parser = self._resolve()
+        return self._parser
+
+    def _resolve(self):
+        options = "translate_external"
+        if self.scope is not None:
+            options += f"|lazy|{sorted(self.scope['schemas'] or list())}|{self.scope['paths']}"
+        cache_key = self.cache.key(self.name, options) if self.cache else None
+        specification = self.cache.load(cache_key) if self.cache else None
+        if specification is not None:
+            logging.info(f"Using cached specification for {self.name}")
+            return CachedParser(specification)
+        with loaders.fast_spec_parsing():
+            parser = self._resolve_scope() if self.scope is not None else None
+            if parser is None:
+                parser = ResolvingParser(self.name, strict=False, resolve_types=RESOLVE_HTTP | RESOLVE_FILES,
+                                         resolve_method=TRANSLATE_EXTERNAL)
+        rename_translated_schemas(parser.specification)
+        if self.cache:
+            self.cache.store(cache_key, parser.specification)
+        return parser
+
+    def _resolve_scope(self) -> Optional[CachedParser]:
+        """
+        resolves only the schemas in the scope, and everything they reference (lazyResolution).
+        The spec is not validated. Returns None if the scope cannot be determined from the spec itself.
+        """
+        url = absurl(self.name, abspath(os.getcwd()))
+        specification = prune_spec(fetch_url(url, dict(), strict=False), self.scope["schemas"], self.scope["paths"])
+        if specification is None:
+            logging.info(f"Included schemas are not all defined in {self.name}, resolving the full spec")
+            return None
+        resolver = RefResolver(specification, url, strict=False, resolve_types=RESOLVE_HTTP | RESOLVE_FILES,
+                               resolve_method=TRANSLATE_EXTERNAL)
+        resolver.resolve_references()
+        return CachedParser(resolver.specs)
+
+    def names(self) -> NameIndex:
+        """
+        ref and class name index of the resolved spec, shared by the model and the path parser
+        """
+        if self._names is None:
+            self._names = NameIndex(self.parser().specification)
+        return self._names
+
+    def refs(self) -> LocalRefResolver:
+        """
+        memoized resolver for the local references of the resolved spec
+        """
+        if self._refs is None:
+            self._refs = LocalRefResolver(self.parser().specification)
+        return self._refs
+
+    def model_parser(self) -> ResolvingParser:
+        return self.parser()
 
     def function_parser(self) -> ResolvingParser:
-        if self._function_parser is None:
-            self._function_parser = ResolvingParser(self.name, strict=False)
-        return self._function_parser
+        return self.parser()
 
-    def create_model(self, config: dict):
+    def prepare(self, service: dict):
+        """
+        parses everything that is needed for the model and function of a service, without writing any files.
+        The resolved spec is dropped afterwards, so the object stays small when passed between processes.
+        With keep_resolved (watch mode), only the specification is kept, so it can be re-used after a config change.
+        """
+        if self.prepared:
+            return
+        self.scope = self.resolution_scope(service)
+        if "model" in service:
+            self.parse_model(service["model"])
+        if "function" in service:
+            self.parse_function(service["function"])
+        if self.keep_resolved and self._parser is not None:
+            self._parser = CachedParser(self._parser.specification)
+        else:
+            self._parser = None
+            self._names = None
+            self._refs = None
+        self.prepared = True
+
+    def reuse_resolved(self, previous: "OpenApiFile", service: dict) -> bool:
+        """
+        takes over the resolved spec of a handler for the same spec file, if it was resolved with the same scope.
+        The services are parsed again, as their config might have changed.
+        """
+        if previous.name != self.name or previous._parser is None \
+                or previous.scope != self.resolution_scope(service):
+            return False
+        self._parser, self._names, self._refs = previous._parser, previous._names, previous._refs
+        return True
+
+    def resolution_scope(self, service: dict) -> Optional[dict]:
+        """
+        with lazyResolution, a model with includes only needs the included schemas and their references,
+        a function needs the paths and their references.
+        """
+        if not self.base_config.get("lazyResolution", False):
+            return None
+        includes = list(service.get("model", dict()).get("includes", list()))
+        if "model" in service and len(includes) == 0:
+            return None  # all schemas are generated
+        return dict(schemas=includes, paths="function" in service)
+
+    def parse_model(self, config: dict):
         if not "namespace" in config or not "targetFolder" in config:
             raise Warning(f"model needs children 'namespace' and 'targetFolder' in service #{id}")
         parser = ModelParser()
+        parser.names = self.names()
         parser.prefix = config.get("prefix", self.base_config.get("prefix", ""))
         parser.suffix = config.get("suffix", self.base_config.get("suffix", ""))
 
         parser.excludes = list(config.get('excludes', list()))
         parser.includes = list(config.get('includes', list()))
-        model = parser.parse(self.model_parser())
-        writer = ModelWriter(self.version, config["namespace"], config["targetFolder"])
+        self.model = parser.parse(self.model_parser())
+        self.known_types = parser.known_types
+
+    def create_model(self, config: dict):
+        if self.model is None:
+            self.parse_model(config)
+        writer = ModelWriter(self.version, config["namespace"], config["targetFolder"],
+                             self.get_config(config, "serializer", NEWTONSOFT))
+        writer.json_context = config.get("jsonContext", writer.json_context)
         writer.error_namespace = self.get_config(config, "errorNamespace", writer.error_namespace)
         writer.json_error_handling = self.get_config(config, "jsonErrorHandling", writer.json_error_handling)
         writer.additional_imports.extend(config.get("imports", self.base_config.get('imports', list())))
@@ -63,31 +179,56 @@ class OpenApiFile:
         writer.enum_list_name = self.get_config(config, "enumListName", writer.enum_list_name)
         writer.check_enums = self.get_config(config, "checkEnums", writer.check_enums)
 
-        writer.write(model)
-        self.imports.append(writer.namespace)
-        self.known_types = parser.known_types
+        writer.write(self.model)
+        if writer.namespace not in self.imports:
+            self.imports.append(writer.namespace)
+        self.json_context = writer.json_context
+
+    def payload_logging_config(self, config: dict, defaults: dict) -> dict:
+        payload_logging = dict(defaults)
+        payload_logging.update(self.get_config(config, "payloadLogging", dict()))
+        if set(payload_logging.keys()) != set(defaults.keys()):
+            raise Warning(f"payloadLogging can only contain {', '.join(defaults.keys())} in service {self.name}")
+        if not isinstance(payload_logging["enabled"], bool):
+            raise Warning(f"payloadLogging enabled must be true or false in service {self.name}")
+        max_bytes, sample_rate = payload_logging["maxBytes"], payload_logging["sampleRate"]
+        # bool is a subclass of int, but true/false are no valid sizes or rates
+        if isinstance(max_bytes, bool) or not isinstance(max_bytes, int) or max_bytes < 0:
+            raise Warning(f"payloadLogging maxBytes must be a non-negative number in service {self.name}")
+        if isinstance(sample_rate, bool) or not isinstance(sample_rate, (int, float)) or not 0 <= sample_rate <= 1:
+            raise Warning(f"payloadLogging sampleRate must be between 0 and 1 in service {self.name}")
+        return payload_logging
 
     def parse_endpoints(self, create_returns: bool):
-        parser = PathParser(self.function_parser())
-        parser.known_types = self.known_types
-        parser.prefix = self.base_config.get("prefix", "")
-        parser.suffix = self.base_config.get("suffix", "")
-        if create_returns:
-            parser.create_returns(self.model_parser())
-            parser.create_bodies(self.model_parser())
-        return parser.parse()
+        with profiler.phase("endpoint parsing"):
+            parser = PathParser(self.function_parser())
+            parser.known_types = self.known_types
+            parser.names = self.names()
+            parser.refs = self.refs()
+            parser.prefix = self.base_config.get("prefix", "")
+            parser.suffix = self.base_config.get("suffix", "")
+            return parser.parse(create_returns)
 
-    def create_function(self, config: dict):
+    def parse_function(self, config: dict):
         if not "name" in config or not "namespace" in config or not "targetFolder" in config:
             raise Warning(f"function needs children 'name', 'namespace' and 'targetFolder' in service {self.name}")
+        self.endpoints = self.parse_endpoints(self.version > 2)
 
-        endpoints = self.parse_endpoints(self.version > 2)
+    def create_function(self, config: dict):
+        if self.endpoints is None:
+            self.parse_function(config)
+        endpoints = self.endpoints
 
         name = config['name']
         namespace = config["namespace"]
         target_folder = config['targetFolder']
 
-        iwriter = InterfaceWriter(self.version, name, namespace, target_folder)
+        body_filter = BodyTypeFilter(self.get_config(config, 'requestBodyType', list()))
+        serializer = self.get_config(config, "serializer", NEWTONSOFT)
+        if serializer == SYSTEM_TEXT_JSON and self.json_context is None:
+            raise Warning(f"serializer '{SYSTEM_TEXT_JSON}' needs a model in service {self.name}, "
+                          f"the function uses its JsonSerializerContext")
+        iwriter = InterfaceWriter(self.version, name, namespace, target_folder, serializer)
         iwriter.use_factory = self.get_config(config, "useFactory", iwriter.use_factory)
         if self.version >= 3 and not iwriter.use_factory:
             raise Warning("You cannot use v3 without factory pattern")
@@ -97,10 +238,14 @@ class OpenApiFile:
         iwriter.interface_name = self.get_config(config, 'interfaceName', iwriter.interface_name)
         iwriter.namespace = self.get_config(config, 'interfaceNamespace', iwriter.namespace)
         iwriter.target_folder = self.get_config(config, 'interfaceTargetFolder', iwriter.target_folder)
-        iwriter.request_body_filter = self.get_config(config, 'requestBodyType', iwriter.request_body_filter)
+        iwriter.request_body_filter = body_filter
+        iwriter.split = config.get('split', iwriter.split)
+        check_split(iwriter.split)
         iwriter.write(endpoints)
 
-        writer = FunctionWriter(self.version, name, namespace, target_folder, iwriter.interface_name)
+        writer = FunctionWriter(self.version, name, namespace, target_folder, iwriter.interface_name, serializer)
+        if serializer == SYSTEM_TEXT_JSON:
+            writer.json_context = self.json_context
         writer.use_factory = self.get_config(config, 'useFactory', writer.use_factory)
         writer.route_prefix = self.get_config(config, 'routePrefix', writer.route_prefix)
         writer.boilerplate = self.get_config(config, 'boilerplate', writer.boilerplate)
@@ -108,8 +253,10 @@ class OpenApiFile:
         writer.error_namespace = self.get_config(config, "errorNamespace", writer.error_namespace)
         writer.json_error_handling = self.get_config(config, "jsonErrorHandling", writer.json_error_handling)
         writer.error_folder = self.get_config(config, "errorFolder", writer.error_folder)
+        writer.payload_logging = self.payload_logging_config(config, writer.payload_logging)
         writer.imports.extend(self.get_config(config, "imports", list()))
-        writer.request_body_filter = self.get_config(config, 'requestBodyType', list())
+        writer.request_body_filter = body_filter
+        writer.split = iwriter.split
         if self.version > 2:
             writer.imports.extend(self.imports)
         writer.write(endpoints)
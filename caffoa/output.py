@@ -0,0 +1,140 @@
+import logging
+import os
+import tempfile
+from typing import Iterable
+
+from caffoa import profiler
+
+
+class FileOutput:
+    """
+    writes generated files only if their content changed, so that unchanged files keep their timestamp
+    and do not trigger a recompilation. Changed files are replaced atomically.
+    """
+    instance = None
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.skipped = 0
+
+    @staticmethod
+    def _is_equal(file_name: str, data: bytes) -> bool:
+        try:
+            if os.path.getsize(file_name) != len(data):
+                return False
+            with open(file_name, "rb") as f:
+                return f.read() == data
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _is_equal_file(file_name: str, temp_name: str, chunk_size: int = 1 << 16) -> bool:
+        try:
+            if os.path.getsize(file_name) != os.path.getsize(temp_name):
+                return False
+            with open(file_name, "rb") as existing, open(temp_name, "rb") as new:
+                while True:
+                    chunk = existing.read(chunk_size)
+                    if chunk != new.read(chunk_size):
+                        return False
+                    if not chunk:
+                        return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _file_mode(file_name: str) -> int:
+        try:
+            return os.stat(file_name).st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def write(self, file_name: str, content: str) -> bool:
+        """
+        writes the file if the content differs from the file on disk. Returns True if the file was written
+        """
+        with profiler.phase("file I/O"):
+            return self._write(file_name, content)
+
+    def _write(self, file_name: str, content: str) -> bool:
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)  # same as writing in text mode
+        data = content.encode("utf-8")
+        if self._is_equal(file_name, data):
+            logging.debug(f"Content of {file_name} did not change")
+            self.unchanged += 1
+            return False
+        fd, temp_name = self._temp_file(file_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            self._replace(temp_name, file_name)
+        except Exception:
+            os.unlink(temp_name)
+            raise
+        self.written += 1
+        return True
+
+    def write_stream(self, file_name: str, chunks: Iterable[str]) -> bool:
+        """
+        writes the chunks through a buffered temporary file, so the content is never held in memory at once.
+        The existing file is only replaced if the content differs. Returns True if the file was written
+        """
+        with profiler.phase("file I/O"):
+            return self._write_stream(file_name, chunks)
+
+    def _write_stream(self, file_name: str, chunks: Iterable[str]) -> bool:
+        fd, temp_name = self._temp_file(file_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            if self._is_equal_file(file_name, temp_name):
+                logging.debug(f"Content of {file_name} did not change")
+                os.unlink(temp_name)
+                self.unchanged += 1
+                return False
+            self._replace(temp_name, file_name)
+        except Exception:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+        self.written += 1
+        return True
+
+    @staticmethod
+    def _temp_file(file_name: str):
+        return tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_name)), suffix=".tmp")
+
+    def _replace(self, temp_name: str, file_name: str):
+        os.chmod(temp_name, self._file_mode(file_name))
+        os.replace(temp_name, file_name)
+
+    def report(self):
+        logging.info(f"{self.written} files written, {self.unchanged} files unchanged, "
+                     f"{self.skipped} files skipped (inputs unchanged)")
+
+
+def get() -> FileOutput:
+    if FileOutput.instance is None:
+        init()
+    return FileOutput.instance
+
+
+def init():
+    FileOutput.instance = FileOutput()
+
+
+def write(file_name: str, content: str) -> bool:
+    return get().write(file_name, content)
+
+
+def write_stream(file_name: str, chunks: Iterable[str]) -> bool:
+    return get().write_stream(file_name, chunks)
+
+
+def report():
+    get().report()
@@ -4,9 +4,10 @@ from typing import List, Optional
 from prance import ResolvingParser
 
 from caffoa.content_parser import ContentParser
-from caffoa.converter import to_camelcase, parse_type, is_primitive
-from caffoa.model import EndPoint, Parameter, Response
-from caffoa.object_parser import BaseObjectParser
+from caffoa.converter import to_camelcase, parse_type
+from caffoa.model import BodyConfig, EndPoint, Parameter, Response
+from caffoa.naming import NameIndex
+from caffoa.ref_resolver import LocalRefResolver
 
 
 class PathParser:
@@ -14,65 +15,34 @@ class PathParser:
         self.suffix = ""
         self.prefix = ""
         self.parser = parser
-        self.responses = dict()
-        self.bodies = dict()
         self.known_types = dict()
+        self.names: Optional[NameIndex] = None
+        self.refs: Optional[LocalRefResolver] = None
 
-    def create_returns(self, model_parser: ResolvingParser):
-        for path, options in model_parser.specification['paths'].items():
-            for operation, config in options.items():
-                operation = operation.lower()
-                if operation in ["parameters"]:
-                    continue
-                if "operationId" not in config:
-                    raise Warning(f"operationId is missing for {path}: {operation}")
-                operation_id = config["operationId"]
-                code = None
-                try:
-                    responses = list()
-                    for code, data in config.get("responses").items():
-                        if "$ref" in data:
-                            ref = data["$ref"].split('/')[-1]
-                            data = model_parser.specification['components']['responses'][ref]
-                        response = Response(code)
-                        response.content = self.parse_content(data)
-                        responses.append(response)
-                    self.responses[operation_id] = responses
+    def content_parser(self) -> ContentParser:
+        if self.names is None:
+            self.names = NameIndex(self.parser.specification)
+        naming = self.names.naming(self.prefix, self.suffix)
+        return ContentParser(self.known_types, self.prefix, self.suffix, naming)
 
-                except Warning as msg:
-                    logging.warning(
-                        f"Cannot generate typed responses for {msg} for {operation_id} ({path}): {operation}/{code}")
-
-    def create_bodies(self, model_parser: ResolvingParser):
+    def one_of_schemas(self) -> dict:
         one_of_schemas = dict()
-        for name, schema in model_parser.specification['components'].get("schemas", dict()).items():
+        for name, schema in self.parser.specification['components'].get("schemas", dict()).items():
             if "oneOf" in schema:
                 one_of_schemas[name] = schema
+        return one_of_schemas
 
-        for path, options in model_parser.specification['paths'].items():
-            for operation, config in options.items():
-                operation = operation.lower()
-                if operation in ["parameters"]:
-                    continue
-                if "operationId" not in config:
-                    raise Warning(f"operationId is missing for {path}: {operation}")
-                operation_id = config["operationId"]
-                if "requestBody" in config:
-                    try:
-                        self.bodies[operation_id] = ContentParser(self.known_types, self.prefix,
-                                                                  self.suffix).parse_content_list(config["requestBody"],
-                                                                                                  one_of_schemas)
-                    except Warning as msg:
-                        logging.warning(
-                            f"Cannot generate typed requestBody for {msg} for {operation_id} ({path}): {operation}")
-
-    def parse_content(self, config: dict) -> Optional[str]:
-        return ContentParser(self.known_types, self.prefix, self.suffix).parse_content_string(config)
-
-    def parse(self) -> List[EndPoint]:
+    def parse(self, typed: bool = False) -> List[EndPoint]:
+        """
+        walks the paths once and returns the complete endpoints.
+        With typed=True, responses and request bodies are parsed in the same pass.
+        """
         endpoints = list()
-        for path, options in self.parser.specification['paths'].items():
-            path = str(path).strip('/')
+        content_parser = self.content_parser() if typed else None
+        one_of_schemas = self.one_of_schemas() if typed else None
+        for raw_path, options in self.parser.specification['paths'].items():
+            path = str(raw_path).strip('/')
+            options = self.resolve(options)
             base_parameters = list()
             if "parameters" in options:
                 base_parameters = self.parse_params(options["parameters"])
@@ -85,27 +55,65 @@ class PathParser:
                 operation_id = config['operationId']
                 operation_name = self.operation_name(operation_id)
                 documentation = config['description'].split("\n")
-                for response, response_data in config["responses"].items():
-                    documentation.append(f"{response} -> {response_data['description']}")
+                responses = dict()
+                for code, response_data in config["responses"].items():
+                    response_data = self.resolve(response_data)
+                    responses[code] = response_data
+                    documentation.append(f"{code} -> {response_data['description']}")
 
                 parameters = base_parameters.copy()
                 if "parameters" in config:
                     parameters.extend(self.parse_params(config["parameters"]))
                 needs_content = "requestBody" in config
                 ep = EndPoint(operation_id, operation_name, path, operation, parameters, documentation, needs_content)
-                ep.responses = self.responses.get(operation_id)
-                ep.body = self.bodies.get(operation_id)
+                ep.tags = list(config.get("tags", list()))
+                if typed:
+                    ep.responses = self.parse_responses(content_parser, responses, raw_path, operation, operation_id)
+                    if needs_content:
+                        ep.body = self.parse_body(content_parser, config["requestBody"], one_of_schemas, raw_path,
+                                                  operation, operation_id)
                 endpoints.append(ep)
         return endpoints
 
+    @staticmethod
+    def parse_responses(content_parser: ContentParser, responses: dict, path: str, operation: str,
+                        operation_id: str) -> Optional[List[Response]]:
+        code = None
+        try:
+            result = list()
+            for code, data in responses.items():
+                response = Response(code)
+                response.content = content_parser.parse_content_string(data)
+                result.append(response)
+            return result
+        except Warning as msg:
+            logging.warning(
+                f"Cannot generate typed responses for {msg} for {operation_id} ({path}): {operation}/{code}")
+            return None
+
+    def parse_body(self, content_parser: ContentParser, body: dict, one_of_schemas: dict, path: str, operation: str,
+                   operation_id: str) -> Optional[BodyConfig]:
+        try:
+            return content_parser.parse_content_list(self.resolve(body), one_of_schemas)
+        except Warning as msg:
+            logging.warning(
+                f"Cannot generate typed requestBody for {msg} for {operation_id} ({path}): {operation}")
+            return None
+
     @staticmethod
     def operation_name(operation_id) -> str:
         return to_camelcase(operation_id) + "Async"
 
-    @staticmethod
-    def parse_params(params: list) -> list:
+    def resolve(self, data: dict) -> dict:
+        if self.refs is None:
+            self.refs = LocalRefResolver(self.parser.specification)
+        return self.refs.resolve(data)
+
+    def parse_params(self, params: list) -> list:
         parameters = list()
         for param in params:
+            param = self.resolve(param)
             if param['in'].lower() == "path":
-                parameters.append(Parameter(param['name'], parse_type(param['schema']), param.get('description')))
+                schema = self.resolve(param['schema'])
+                parameters.append(Parameter(param['name'], parse_type(schema), param.get('description')))
         return parameters
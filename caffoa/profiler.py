@@ -0,0 +1,132 @@
+import json
+import logging
+import time
+import tracemalloc
+from typing import Optional, List
+
+
+class _Phase:
+    def __init__(self, name: str):
+        self.name = name
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+        self.children_wall = 0.0
+        self.children_cpu = 0.0
+        self.peak = 0
+
+
+class _NoProfile:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _ProfileContext:
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.start(self.name)
+        return self
+
+    def __exit__(self, *args):
+        self.profiler.stop()
+        return False
+
+
+class Profiler:
+    """
+    records wall time, cpu time and peak traced memory per service and phase.
+    Times of nested phases are only counted for the innermost phase, e.g. file I/O is not part of rendering.
+    """
+    instance = None
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.service = ""
+        self.stack: List[_Phase] = list()
+        self.results = dict()
+        self.trace_memory = enabled and hasattr(tracemalloc, "reset_peak")
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _current_peak(self) -> int:
+        return tracemalloc.get_traced_memory()[1] if self.trace_memory else 0
+
+    def _reset_peak(self):
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+    def start(self, name: str):
+        if self.stack:
+            self.stack[-1].peak = max(self.stack[-1].peak, self._current_peak())
+        self._reset_peak()
+        self.stack.append(_Phase(name))
+
+    def stop(self):
+        phase = self.stack.pop()
+        wall = time.perf_counter() - phase.start_wall
+        cpu = time.process_time() - phase.start_cpu
+        peak = max(phase.peak, self._current_peak())
+        if self.stack:
+            parent = self.stack[-1]
+            parent.children_wall += wall
+            parent.children_cpu += cpu
+            parent.peak = max(parent.peak, peak)
+            self._reset_peak()
+        self.add(self.service, phase.name, wall - phase.children_wall, cpu - phase.children_cpu, peak)
+
+    def add(self, service: str, name: str, wall: float, cpu: float, peak: int, calls: int = 1):
+        entry = self.results.setdefault(service, dict()).setdefault(name, dict(wall=0.0, cpu=0.0, peak=0, calls=0))
+        entry["wall"] += wall
+        entry["cpu"] += cpu
+        entry["peak"] = max(entry["peak"], peak)
+        entry["calls"] += calls
+
+    def merge(self, results: dict):
+        for service, phases in results.items():
+            for name, entry in phases.items():
+                self.add(service, name, entry["wall"], entry["cpu"], entry["peak"], entry["calls"])
+
+    def summary(self) -> str:
+        lines = [f"{'service':40} {'phase':25} {'calls':>6} {'wall [ms]':>10} {'cpu [ms]':>10} {'peak [MiB]':>11}"]
+        for service, phases in self.results.items():
+            for name, entry in phases.items():
+                lines.append(f"{service[-40:]:40} {name:25} {entry['calls']:6} {entry['wall'] * 1000:10.1f} "
+                             f"{entry['cpu'] * 1000:10.1f} {entry['peak'] / 1024 / 1024:11.2f}")
+        return "\n".join(lines)
+
+    def write_report(self, file_name: str):
+        with open(file_name, "w", encoding="utf-8") as f:
+            json.dump(dict(memory_traced=self.trace_memory, services=self.results), f, indent=2)
+        logging.info(f"Profile written to {file_name}\n{self.summary()}")
+
+
+def get() -> Profiler:
+    if Profiler.instance is None:
+        init(False)
+    return Profiler.instance
+
+
+def init(enabled: bool = True):
+    Profiler.instance = Profiler(enabled)
+
+
+def phase(name: str):
+    """
+    context manager that profiles the enclosed code as the given phase of the current service
+    """
+    if not get().enabled:
+        return _NoProfile()
+    return _ProfileContext(get(), name)
+
+
+def set_service(name: str):
+    get().service = name
+
+
+def results() -> Optional[dict]:
+    return get().results if get().enabled else None
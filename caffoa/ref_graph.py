@@ -0,0 +1,76 @@
+from typing import Dict, Iterable, Iterator, Optional, Set
+
+from caffoa.ref_resolver import unescape_pointer
+
+COMPONENTS_PREFIX = "#/components/"
+
+
+def component_refs(data) -> Iterator[str]:
+    """
+    yields the components (as 'section/name', e.g. 'schemas/user') that are referenced locally in data
+    """
+    todo = [data]
+    while todo:
+        item = todo.pop()
+        if isinstance(item, dict):
+            ref = item.get("$ref")
+            if isinstance(ref, str) and ref.startswith(COMPONENTS_PREFIX):
+                parts = ref[len(COMPONENTS_PREFIX):].split("/")
+                if len(parts) >= 2:
+                    yield f"{parts[0]}/{unescape_pointer(parts[1])}"
+            todo.extend(item.values())
+        elif isinstance(item, list):
+            todo.extend(item)
+
+
+class RefGraph:
+    """
+    graph of the local references between the components of an unresolved spec.
+    References to other files are not followed, they are translated when the spec is resolved.
+    """
+
+    def __init__(self, specification: dict):
+        self.edges: Dict[str, Set[str]] = dict()
+        for section, components in specification.get("components", dict()).items():
+            if not isinstance(components, dict):
+                continue
+            for name, component in components.items():
+                self.edges[f"{section}/{name}"] = set(component_refs(component))
+
+    def closure(self, seeds: Iterable[str]) -> Set[str]:
+        """
+        returns the seeds and all components they reference, directly or indirectly
+        """
+        result = set()
+        todo = list(seeds)
+        while todo:
+            node = todo.pop()
+            if node in result:
+                continue
+            result.add(node)
+            todo.extend(self.edges.get(node, set()))
+        return result
+
+
+def prune_spec(specification: dict, schemas: Optional[Iterable[str]], paths: bool) -> Optional[dict]:
+    """
+    returns a copy of the spec that only contains the given schemas, the paths (if needed)
+    and everything they reference. Returns None if a schema is not defined in the spec itself.
+    """
+    graph = RefGraph(specification)
+    seeds = set()
+    for name in schemas or list():
+        if f"schemas/{name}" not in graph.edges:
+            return None
+        seeds.add(f"schemas/{name}")
+    if paths:
+        seeds.update(component_refs(specification.get("paths", dict())))
+    needed = graph.closure(seeds)
+    pruned = dict(specification)
+    pruned["paths"] = specification.get("paths", dict()) if paths else dict()
+    components = dict(specification.get("components", dict()))
+    if isinstance(components.get("schemas"), dict):
+        components["schemas"] = {name: schema for name, schema in components["schemas"].items()
+                                 if f"schemas/{name}" in needed}
+    pruned["components"] = components
+    return pruned
@@ -0,0 +1,89 @@
+from typing import Dict
+
+TRANSLATED_MARKER = ".yml_schemas_"
+SCHEMA_PREFIX = "#/components/schemas/"
+
+
+def unescape_pointer(part: str) -> str:
+    return part.replace("~1", "/").replace("~0", "~")
+
+
+def escape_pointer(part: str) -> str:
+    return part.replace("~", "~0").replace("/", "~1")
+
+
+def rename_translated_schemas(specification: dict) -> Dict[str, str]:
+    """
+    prance names translated external schemas after their file (e.g. 'base.openapi.yml_schemas_address').
+    Renames them to their original name, and updates all references to them. Returns the renamed schemas.
+    """
+    schemas = specification.get("components", dict()).get("schemas")
+    if not isinstance(schemas, dict):
+        return dict()
+    renamed = dict()
+    for class_name in list(schemas.keys()):
+        if TRANSLATED_MARKER in class_name:
+            new_class_name = class_name.split(TRANSLATED_MARKER)[-1]
+            schemas[new_class_name] = schemas[class_name]
+            del schemas[class_name]
+            renamed[SCHEMA_PREFIX + escape_pointer(class_name)] = SCHEMA_PREFIX + escape_pointer(new_class_name)
+    if renamed:
+        seen = set()
+        todo = [specification]
+        while todo:
+            item = todo.pop()
+            if id(item) in seen:
+                continue  # translated schemas are shared between all places that reference them
+            seen.add(id(item))
+            if isinstance(item, dict):
+                ref = item.get("$ref")
+                if isinstance(ref, str) and ref in renamed:
+                    item["$ref"] = renamed[ref]
+                todo.extend(value for value in item.values() if isinstance(value, (dict, list)))
+            elif isinstance(item, list):
+                todo.extend(value for value in item if isinstance(value, (dict, list)))
+    return renamed
+
+
+class LocalRefResolver:
+    """
+    follows local references (#/...) in a specification on demand. Each reference is resolved only once.
+    External references are expected to be translated into the specification already.
+    """
+
+    def __init__(self, specification: dict):
+        self.specification = specification
+        self.resolved: Dict[str, dict] = dict()
+
+    def resolve(self, data: dict) -> dict:
+        """
+        returns data, or the object it references if it is a local reference
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("$ref"), str) or not data["$ref"].startswith("#/"):
+            return data
+        ref = data["$ref"]
+        result = self.resolved.get(ref)
+        if result is None:
+            result = self._follow(ref)
+            self.resolved[ref] = result
+        return result
+
+    def _follow(self, ref: str) -> dict:
+        seen = set()
+        data = {"$ref": ref}
+        while isinstance(data, dict) and "$ref" in data and str(data["$ref"]).startswith("#/"):
+            ref = data["$ref"]
+            if ref in self.resolved:
+                return self.resolved[ref]
+            if ref in seen:
+                raise Warning(f"circular reference {ref}")
+            seen.add(ref)
+            node = self.specification
+            for part in ref[2:].split('/'):
+                try:
+                    node = node[unescape_pointer(part)] if not isinstance(node, list) else node[int(part)]
+                except (KeyError, IndexError, TypeError, ValueError):
+                    raise Warning(f"cannot resolve reference {ref}")
+            data = node
+        return data
+
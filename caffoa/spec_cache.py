@@ -0,0 +1,144 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from typing import Any, Iterator, Optional, List
+
+import prance
+import yaml
+
+from caffoa import loaders
+
+CACHE_FORMAT = 2
+
+
+class CachedParser:
+    """
+    stand-in for a prance parser that was restored from the cache or resolved without prance's parser.
+    Only the specification is available.
+    """
+
+    def __init__(self, specification: dict):
+        self.specification = specification
+
+
+class SpecCache:
+    """
+    stores resolved specifications on disk. Entries are keyed by the content of the spec and every file it
+    references, so any change in one of the files results in a new entry.
+    """
+
+    def __init__(self, folder: str = ".caffoa-cache", max_size_mb: float = 100):
+        self.folder = folder
+        self.max_size = int(max_size_mb * 1024 * 1024)
+
+    @staticmethod
+    def referenced_files(path: str) -> Optional[List[str]]:
+        """
+        returns the spec file and all files it references (recursively).
+        Returns None if the spec references http resources, as these cannot be hashed without fetching them,
+        or if one of the files cannot be read or parsed. Resolving reports the error in that case.
+        """
+        files = list()
+        todo = [os.path.abspath(path)]
+        while todo:
+            current = todo.pop()
+            if current in files:
+                continue
+            files.append(current)
+            try:
+                with open(current, "r", encoding="utf-8") as f:
+                    document = loaders.parse_spec(f.read(), current)
+            except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError):
+                return None
+            for ref in SpecCache._refs(document):
+                ref = ref.split("#", 1)[0]
+                if not ref:
+                    continue  # local reference
+                if "://" in ref:
+                    return None
+                todo.append(os.path.abspath(os.path.join(os.path.dirname(current), ref)))
+        return files
+
+    @staticmethod
+    def _refs(data: Any) -> Iterator[str]:
+        """
+        yields the values of all $ref keys of a parsed document
+        """
+        todo = [data]
+        while todo:
+            current = todo.pop()
+            if isinstance(current, dict):
+                ref = current.get("$ref")
+                if isinstance(ref, str):
+                    yield ref
+                todo.extend(current.values())
+            elif isinstance(current, list):
+                todo.extend(current)
+
+    def key(self, path: str, options: str) -> Optional[str]:
+        files = self.referenced_files(path)
+        if files is None:
+            return None
+        sha = hashlib.sha256(f"{CACHE_FORMAT}|{prance.__version__}|{options}".encode("utf-8"))
+        for file in sorted(files):
+            sha.update(file.encode("utf-8"))
+            with open(file, "rb") as f:
+                sha.update(hashlib.sha256(f.read()).digest())
+        return sha.hexdigest()
+
+    def _file_name(self, key: str) -> str:
+        return os.path.join(self.folder, f"{key}.pickle")
+
+    def load(self, key: Optional[str]) -> Optional[dict]:
+        if key is None:
+            return None
+        file_name = self._file_name(key)
+        try:
+            with open(file_name, "rb") as f:
+                specification = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Ignoring broken cache entry {file_name}: {e}")
+            return None
+        os.utime(file_name)  # mark as recently used
+        return specification
+
+    def store(self, key: Optional[str], specification: dict):
+        if key is None:
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(specification, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, self._file_name(key))
+        except Exception:
+            os.unlink(temp_name)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        removes the least recently used entries until the cache is below its maximum size
+        """
+        entries = list()
+        for entry in os.scandir(self.folder):
+            if entry.name.endswith(".pickle"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            logging.info(f"Removing cache entry {path}")
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # removed by a parallel run
+            total -= size
@@ -0,0 +1,125 @@
+import os
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, List, Tuple
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+class Template:
+    """
+    a template in str.format syntax that is compiled once into a render function.
+    Supports the same calls as str (format and format_map), so it can be used as a drop-in replacement.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._render = self._compile(text)
+
+    @staticmethod
+    def _compile(text: str):
+        literals = list()
+        fields = list()
+        for literal, field, spec, conversion in Formatter().parse(text):
+            if literal:
+                literals.append(literal)
+                fields.append(f"{{_literals[{len(literals) - 1}]}}")
+            if field is None:
+                continue
+            if not field.isidentifier() or (spec and "{" in spec):
+                # nested or indexed fields are not used by caffoa templates; fall back to str.format
+                return lambda values: text.format_map(values)
+            conversion = f"!{conversion}" if conversion else ""
+            spec = f":{spec}" if spec else ""
+            fields.append(f"{{_values[{field!r}]{conversion}{spec}}}")
+        source = f'def render(_values, _literals=_literals):\n    return f"{"".join(fields)}"\n'
+        namespace = dict(_literals=tuple(literals))
+        exec(compile(source, "<caffoa template>", "exec"), namespace)
+        return namespace["render"]
+
+    def sections(self, field: str) -> Tuple["Template", "Template"]:
+        """
+        splits the template at the first occurrence of {field} into a header and a footer template,
+        so that the content of the field can be streamed in between.
+        """
+        return _split(self.text, field)
+
+    def format(self, **kwargs) -> str:
+        return self._render(kwargs)
+
+    def format_map(self, mapping: dict) -> str:
+        return self._render(mapping)
+
+    def __str__(self):
+        return self.text
+
+
+@lru_cache(maxsize=None)
+def _split(text: str, field: str) -> Tuple[Template, Template]:
+    # memoized outside of the template, so that the template attributes (which are part of the
+    # inputs hash of the writers) do not depend on what was rendered before
+    parts = [list(), list()]
+    current = 0
+    for literal, name, spec, conversion in Formatter().parse(text):
+        parts[current].append(literal.replace("{", "{{").replace("}", "}}"))
+        if name is None:
+            continue
+        if name == field and current == 0:
+            current = 1
+            continue
+        conversion = f"!{conversion}" if conversion else ""
+        spec = f":{spec}" if spec else ""
+        parts[current].append(f"{{{name}{conversion}{spec}}}")
+    return Template("".join(parts[0])), Template("".join(parts[1]))
+
+
+class TemplateRegistry:
+    """
+    process wide registry of compiled templates. Each template is loaded and compiled only once.
+    Templates in override folders take precedence over the templates shipped with caffoa.
+    """
+    instance = None
+
+    def __init__(self):
+        self.override_folders = list()
+        self.templates: Dict[Tuple[int, str], Template] = dict()
+
+    def add_override_folder(self, folder: str):
+        folder = os.path.abspath(folder)
+        if folder not in self.override_folders:
+            self.override_folders.append(folder)
+            self.templates.clear()
+
+    def search_path(self, version: int) -> List[str]:
+        folders = list()
+        for folder in self.override_folders:
+            folders.extend([os.path.join(folder, f"v{version}"), folder])
+        folders.extend([os.path.join(DATA_FOLDER, f"v{version}"), os.path.join(DATA_FOLDER, "base")])
+        return folders
+
+    def get(self, version: int, name: str) -> Template:
+        key = (version, name)
+        template = self.templates.get(key)
+        if template is None:
+            for folder in self.search_path(version):
+                path = os.path.join(folder, name)
+                if os.path.exists(path):
+                    break
+            with open(path, "r", encoding="utf-8") as f:
+                template = Template(f.read())
+            self.templates[key] = template
+        return template
+
+
+def get() -> TemplateRegistry:
+    if TemplateRegistry.instance is None:
+        TemplateRegistry.instance = TemplateRegistry()
+    return TemplateRegistry.instance
+
+
+def load(version: int, name: str) -> Template:
+    return get().get(version, name)
+
+
+def add_override_folder(folder: str):
+    get().add_override_folder(folder)
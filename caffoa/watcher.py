@@ -0,0 +1,119 @@
+import logging
+import os
+import time
+from argparse import Namespace
+from typing import Dict, List, Optional
+
+from caffoa.generator import load_config, create_cache, create_handler, generate
+from caffoa.openapi_file import OpenApiFile
+from caffoa.spec_cache import SpecCache
+
+POLL_INTERVAL = 0.5
+
+
+class Watcher:
+    """
+    keeps configs, resolved specs and parsed services in memory, and regenerates when files change.
+    Only services whose spec files changed are resolved and parsed again, all others are written from memory.
+    If the config changes, all services are parsed again, but specs whose files did not change are not resolved again.
+    Unchanged files are skipped by the manifest, so a regeneration only touches the affected files.
+    """
+
+    def __init__(self, args: Namespace):
+        self.args = args
+        self.services = list()
+        self.settings = dict()
+        self.cache = None
+        self.handlers: List[OpenApiFile] = list()
+        self.watched: Dict[str, int] = dict()
+
+    @staticmethod
+    def _mtime(file_name: str) -> int:
+        try:
+            return os.stat(file_name).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def spec_files(handler: OpenApiFile) -> List[str]:
+        try:
+            files = SpecCache.referenced_files(handler.name)
+        except OSError:
+            files = None
+        return files if files else [os.path.abspath(handler.name)]
+
+    def create_handler(self, number: int, config: dict, settings: dict, cache: Optional[SpecCache],
+                       previous: List[OpenApiFile]) -> OpenApiFile:
+        """
+        creates the handler of a service, that keeps its resolved spec in memory.
+        The resolved spec of a previous handler for the same file is re-used
+        """
+        handler = create_handler(number, config, settings, cache)
+        handler.keep_resolved = True
+        for candidate in previous:
+            if handler.reuse_resolved(candidate, config):
+                logging.info(f"Using resolved {handler.name} from memory")
+                break
+        return handler
+
+    def load(self, changed: Optional[List[str]] = None):
+        """
+        loads the config. Resolved specs of the current handlers are re-used, unless one of their files changed
+        """
+        changed = changed if changed else list()
+        previous = [handler for handler in self.handlers
+                    if not any(file_name in changed for file_name in self.spec_files(handler))]
+        services, settings = load_config(self.args.config)
+        cache = create_cache(settings, self.args)
+        handlers = [self.create_handler(number, config, settings, cache, previous)
+                    for number, config in enumerate(services)]
+        self.services, self.settings, self.cache, self.handlers = services, settings, cache, handlers
+
+    def update_watched(self, known: Dict[str, int] = None):
+        """
+        collects the files to watch. For files in known, the passed modification time is kept.
+        """
+        known = known if known else dict()
+        files = [os.path.abspath(self.args.config)]
+        for handler in self.handlers:
+            files.extend(self.spec_files(handler))
+        self.watched = {file_name: known.get(file_name, self._mtime(file_name)) for file_name in files}
+
+    def changed_files(self) -> List[str]:
+        return [file_name for file_name, mtime in self.watched.items() if self._mtime(file_name) != mtime]
+
+    def regenerate(self, changed: List[str]):
+        if os.path.abspath(self.args.config) in changed:
+            logging.info(f"{self.args.config} changed, reloading all services")
+            self.load(changed)
+        else:
+            for number, handler in enumerate(self.handlers):
+                if any(file_name in changed for file_name in self.spec_files(handler)):
+                    logging.info(f"{handler.name} changed")
+                    self.handlers[number] = self.create_handler(number, self.services[number], self.settings,
+                                                                self.cache, list())
+        generate(self.handlers, self.services, self.settings, self.args)
+
+    def run(self):
+        try:
+            self.load()
+            generate(self.handlers, self.services, self.settings, self.args)
+        except Exception as e:
+            logging.exception(f"Generation failed: {e}")
+        self.update_watched()
+        logging.info(f"Watching {len(self.watched)} files for changes. Press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(POLL_INTERVAL)
+                changed = self.changed_files()
+                if not changed:
+                    continue
+                # note the state before generating, so that changes during generation trigger another run
+                before = {file_name: self._mtime(file_name) for file_name in self.watched}
+                try:
+                    self.regenerate(changed)
+                except Exception as e:
+                    logging.exception(f"Generation failed: {e}")
+                self.update_watched(before)
+        except KeyboardInterrupt:
+            logging.info("Stopped watching")
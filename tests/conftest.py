@@ -0,0 +1,77 @@
+import os
+import shutil
+from typing import List
+
+import pytest
+import yaml
+
+from caffoa import execute
+from caffoa.base_writer import BaseWriter
+
+SPEC_FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+
+class Generator:
+    """
+    runs caffoa in a temporary folder on a copy of the test specs, and records which files were rendered
+    """
+
+    def __init__(self, folder: str, monkeypatch):
+        self.folder = folder
+        self.rendered: List[str] = list()
+        for name in ("openapi.yml", "base.openapi.yml"):
+            shutil.copy(os.path.join(SPEC_FOLDER, name), os.path.join(folder, name))
+        monkeypatch.chdir(folder)
+        original_write, original_write_stream = BaseWriter.write_file, BaseWriter.write_file_stream
+
+        def write_file(file_name, *args, **kwargs):
+            self.rendered.append(os.path.relpath(file_name, folder).replace(os.sep, "/"))
+            return original_write(file_name, *args, **kwargs)
+
+        def write_file_stream(file_name, *args, **kwargs):
+            self.rendered.append(os.path.relpath(file_name, folder).replace(os.sep, "/"))
+            return original_write_stream(file_name, *args, **kwargs)
+
+        monkeypatch.setattr(BaseWriter, "write_file", staticmethod(write_file))
+        monkeypatch.setattr(BaseWriter, "write_file_stream", staticmethod(write_file_stream))
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.folder, name)
+
+    def run(self, config: dict, *args: str, cache: bool = False, config_file: str = "caffoa.yml") -> List[str]:
+        """
+        generates with the given config, and returns the files that were rendered
+        """
+        for service in config["services"]:
+            if "function" in service:
+                os.makedirs(self.path(os.path.join(service["function"]["targetFolder"], "Errors")), exist_ok=True)
+        with open(self.path(config_file), "w", encoding="utf-8") as f:
+            yaml.safe_dump(config, f)
+        self.rendered = list()
+        execute(["--config", config_file] + ([] if cache else ["--no-cache"]) + list(args))
+        return sorted(self.rendered)
+
+    def files(self) -> List[str]:
+        result = list()
+        for root, _, names in os.walk(self.path("demo")):
+            result.extend(os.path.relpath(os.path.join(root, name), self.folder).replace(os.sep, "/")
+                          for name in names)
+        return sorted(result)
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch) -> Generator:
+    return Generator(str(tmp_path), monkeypatch)
+
+
+def demo_config(version: int = 3, **function) -> dict:
+    """
+    the config of the demo for the given version, with additional function settings
+    """
+    name = f"DemoV{version}"
+    function_config = dict(targetFolder=f"demo/{name}", namespace=name, name=name)
+    function_config.update(function)
+    return dict(config=dict(version=version, duplicates="once", clearGeneratedFiles=True),
+                services=[dict(apiPath="openapi.yml",
+                               model=dict(namespace=f"{name}.Model", targetFolder=f"demo/{name}/Model"),
+                               function=function_config)])
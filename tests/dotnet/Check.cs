@@ -0,0 +1,49 @@
+using System;
+using System.Threading.Tasks;
+
+namespace CaffoaTests
+{
+    /// <summary>
+    /// minimal assertions. Failures are printed, and the process exits with 1 if any check failed
+    /// </summary>
+    public static class Check
+    {
+        public static int Failures { get; private set; }
+
+        public static void Equal<T>(T expected, T actual, string message)
+        {
+            if (Equals(expected, actual))
+                return;
+            Failures++;
+            Console.WriteLine($"FAILED {message}: expected '{expected}', got '{actual}'");
+        }
+
+        public static void True(bool condition, string message) => Equal(true, condition, message);
+
+        public static async Task Throws<TException>(Func<Task> action, string message) where TException : Exception
+        {
+            try
+            {
+                await action();
+            }
+            catch (TException)
+            {
+                return;
+            }
+            catch (Exception e)
+            {
+                Failures++;
+                Console.WriteLine($"FAILED {message}: expected {typeof(TException).Name}, got {e.GetType().Name}: {e.Message}");
+                return;
+            }
+            Failures++;
+            Console.WriteLine($"FAILED {message}: expected {typeof(TException).Name}, nothing was thrown");
+        }
+
+        public static int Result()
+        {
+            Console.WriteLine(Failures == 0 ? "all checks passed" : $"{Failures} checks failed");
+            return Failures == 0 ? 0 : 1;
+        }
+    }
+}
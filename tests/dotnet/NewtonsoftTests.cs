@@ -0,0 +1,124 @@
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Threading.Tasks;
+using CaffoaTests.Merge;
+using DemoV3;
+using Demov3.Errors;
+using DemoV3.Model;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace CaffoaTests
+{
+    public static class Program
+    {
+        public static async Task<int> Main()
+        {
+            await ParseJsonTests();
+            await ReadDiscriminatorTests();
+            MergeTests();
+            return Check.Result();
+        }
+
+        private static async Task ParseJsonTests()
+        {
+            const string body = "{\"type\": \"guest\", \"email\": \"guest@example.com\"}";
+            var request = Requests.Create(body);
+            var user = await DemoV3Functions.ParseJson<GuestUser>(request);
+            Check.Equal("guest@example.com", user.Email, "ParseJson reads a body that cannot be read synchronously");
+            Check.Equal(body, await Requests.ReadAgain(request), "the parsed body can be read again");
+
+            user = await DemoV3Functions.ParseJson<GuestUser>(new AsyncOnlyStream(Encoding.UTF8.GetBytes(body)));
+            Check.Equal("guest@example.com", user.Email, "ParseJson(Stream) reads a stream that cannot be read synchronously");
+            user = await DemoV3Functions.ParseJson<GuestUser>(new MemoryStream(Encoding.UTF8.GetBytes(body)));
+            Check.Equal("guest@example.com", user.Email, "ParseJson(Stream) reads a memory stream");
+
+            foreach (var invalid in new[] { "", "  \n", "{\"email\": ", "{\"email\": \"e\"} x", "[1]" })
+            {
+                await Check.Throws<CaffoaJsonParseError>(() => DemoV3Functions.ParseJson<GuestUser>(Requests.Create(invalid)),
+                    $"ParseJson rejects '{invalid}'");
+                await Check.Throws<CaffoaJsonParseError>(
+                    () => DemoV3Functions.ParseJson<GuestUser>(new MemoryStream(Encoding.UTF8.GetBytes(invalid))),
+                    $"ParseJson(Stream) rejects '{invalid}'");
+            }
+        }
+
+        private static async Task ReadDiscriminatorTests()
+        {
+            const string body = "{\"email\": \"e\", \"nested\": {\"type\": \"inner\"}, \"type\": \"guest\"}";
+            var request = Requests.Create(body);
+            Check.Equal("guest", await DemoV3Functions.ReadDiscriminator(request, "type"), "ReadDiscriminator skips nested objects");
+            var user = await DemoV3Functions.ParseJson<GuestUser>(request);
+            Check.Equal("e", user.Email, "ParseJson reads the body after ReadDiscriminator");
+            Check.Equal(null, await DemoV3Functions.ReadDiscriminator(Requests.Create("{\"email\": \"e\"}"), "type"),
+                "ReadDiscriminator returns null without discriminator");
+            await Check.Throws<CaffoaJsonParseError>(() => DemoV3Functions.ReadDiscriminator(Requests.Create(""), "type"),
+                "ReadDiscriminator rejects an empty body");
+            await Check.Throws<CaffoaJsonParseError>(() => DemoV3Functions.ReadDiscriminator(Requests.Create("{\"email\":"), "type"),
+                "ReadDiscriminator rejects a truncated body");
+        }
+
+        private static Item CreateItem() => new Item
+        {
+            Id = "a", ID = 1, Label = "label", Count = 2, Tags = new List<string> { "x" },
+            Nested = new Nested { Street = "street", Number = 3 }, Owner = new Person { Name = "owner" }
+        };
+
+        private static void MergeTests()
+        {
+            var item = CreateItem();
+            item.MergeWithItem(JToken.Parse("{\"label\": \"changed\", \"nested\": {\"number\": 4}}"));
+            Check.Equal("changed", item.Label, "a present field is merged");
+            Check.Equal("a", item.Id, "a missing field is kept");
+            Check.Equal(2, item.Count, "a missing value type is kept");
+            Check.Equal("street", item.Nested.Street, "a nested object is merged, not replaced");
+            Check.Equal(4, item.Nested.Number, "a nested field is merged");
+
+            item = CreateItem();
+            item.MergeWithItem(JToken.Parse("{\"id\": \"b\", \"ID\": 5}"));
+            Check.Equal("b", item.Id, "id is matched exactly");
+            Check.Equal(5, item.ID, "ID is matched exactly");
+            item.MergeWithItem(JToken.Parse("{\"LABEL\": \"upper\", \"Id\": \"c\", \"unknown\": 1}"));
+            Check.Equal("upper", item.Label, "a name that only differs in case is merged");
+            Check.Equal("c", item.Id, "the first matching name is used, like in deserialization");
+            Check.Equal(5, item.ID, "ID is not changed by a case-insensitive match of id");
+            Check.Equal(JsonConvert.DeserializeObject<Item>("{\"Id\": \"c\"}").Id, item.Id,
+                "merge matches names like deserialization");
+
+            item = CreateItem();
+            item.MergeWithItem(JToken.Parse("{\"label\": null, \"nested\": null, \"owner\": null}"));
+            Check.Equal(null, item.Label, "null replaces a value by default");
+            Check.Equal(null, item.Nested, "null replaces a nested object by default");
+            Check.Equal(null, item.Owner, "null replaces an interface by default");
+            item = CreateItem();
+            var ignoreNull = new JsonMergeSettings { MergeNullValueHandling = MergeNullValueHandling.Ignore };
+            item.MergeWithItem(JToken.Parse("{\"label\": null, \"nested\": {\"street\": null}, \"owner\": null}"), ignoreNull);
+            Check.Equal("label", item.Label, "null is ignored with MergeNullValueHandling.Ignore");
+            Check.Equal("street", item.Nested.Street, "a nested null is ignored with MergeNullValueHandling.Ignore");
+            Check.True(item.Owner != null, "a null interface is ignored with MergeNullValueHandling.Ignore");
+
+            item = CreateItem();
+            item.MergeWithItem(new Item { Label = "other", Nested = new Nested { Number = 7 }, Owner = new Company { Title = "c" } },
+                ignoreNull);
+            Check.Equal("other", item.Label, "a field of the object is merged");
+            Check.Equal("a", item.Id, "a null field of the object is ignored with MergeNullValueHandling.Ignore");
+            Check.Equal("street", item.Nested.Street, "a nested object of the object is merged, not replaced");
+            Check.Equal(7, item.Nested.Number, "a nested field of the object is merged");
+            Check.True(item.Owner is Company, "an interface is replaced");
+            item = CreateItem();
+            item.MergeWithItem(new Item(), ignoreNull);
+            Check.True(item.Owner is Person, "a null interface of the object is ignored with MergeNullValueHandling.Ignore");
+            item.MergeWithItem(new Item());
+            Check.Equal(null, item.Label, "a null field of the object replaces the value by default");
+            Check.Equal(null, item.Owner, "a null interface of the object replaces the value by default");
+
+            var named = new NamedItem { Name = "name", Id = "a", Nested = new Nested { Street = "street" } };
+            named.MergeWithNamedItem(JToken.Parse("{\"NAME\": \"n\", \"ID\": 3, \"nested\": {\"number\": 1}}"));
+            Check.Equal("n", named.Name, "a derived field is matched case-insensitively");
+            Check.Equal(3, named.ID, "an inherited field is matched exactly");
+            Check.Equal("a", named.Id, "an inherited field is not matched case-insensitively if another matches exactly");
+            Check.Equal("street", named.Nested.Street, "an inherited nested object is merged");
+        }
+    }
+}
@@ -0,0 +1,66 @@
+using System;
+using System.IO;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+
+namespace CaffoaTests
+{
+    /// <summary>
+    /// a request body like the one of kestrel with AllowSynchronousIO disabled: it cannot seek or be read synchronously
+    /// </summary>
+    public class AsyncOnlyStream : Stream
+    {
+        private readonly MemoryStream _inner;
+
+        public AsyncOnlyStream(byte[] data)
+        {
+            _inner = new MemoryStream(data);
+        }
+
+        public override bool CanRead => true;
+        public override bool CanSeek => false;
+        public override bool CanWrite => false;
+        public override long Length => throw new NotSupportedException();
+
+        public override long Position
+        {
+            get => throw new NotSupportedException();
+            set => throw new NotSupportedException();
+        }
+
+        public override int Read(byte[] buffer, int offset, int count) =>
+            throw new InvalidOperationException("Synchronous operations are disallowed");
+
+        public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken) =>
+            _inner.ReadAsync(buffer, offset, count, cancellationToken);
+
+        public override ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default) =>
+            _inner.ReadAsync(buffer, cancellationToken);
+
+        public override void Flush() { }
+        public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+        public override void SetLength(long value) => throw new NotSupportedException();
+        public override void Write(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+    }
+
+    public static class Requests
+    {
+        public static HttpRequest Create(string body)
+        {
+            var bytes = Encoding.UTF8.GetBytes(body);
+            var context = new DefaultHttpContext();
+            context.Request.Body = new AsyncOnlyStream(bytes);
+            context.Request.ContentLength = bytes.Length;
+            return context.Request;
+        }
+
+        public static async Task<string> ReadAgain(HttpRequest request)
+        {
+            request.Body.Position = 0;
+            using var reader = new StreamReader(request.Body, Encoding.UTF8, false, 1024, leaveOpen: true);
+            return await reader.ReadToEndAsync();
+        }
+    }
+}
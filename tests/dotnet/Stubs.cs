@@ -0,0 +1,21 @@
+using System;
+
+// the attributes of the azure functions sdk that the generated functions use, so that the tests do not need the sdk
+namespace Microsoft.Azure.WebJobs
+{
+    public class FunctionNameAttribute : Attribute
+    {
+        public FunctionNameAttribute(string name) { }
+    }
+}
+
+namespace Microsoft.Azure.WebJobs.Extensions.Http
+{
+    public enum AuthorizationLevel { Anonymous, User, Function, System, Admin }
+
+    public class HttpTriggerAttribute : Attribute
+    {
+        public HttpTriggerAttribute(AuthorizationLevel level, params string[] methods) { }
+        public string Route { get; set; }
+    }
+}
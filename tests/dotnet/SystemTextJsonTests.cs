@@ -0,0 +1,94 @@
+using System.Collections.Generic;
+using System.Text.Json.Nodes;
+using System.Threading.Tasks;
+using CaffoaTests.Merge;
+using DemoV3;
+using Demov3.Errors;
+using DemoV3.Model;
+
+namespace CaffoaTests
+{
+    public static class Program
+    {
+        private static readonly DemoV3ModelJsonContext Context = DemoV3ModelJsonContext.Default;
+
+        public static async Task<int> Main()
+        {
+            await ParseJsonTests();
+            await ReadDiscriminatorTests();
+            MergeTests();
+            return Check.Result();
+        }
+
+        private static async Task ParseJsonTests()
+        {
+            const string body = "{\"type\": \"guest\", \"email\": \"guest@example.com\"}";
+            var request = Requests.Create(body);
+            var user = await DemoV3Functions.ParseJson(request, Context.GuestUser);
+            Check.Equal("guest@example.com", user.Email, "ParseJson reads a body that cannot be read synchronously");
+            Check.Equal(body, await Requests.ReadAgain(request), "the parsed body can be read again");
+
+            foreach (var invalid in new[] { "", "  \n", "{\"email\": ", "{\"email\": \"e\"} x", "[1]" })
+            {
+                await Check.Throws<CaffoaJsonParseError>(() => DemoV3Functions.ParseJson(Requests.Create(invalid), Context.GuestUser),
+                    $"ParseJson rejects '{invalid}'");
+            }
+        }
+
+        private static async Task ReadDiscriminatorTests()
+        {
+            const string body = "{\"email\": \"e\", \"nested\": {\"type\": \"inner\"}, \"type\": \"guest\"}";
+            var request = Requests.Create(body);
+            Check.Equal("guest", await DemoV3Functions.ReadDiscriminator(request, "type"), "ReadDiscriminator skips nested objects");
+            var user = await DemoV3Functions.ParseJson(request, Context.GuestUser);
+            Check.Equal("e", user.Email, "ParseJson reads the body after ReadDiscriminator");
+            Check.Equal(null, await DemoV3Functions.ReadDiscriminator(Requests.Create("{\"email\": \"e\"}"), "type"),
+                "ReadDiscriminator returns null without discriminator");
+            await Check.Throws<CaffoaJsonParseError>(() => DemoV3Functions.ReadDiscriminator(Requests.Create(""), "type"),
+                "ReadDiscriminator rejects an empty body");
+        }
+
+        private static Item CreateItem() => new Item
+        {
+            Id = "a", ID = 1, Label = "label", Count = 2, Tags = new List<string> { "x" },
+            Nested = new Nested { Street = "street", Number = 3 }, Owner = new Person { Name = "owner" }
+        };
+
+        private static void MergeTests()
+        {
+            var item = CreateItem();
+            item.MergeWithItem(JsonNode.Parse("{\"label\": \"changed\", \"nested\": {\"number\": 4}}"));
+            Check.Equal("changed", item.Label, "a present field is merged");
+            Check.Equal("a", item.Id, "a missing field is kept");
+            Check.Equal(2, item.Count, "a missing value type is kept");
+            Check.Equal("street", item.Nested.Street, "a nested object is merged, not replaced");
+            Check.Equal(4, item.Nested.Number, "a nested field is merged");
+
+            item = CreateItem();
+            item.MergeWithItem(JsonNode.Parse("{\"id\": \"b\", \"ID\": 5, \"unknown\": 1}"));
+            Check.Equal("b", item.Id, "id is matched exactly");
+            Check.Equal(5, item.ID, "ID is matched exactly");
+
+            item = CreateItem();
+            item.MergeWithItem(JsonNode.Parse("{\"label\": null, \"nested\": null, \"owner\": null}"));
+            Check.Equal(null, item.Label, "null replaces a value");
+            Check.Equal(null, item.Nested, "null replaces a nested object");
+            Check.Equal(null, item.Owner, "null replaces an interface");
+
+            item = CreateItem();
+            item.MergeWithItem(new Item { Label = "other", Nested = new Nested { Number = 7 }, Owner = new Company { Title = "c" } });
+            Check.Equal("other", item.Label, "a field of the object is merged");
+            Check.Equal(null, item.Id, "a null field of the object replaces the value");
+            Check.Equal(null, item.Nested.Street, "a nested object of the object is merged field by field");
+            Check.Equal(7, item.Nested.Number, "a nested field of the object is merged");
+            Check.True(item.Owner is Company, "an interface is replaced");
+
+            var named = new NamedItem { Name = "name", Id = "a", Nested = new Nested { Street = "street" } };
+            named.MergeWithNamedItem(JsonNode.Parse("{\"name\": \"n\", \"ID\": 3, \"nested\": {\"number\": 1}}"));
+            Check.Equal("n", named.Name, "a derived field is merged");
+            Check.Equal(3, named.ID, "an inherited field is merged");
+            Check.Equal("a", named.Id, "an inherited field that is not present is kept");
+            Check.Equal("street", named.Nested.Street, "an inherited nested object is merged");
+        }
+    }
+}
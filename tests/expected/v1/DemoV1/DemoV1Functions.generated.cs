@@ -0,0 +1,180 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading.Tasks;
+using System.Net.Http;
+using Microsoft.Azure.WebJobs;
+using Microsoft.Azure.WebJobs.Extensions.Http;
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+
+using DemoV1.Errors;
+
+namespace DemoV1
+{
+    /// AUTO GENERATED CLASS
+    /// implement a partial class that implements
+    /// public static IDemoV1Service Service(HttpRequestMessage req, ILogger log);
+    public static partial class DemoV1Functions
+    {
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UsersGetAsync")]
+        public static async Task<HttpResponseMessage> UsersGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "users")]
+            HttpRequestMessage req, ILogger log)
+        {
+            try {
+                try {
+				  return await Service(req, log).UsersGetAsync();
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UsersGetAsync";
+		        debugInformation["Route"] = "users";
+		        debugInformation["Operation"] = "get";
+		        debugInformation["Payload"] = await GetPayloadForExceptionLogging(req);
+		        
+		        log.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPostAsync")]
+        public static async Task<HttpResponseMessage> UserPostAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "post", Route = "users")]
+            HttpRequestMessage req, ILogger log)
+        {
+            try {
+                try {
+				  return await Service(req, log).UserPostAsync(req.Content);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserPostAsync";
+		        debugInformation["Route"] = "users";
+		        debugInformation["Operation"] = "post";
+		        debugInformation["Payload"] = await GetPayloadForExceptionLogging(req);
+		        
+		        log.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPutAsync")]
+        public static async Task<HttpResponseMessage> UserPutAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "put", Route = "users/{userId}")]
+            HttpRequestMessage req, string userId, ILogger log)
+        {
+            try {
+                try {
+				  return await Service(req, log).UserPutAsync(userId, req.Content);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserPutAsync";
+		        debugInformation["Route"] = "users/{userId}";
+		        debugInformation["Operation"] = "put";
+		        debugInformation["Payload"] = await GetPayloadForExceptionLogging(req);
+		        debugInformation["p_userId"] = userId.ToString();
+				
+		        log.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPatchAsync")]
+        public static async Task<HttpResponseMessage> UserPatchAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "patch", Route = "users/{userId}")]
+            HttpRequestMessage req, string userId, ILogger log)
+        {
+            try {
+                try {
+				  return await Service(req, log).UserPatchAsync(userId, req.Content);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserPatchAsync";
+		        debugInformation["Route"] = "users/{userId}";
+		        debugInformation["Operation"] = "patch";
+		        debugInformation["Payload"] = await GetPayloadForExceptionLogging(req);
+		        debugInformation["p_userId"] = userId.ToString();
+				
+		        log.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserGetAsync")]
+        public static async Task<HttpResponseMessage> UserGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "users/{userId}")]
+            HttpRequestMessage req, string userId, ILogger log)
+        {
+            try {
+                try {
+				  return await Service(req, log).UserGetAsync(userId);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserGetAsync";
+		        debugInformation["Route"] = "users/{userId}";
+		        debugInformation["Operation"] = "get";
+		        debugInformation["Payload"] = await GetPayloadForExceptionLogging(req);
+		        debugInformation["p_userId"] = userId.ToString();
+				
+		        log.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+        private static async Task<string> GetPayloadForExceptionLogging(HttpRequestMessage req)
+        {
+	        try
+	        {
+		        var bytes = await req.Content.ReadAsByteArrayAsync();
+		        if (bytes.Length > 0)
+		        {
+			        return Convert.ToBase64String(bytes);
+		        }
+
+		        return "no payload";
+	        }
+	        catch (Exception e)
+	        {
+		        return "error while reading payload: " + e.Message;
+	        }
+        }
+    }
+}
\ No newline at end of file
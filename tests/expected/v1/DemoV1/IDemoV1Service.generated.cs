@@ -0,0 +1,51 @@
+using System.IO;
+using System.Net.Http;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+
+namespace DemoV1
+{
+    /// AUTOGENERATED BY caffoa
+    /// <summary>
+    /// Interface for services to be implemented to serve the Function implementation
+    /// </summary>
+    public interface IDemoV1Service
+    {
+        /// <summary>
+        /// get information about the users
+		/// 200 -> return user object
+		/// 400 -> Error
+        /// </summary>
+        Task<HttpResponseMessage> UsersGetAsync();
+
+
+        /// <summary>
+        /// create or update a user without return test
+		/// 201 -> User was created
+        /// </summary>
+        Task<HttpResponseMessage> UserPostAsync(HttpContent contentPayload);
+
+
+        /// <summary>
+        /// create or update a user
+		/// 200 -> User was updated
+		/// 201 -> User was created
+        /// </summary>
+        Task<HttpResponseMessage> UserPutAsync(string userId, HttpContent contentPayload);
+
+
+        /// <summary>
+        /// update a user
+		/// 200 -> User was updated
+        /// </summary>
+        Task<HttpResponseMessage> UserPatchAsync(string userId, HttpContent contentPayload);
+
+
+        /// <summary>
+        /// get information about the users
+		/// 200 -> return user object
+        /// </summary>
+        Task<HttpResponseMessage> UserGetAsync(string userId);
+
+    }
+}
@@ -0,0 +1,8 @@
+
+namespace DemoV1.Model {
+    /// AUTOGENERED BY caffoa ///
+	
+    public interface AnyCompleteUser {
+        string Type { get; }
+    }
+}
@@ -0,0 +1,125 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using System.Collections.Immutable;
+using System.Linq;
+
+namespace DemoV1.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonObject(MemberSerialization.OptIn)]
+    public partial class Pricing {
+        public const string PricingObjectName = "pricing";
+        // constant values for "price"
+        public const double Price32_99Value = 32.99;
+		public const double Price33_99Value = 33.99;
+		public const double Price44_99Value = 44.99;
+
+        /// <summary>
+        /// immutable array containing all allowed values for "price"
+        /// </summary>
+        public static readonly ImmutableArray<double?> AllowedValuesForPrice = ImmutableArray.Create(Price32_99Value, Price33_99Value, Price44_99Value, (double?)null);
+
+        [JsonIgnore]
+        private double? _price = null;
+
+        [JsonProperty("price")]
+        public virtual double? Price {
+            get {
+                return _price;
+            }
+            set {
+                // set checkEnums=true in config file to have a value check here //
+				// if (!AllowedValuesForPrice.Contains(value))
+                // {
+                //     var allowedValues = string.Join(", ", AllowedValuesForPrice.Select(v=>v == null ? "null" : v.ToString()));
+                //     throw new ArgumentOutOfRangeException("price",
+                //         $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                // }
+                _price = value;
+            }
+        }
+
+        public Pricing ToPricing() {
+            var item = new Pricing();
+            item.UpdateWithPricing(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithPricing(Pricing other) {
+            Price = other.Price;
+        }
+
+        /// <summary>
+        /// Merges all fields of Pricing that are present in the passed object with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithPricing(Pricing other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other.Price != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Price = other.Price;
+        }
+
+        /// <summary>
+        /// Merges all fields of Pricing that are present in the passed JToken with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithPricing(JToken other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other is JObject otherObject)
+            {
+                foreach (var property in otherObject.Properties())
+                    MergePropertyPricing(property, mergeSettings);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties.
+        /// Like in deserialization, a field whose name only differs in case is used if no name matches exactly
+        /// </summary>
+        protected bool MergePropertyPricing(JProperty property, JsonMergeSettings mergeSettings) {
+            if (property.Value.Type == JTokenType.Null && mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Ignore)
+                return true;
+            if (MergePropertyPricing(property.Name, property, mergeSettings))
+                return true;
+            var name = FindPropertyNamePricing(property.Name);
+            return name != null && MergePropertyPricing(name, property, mergeSettings);
+        }
+
+        /// <summary>
+        /// Merges a JSON property into the field with exactly the given JSON name. Returns false for unknown names
+        /// </summary>
+        protected bool MergePropertyPricing(string name, JProperty property, JsonMergeSettings mergeSettings) {
+            switch (name) {
+                case "price":
+					Price = property.Value.ToObject<double?>();
+					return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Returns the JSON name of the field that matches the passed name case-insensitively, or null
+        /// </summary>
+        protected static string FindPropertyNamePricing(string name) {
+            foreach (var propertyName in PricingPropertyNames)
+            {
+                if (string.Equals(propertyName, name, System.StringComparison.OrdinalIgnoreCase))
+                    return propertyName;
+            }
+            return null;
+        }
+
+        private static readonly string[] PricingPropertyNames = { "price" };
+    }
+}
@@ -0,0 +1,189 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.Azure.WebJobs;
+using Microsoft.Azure.WebJobs.Extensions.Http;
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+
+using DemoV2.Errors;
+
+namespace DemoV2
+{
+    /// AUTO GENERATED CLASS
+    public class DemoV2Functions
+    {
+        private readonly ILogger<DemoV2Functions> _logger;
+        private readonly IDemoV2Service _service;
+        public DemoV2Functions(ILogger<DemoV2Functions> logger, IDemoV2Service service) {
+            _logger = logger;
+            _service = service;
+        }
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UsersGetAsync")]
+        public async Task<IActionResult> UsersGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "prefix/users")]
+            HttpRequest request)
+        {
+            try {
+                try {
+				  return await _service.UsersGetAsync(request);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UsersGetAsync";
+		        debugInformation["Route"] = "prefix/users";
+		        debugInformation["Operation"] = "get";
+		        debugInformation["Payload"] = GetPayloadForExceptionLogging(request);
+		        
+
+		        _logger.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPostAsync")]
+        public async Task<IActionResult> UserPostAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "post", Route = "prefix/users")]
+            HttpRequest request)
+        {
+            try {
+                try {
+				  return await _service.UserPostAsync(request);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserPostAsync";
+		        debugInformation["Route"] = "prefix/users";
+		        debugInformation["Operation"] = "post";
+		        debugInformation["Payload"] = GetPayloadForExceptionLogging(request);
+		        
+
+		        _logger.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPutAsync")]
+        public async Task<IActionResult> UserPutAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "put", Route = "prefix/users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                try {
+				  return await _service.UserPutAsync(userId, request);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserPutAsync";
+		        debugInformation["Route"] = "prefix/users/{userId}";
+		        debugInformation["Operation"] = "put";
+		        debugInformation["Payload"] = GetPayloadForExceptionLogging(request);
+		        debugInformation["p_userId"] = userId.ToString();
+				
+
+		        _logger.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPatchAsync")]
+        public async Task<IActionResult> UserPatchAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "patch", Route = "prefix/users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                try {
+				  return await _service.UserPatchAsync(userId, request);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserPatchAsync";
+		        debugInformation["Route"] = "prefix/users/{userId}";
+		        debugInformation["Operation"] = "patch";
+		        debugInformation["Payload"] = GetPayloadForExceptionLogging(request);
+		        debugInformation["p_userId"] = userId.ToString();
+				
+
+		        _logger.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserGetAsync")]
+        public async Task<IActionResult> UserGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "prefix/users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                try {
+				  return await _service.UserGetAsync(userId, request);
+				} catch(BaseError e) {
+				  return e.Result;
+				}
+            } catch (Exception e) {
+                var debugInformation = new Dictionary<string,  string>();
+                debugInformation["Error"] = e.Message;
+                debugInformation["ExecptionType"] = e.GetType().Name;
+                debugInformation["FunctionName"] = "UserGetAsync";
+		        debugInformation["Route"] = "prefix/users/{userId}";
+		        debugInformation["Operation"] = "get";
+		        debugInformation["Payload"] = GetPayloadForExceptionLogging(request);
+		        debugInformation["p_userId"] = userId.ToString();
+				
+
+		        _logger.LogCritical(JsonConvert.SerializeObject(debugInformation));
+		        throw;
+            }
+        }
+        private static string GetPayloadForExceptionLogging(HttpRequest req)
+        {
+	        try
+	        {
+		        if (req.ContentLength == 0)
+                    return "no payload";
+
+                using var ms = new MemoryStream();
+                req.Body.CopyTo(ms);
+                return Convert.ToBase64String(ms.ToArray());
+	        }
+	        catch (Exception e)
+	        {
+		        return "error while reading payload: " + e.Message;
+	        }
+        }
+    }
+}
\ No newline at end of file
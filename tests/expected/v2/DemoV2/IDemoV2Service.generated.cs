@@ -0,0 +1,54 @@
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using System.IO;
+using System.Collections.Generic;
+using DemoV2.Errors;
+using DemoV2.Model;
+
+namespace DemoV2
+{
+    /// AUTOGENERATED BY caffoa
+    /// <summary>
+    /// Interface for services to be implemented to serve the Function implementation
+    /// </summary>
+    public interface IDemoV2Service
+    {
+        /// <summary>
+        /// get information about the users
+		/// 200 -> return user object
+		/// 400 -> Error
+        /// </summary>
+        Task<IActionResult> UsersGetAsync(HttpRequest request);
+
+
+        /// <summary>
+        /// create or update a user without return test
+		/// 201 -> User was created
+        /// </summary>
+        Task<IActionResult> UserPostAsync(HttpRequest request);
+
+
+        /// <summary>
+        /// create or update a user
+		/// 200 -> User was updated
+		/// 201 -> User was created
+        /// </summary>
+        Task<IActionResult> UserPutAsync(string userId, HttpRequest request);
+
+
+        /// <summary>
+        /// update a user
+		/// 200 -> User was updated
+        /// </summary>
+        Task<IActionResult> UserPatchAsync(string userId, HttpRequest request);
+
+
+        /// <summary>
+        /// get information about the users
+		/// 200 -> return user object
+        /// </summary>
+        Task<IActionResult> UserGetAsync(string userId, HttpRequest request);
+
+    }
+}
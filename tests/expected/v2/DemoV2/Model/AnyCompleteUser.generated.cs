@@ -0,0 +1,8 @@
+
+namespace DemoV2.Model {
+    /// AUTOGENERED BY caffoa ///
+	
+    public interface AnyCompleteUser {
+        string Type { get; }
+    }
+}
@@ -0,0 +1,110 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace DemoV2.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonObject(MemberSerialization.OptIn)]
+    public partial class Error {
+        public const string ErrorObjectName = "error";
+        /// <summary>
+		/// Single string based code describing the error.
+		/// </summary>
+		[JsonProperty("status", Required = Required.Always)]
+        public virtual string Status { get; set; }
+
+        /// <summary>
+		/// Human readable error message.
+		/// </summary>
+		[JsonProperty("message", Required = Required.Always)]
+        public virtual string Message { get; set; }
+
+        public Error ToError() {
+            var item = new Error();
+            item.UpdateWithError(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithError(Error other) {
+            Status = other.Status;
+			Message = other.Message;
+        }
+
+        /// <summary>
+        /// Merges all fields of Error that are present in the passed object with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithError(Error other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other.Status != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Status = other.Status;
+			if (other.Message != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Message = other.Message;
+        }
+
+        /// <summary>
+        /// Merges all fields of Error that are present in the passed JToken with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithError(JToken other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other is JObject otherObject)
+            {
+                foreach (var property in otherObject.Properties())
+                    MergePropertyError(property, mergeSettings);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties.
+        /// Like in deserialization, a field whose name only differs in case is used if no name matches exactly
+        /// </summary>
+        protected bool MergePropertyError(JProperty property, JsonMergeSettings mergeSettings) {
+            if (property.Value.Type == JTokenType.Null && mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Ignore)
+                return true;
+            if (MergePropertyError(property.Name, property, mergeSettings))
+                return true;
+            var name = FindPropertyNameError(property.Name);
+            return name != null && MergePropertyError(name, property, mergeSettings);
+        }
+
+        /// <summary>
+        /// Merges a JSON property into the field with exactly the given JSON name. Returns false for unknown names
+        /// </summary>
+        protected bool MergePropertyError(string name, JProperty property, JsonMergeSettings mergeSettings) {
+            switch (name) {
+                case "status":
+					Status = property.Value.ToObject<string>();
+					return true;
+				case "message":
+					Message = property.Value.ToObject<string>();
+					return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Returns the JSON name of the field that matches the passed name case-insensitively, or null
+        /// </summary>
+        protected static string FindPropertyNameError(string name) {
+            foreach (var propertyName in ErrorPropertyNames)
+            {
+                if (string.Equals(propertyName, name, System.StringComparison.OrdinalIgnoreCase))
+                    return propertyName;
+            }
+            return null;
+        }
+
+        private static readonly string[] ErrorPropertyNames = { "status", "message" };
+    }
+}
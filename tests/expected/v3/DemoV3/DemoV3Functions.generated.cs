@@ -0,0 +1,307 @@
+using System;
+using System.Buffers;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.WebUtilities;
+using Microsoft.Azure.WebJobs;
+using Microsoft.Azure.WebJobs.Extensions.Http;
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+using DemoV3.Model;
+using Demov3.Errors;
+
+namespace DemoV3
+{
+    /// AUTO GENERATED CLASS
+    public class DemoV3Functions
+    {
+        private readonly ILogger<DemoV3Functions> _logger;
+        private readonly IDemoV3ServiceFactory _service;
+        public DemoV3Functions(ILogger<DemoV3Functions> logger, IDemoV3ServiceFactory service) {
+            _logger = logger;
+            _service = service;
+        }
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UsersGetAsync")]
+        public async Task<IActionResult> UsersGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "users")]
+            HttpRequest request)
+        {
+            try {
+                var result = await _service.Instance(request).UsersGetAsync();
+                return new JsonResult(result) {StatusCode = 200, SerializerSettings = _service.ResponseSerializerSettings };
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UsersGetAsync", "users", "get");
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPostAsync")]
+        public async Task<IActionResult> UserPostAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "post", Route = "users")]
+            HttpRequest request)
+        {
+            try {
+                var discriminator = await ReadDiscriminator(request, "type");
+                var result =  discriminator switch
+                {
+                    "simple" => await _service.Instance(request).UserPostAsync(await ParseJson<User>(request)),
+					"guest" => await _service.Instance(request).UserPostAsync(await ParseJson<GuestUser>(request)),
+                    _ => throw CaffoaJsonParseError.WrongContent("type", discriminator, new [] { "simple", "guest" })
+                };
+
+                return new JsonResult(result) {StatusCode = 201, SerializerSettings = _service.ResponseSerializerSettings };
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserPostAsync", "users", "post");
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPutAsync")]
+        public async Task<IActionResult> UserPutAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "put", Route = "users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                var discriminator = await ReadDiscriminator(request, "type");
+                var (result, code) =  discriminator switch
+                {
+                    "simple" => await _service.Instance(request).UserPutAsync(userId, await ParseJson<User>(request)),
+					"guest" => await _service.Instance(request).UserPutAsync(userId, await ParseJson<GuestUser>(request)),
+                    _ => throw CaffoaJsonParseError.WrongContent("type", discriminator, new [] { "simple", "guest" })
+                };
+
+                return new JsonResult(result) {StatusCode = code, SerializerSettings = _service.ResponseSerializerSettings  };
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserPutAsync", "users/{userId}", "put", ("userId", userId));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPatchAsync")]
+        public async Task<IActionResult> UserPatchAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "patch", Route = "users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                var result = await _service.Instance(request).UserPatchAsync(userId, await ParseJson<JObject>(request));
+                return new JsonResult(result) {StatusCode = 200, SerializerSettings = _service.ResponseSerializerSettings };
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserPatchAsync", "users/{userId}", "patch", ("userId", userId));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserGetAsync")]
+        public async Task<IActionResult> UserGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                var result = await _service.Instance(request).UserGetAsync(userId);
+                return new JsonResult(result) {StatusCode = 200, SerializerSettings = _service.ResponseSerializerSettings };
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserGetAsync", "users/{userId}", "get", ("userId", userId));
+		        throw;
+            }
+        }
+        /// <summary>
+        /// parses the request body without reading it into a string. JsonTextReader reads synchronously, so the
+        /// whole body is buffered first (in memory, and in a temporary file for large bodies) and then deserialized
+        /// from the buffer. The buffered body can be read again, e.g. for exception logging
+        /// </summary>
+        public static async Task<T> ParseJson<T>(HttpRequest request)
+        {
+            request.EnableBuffering();
+            await request.Body.DrainAsync(CancellationToken.None);
+            request.Body.Position = 0;
+            return DeserializeJson<T>(request.Body);
+        }
+
+        /// <summary>
+        /// parses a json stream. The stream is copied to memory first, as it might not allow synchronous reads
+        /// </summary>
+        public static async Task<T> ParseJson<T>(Stream s)
+        {
+            using var buffer = new MemoryStream();
+            await s.CopyToAsync(buffer);
+            buffer.Position = 0;
+            return DeserializeJson<T>(buffer);
+        }
+
+        private static T DeserializeJson<T>(Stream s)
+        {
+            using var streamReader = new StreamReader(s, Encoding.UTF8, true, 1024, leaveOpen: true);
+            using var jsonReader = new JsonTextReader(streamReader) { ArrayPool = JsonCharArrayPool.Instance, CloseInput = false };
+            try {
+                if (jsonReader.Read())
+                {
+                    var serializer = JsonSerializer.CreateDefault();
+                    serializer.CheckAdditionalContent = true;
+                    return serializer.Deserialize<T>(jsonReader);
+                }
+            } catch (Exception e) {
+                throw CaffoaJsonParseError.FromException(e);
+            }
+            throw CaffoaJsonParseError.NoContent();
+        }
+
+        /// <summary>
+        /// reads the discriminator of a oneOf body with a forward-only reader, without materializing the body.
+        /// Reading stops at the discriminator, afterwards the buffered body is rewound for ParseJson
+        /// </summary>
+        public static async Task<string> ReadDiscriminator(HttpRequest request, string propertyName)
+        {
+            request.EnableBuffering();
+            await request.Body.DrainAsync(CancellationToken.None);
+            request.Body.Position = 0;
+            var hasContent = false;
+            try {
+                using var streamReader = new StreamReader(request.Body, Encoding.UTF8, true, 1024, leaveOpen: true);
+                using var jsonReader = new JsonTextReader(streamReader)
+                {
+                    ArrayPool = JsonCharArrayPool.Instance, CloseInput = false, DateParseHandling = DateParseHandling.None
+                };
+                hasContent = jsonReader.Read();
+                if (hasContent && jsonReader.TokenType == JsonToken.StartObject)
+                {
+                    while (jsonReader.Read() && jsonReader.TokenType == JsonToken.PropertyName)
+                    {
+                        if ((string)jsonReader.Value == propertyName)
+                        {
+                            jsonReader.Read();
+                            return jsonReader.Value?.ToString();
+                        }
+                        jsonReader.Skip();
+                    }
+                    if (jsonReader.TokenType != JsonToken.EndObject)
+                        throw new JsonReaderException("Unexpected end of content while reading the discriminator");
+                }
+            } catch (Exception e) {
+                throw CaffoaJsonParseError.FromException(e);
+            } finally {
+                request.Body.Position = 0;
+            }
+            if (!hasContent)
+                throw CaffoaJsonParseError.NoContent();
+            return null;
+        }
+
+        private class JsonCharArrayPool : IArrayPool<char>
+        {
+            public static readonly JsonCharArrayPool Instance = new JsonCharArrayPool();
+            public char[] Rent(int minimumLength) => ArrayPool<char>.Shared.Rent(minimumLength);
+            public void Return(char[] array) => ArrayPool<char>.Shared.Return(array);
+        }
+
+        public static T ToObject<T>(JObject jObject)
+        {
+            try {
+                return jObject.ToObject<T>();
+            } catch (Exception e) {
+                throw CaffoaJsonParseError.FromException(e);
+            }
+        }
+
+        /// <summary>
+        /// settings for the request payload that is logged with unhandled exceptions.
+        /// Set LogPayload to false or PayloadSampleRate to 0 to never read the payload
+        /// </summary>
+        public static bool LogPayload { get; set; } = true;
+        public static int MaxPayloadBytes { get; set; } = 8192;
+        public static double PayloadSampleRate { get; set; } = 1.0;
+        [ThreadStatic] private static Random _payloadSampler;
+
+        public void LogException(Exception e, HttpRequest request, string functionName, string route, string operation,
+            params (string, object)[] namedParams)
+        {
+            var scope = new Dictionary<string, object>
+            {
+                ["FunctionName"] = functionName,
+                ["Route"] = route,
+                ["Operation"] = operation,
+                ["ExecptionType"] = e.GetType().Name
+            };
+            foreach (var (name, value) in namedParams)
+            {
+                scope["p_" + name] = value;
+            }
+            if (LogPayload && MaxPayloadBytes > 0 && PayloadSampleRate > 0
+                && (PayloadSampleRate >= 1 || (_payloadSampler ??= new Random()).NextDouble() < PayloadSampleRate))
+            {
+                scope["Payload"] = GetPayloadForExceptionLogging(request, out var truncated);
+                scope["PayloadTruncated"] = truncated;
+            }
+            using (_logger.BeginScope(scope))
+            {
+                _logger.LogCritical(e, "{FunctionName} failed: {Error}", functionName, e.Message);
+            }
+        }
+
+        /// <summary>
+        /// returns the first MaxPayloadBytes of the payload as base64. If ParseJson buffered the body,
+        /// it is read again from the start, otherwise the rest of the body is read
+        /// </summary>
+        private static string GetPayloadForExceptionLogging(HttpRequest req, out bool truncated)
+        {
+            truncated = false;
+            byte[] buffer = null;
+	        try
+	        {
+		        if (req.ContentLength == 0 || req.Body == null)
+                    return "no payload";
+                if (req.Body.CanSeek)
+                    req.Body.Position = 0;
+                var maxBytes = MaxPayloadBytes;
+                buffer = ArrayPool<byte>.Shared.Rent(maxBytes);
+                var length = 0;
+                int read;
+                while (length < maxBytes && (read = req.Body.Read(buffer, length, maxBytes - length)) > 0)
+                    length += read;
+                truncated = length == maxBytes && (req.ContentLength == null || req.ContentLength > maxBytes);
+                return Convert.ToBase64String(buffer, 0, length);
+	        }
+	        catch (Exception e)
+	        {
+		        return "error while reading payload: " + e.Message;
+	        }
+	        finally
+	        {
+		        if (buffer != null)
+			        ArrayPool<byte>.Shared.Return(buffer);
+	        }
+        }
+    }
+}
\ No newline at end of file
@@ -0,0 +1,69 @@
+using System.IO;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using System.Collections.Generic;
+using Newtonsoft.Json.Linq;
+using DemoV3.Model;
+
+namespace DemoV3
+{
+    /// AUTOGENERATED BY caffoa
+    /// <summary>
+    /// Interface for services to be implemented to serve the Function implementation
+    /// </summary>
+    public interface IDemoV3Service
+    {
+        /// <summary>
+        /// get information about the users
+		/// 200 -> return user object
+		/// 400 -> Error
+        /// </summary>
+        Task<IEnumerable<AnyCompleteUser>> UsersGetAsync();
+
+
+        /// <summary>
+        /// create or update a user without return test
+		/// 201 -> User was created
+        /// </summary>
+        Task<AnyCompleteUser> UserPostAsync(User payload);
+
+
+        /// <summary>
+        /// create or update a user without return test
+		/// 201 -> User was created
+        /// </summary>
+        Task<AnyCompleteUser> UserPostAsync(GuestUser payload);
+
+
+        /// <summary>
+        /// create or update a user
+		/// 200 -> User was updated
+		/// 201 -> User was created
+        /// </summary>
+        Task<(AnyCompleteUser, int)> UserPutAsync(string userId, User payload);
+
+
+        /// <summary>
+        /// create or update a user
+		/// 200 -> User was updated
+		/// 201 -> User was created
+        /// </summary>
+        Task<(AnyCompleteUser, int)> UserPutAsync(string userId, GuestUser payload);
+
+
+        /// <summary>
+        /// update a user
+		/// 200 -> User was updated
+        /// </summary>
+        Task<UserWithId> UserPatchAsync(string userId, JObject payload);
+
+
+        /// <summary>
+        /// get information about the users
+		/// 200 -> return user object
+        /// </summary>
+        Task<UserWithId> UserGetAsync(string userId);
+
+    }
+}
@@ -0,0 +1,141 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System.Collections.Generic;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonObject(MemberSerialization.OptIn)]
+    public partial class Address {
+        public const string AddressObjectName = "address";
+        [JsonProperty("street", Required = Required.Always)]
+        public virtual string Street { get; set; }
+
+        [JsonProperty("postalCode", Required = Required.Always)]
+        public virtual string PostalCode { get; set; }
+
+        [JsonProperty("city", Required = Required.Always)]
+        public virtual string City { get; set; }
+
+        [JsonProperty("country", Required = Required.Always)]
+        public virtual string Country { get; set; }
+
+        [JsonProperty("flags")]
+        public virtual Dictionary<string, string> Flags { get; set; } = new Dictionary<string, string>();
+
+        public Address ToAddress() {
+            var item = new Address();
+            item.UpdateWithAddress(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithAddress(Address other) {
+            Street = other.Street;
+			PostalCode = other.PostalCode;
+			City = other.City;
+			Country = other.Country;
+			Flags = other.Flags;
+        }
+
+        /// <summary>
+        /// Merges all fields of Address that are present in the passed object with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithAddress(Address other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other.Street != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Street = other.Street;
+			if (other.PostalCode != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    PostalCode = other.PostalCode;
+			if (other.City != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    City = other.City;
+			if (other.Country != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Country = other.Country;
+			if (other.Flags != null && Flags != null) {
+			    var merged = JObject.FromObject(Flags);
+			    merged.Merge(JObject.FromObject(other.Flags), mergeSettings);
+			    Flags = merged.ToObject<Dictionary<string, string>>();
+			} else if (other.Flags != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Flags = other.Flags == null ? null : new Dictionary<string, string>(other.Flags);
+        }
+
+        /// <summary>
+        /// Merges all fields of Address that are present in the passed JToken with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithAddress(JToken other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other is JObject otherObject)
+            {
+                foreach (var property in otherObject.Properties())
+                    MergePropertyAddress(property, mergeSettings);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties.
+        /// Like in deserialization, a field whose name only differs in case is used if no name matches exactly
+        /// </summary>
+        protected bool MergePropertyAddress(JProperty property, JsonMergeSettings mergeSettings) {
+            if (property.Value.Type == JTokenType.Null && mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Ignore)
+                return true;
+            if (MergePropertyAddress(property.Name, property, mergeSettings))
+                return true;
+            var name = FindPropertyNameAddress(property.Name);
+            return name != null && MergePropertyAddress(name, property, mergeSettings);
+        }
+
+        /// <summary>
+        /// Merges a JSON property into the field with exactly the given JSON name. Returns false for unknown names
+        /// </summary>
+        protected bool MergePropertyAddress(string name, JProperty property, JsonMergeSettings mergeSettings) {
+            switch (name) {
+                case "street":
+					Street = property.Value.ToObject<string>();
+					return true;
+				case "postalCode":
+					PostalCode = property.Value.ToObject<string>();
+					return true;
+				case "city":
+					City = property.Value.ToObject<string>();
+					return true;
+				case "country":
+					Country = property.Value.ToObject<string>();
+					return true;
+				case "flags":
+					if (property.Value.Type == JTokenType.Object && Flags != null) {
+					    var merged = JObject.FromObject(Flags);
+					    merged.Merge(property.Value, mergeSettings);
+					    Flags = merged.ToObject<Dictionary<string, string>>();
+					} else
+					    Flags = property.Value.ToObject<Dictionary<string, string>>();
+					return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Returns the JSON name of the field that matches the passed name case-insensitively, or null
+        /// </summary>
+        protected static string FindPropertyNameAddress(string name) {
+            foreach (var propertyName in AddressPropertyNames)
+            {
+                if (string.Equals(propertyName, name, System.StringComparison.OrdinalIgnoreCase))
+                    return propertyName;
+            }
+            return null;
+        }
+
+        private static readonly string[] AddressPropertyNames = { "street", "postalCode", "city", "country", "flags" };
+    }
+}
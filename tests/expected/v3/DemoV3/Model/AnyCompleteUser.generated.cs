@@ -0,0 +1,8 @@
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	
+    public interface AnyCompleteUser {
+        string Type { get; }
+    }
+}
@@ -0,0 +1,8 @@
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	
+    public interface AnyUser {
+        string Type { get; }
+    }
+}
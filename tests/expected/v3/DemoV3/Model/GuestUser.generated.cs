@@ -0,0 +1,131 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System;
+using System.Collections.Immutable;
+using System.Linq;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonObject(MemberSerialization.OptIn)]
+    public partial class GuestUser : AnyUser, AnyCompleteUser {
+        public const string GuestUserObjectName = "guestUser";
+        [JsonProperty("email", Required = Required.Always)]
+        public virtual string Email { get; set; }
+
+        // constant values for "type"
+        public const string TypeGuestValue = "guest";
+
+        /// <summary>
+        /// immutable array containing all allowed values for "type"
+        /// </summary>
+        public static readonly ImmutableArray<string> AllowedValuesForType = ImmutableArray.Create(TypeGuestValue);
+
+        [JsonIgnore]
+        private string _type = TypeGuestValue;
+
+        [JsonProperty("type", Required = Required.Always)]
+        public virtual string Type {
+            get {
+                return _type;
+            }
+            set {
+                if (!AllowedValuesForType.Contains(value))
+                {
+                    var allowedValues = string.Join(", ", AllowedValuesForType.Select(v=>v == null ? "null" : v.ToString()));
+                    throw new ArgumentOutOfRangeException("type",
+                        $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                }
+                _type = value;
+            }
+        }
+
+        public GuestUser ToGuestUser() {
+            var item = new GuestUser();
+            item.UpdateWithGuestUser(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithGuestUser(GuestUser other) {
+            Email = other.Email;
+			Type = other.Type;
+        }
+
+        /// <summary>
+        /// Merges all fields of GuestUser that are present in the passed object with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithGuestUser(GuestUser other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other.Email != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Email = other.Email;
+			if (other.Type != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Type = other.Type;
+        }
+
+        /// <summary>
+        /// Merges all fields of GuestUser that are present in the passed JToken with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithGuestUser(JToken other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other is JObject otherObject)
+            {
+                foreach (var property in otherObject.Properties())
+                    MergePropertyGuestUser(property, mergeSettings);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties.
+        /// Like in deserialization, a field whose name only differs in case is used if no name matches exactly
+        /// </summary>
+        protected bool MergePropertyGuestUser(JProperty property, JsonMergeSettings mergeSettings) {
+            if (property.Value.Type == JTokenType.Null && mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Ignore)
+                return true;
+            if (MergePropertyGuestUser(property.Name, property, mergeSettings))
+                return true;
+            var name = FindPropertyNameGuestUser(property.Name);
+            return name != null && MergePropertyGuestUser(name, property, mergeSettings);
+        }
+
+        /// <summary>
+        /// Merges a JSON property into the field with exactly the given JSON name. Returns false for unknown names
+        /// </summary>
+        protected bool MergePropertyGuestUser(string name, JProperty property, JsonMergeSettings mergeSettings) {
+            switch (name) {
+                case "email":
+					Email = property.Value.ToObject<string>();
+					return true;
+				case "type":
+					Type = property.Value.ToObject<string>();
+					return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Returns the JSON name of the field that matches the passed name case-insensitively, or null
+        /// </summary>
+        protected static string FindPropertyNameGuestUser(string name) {
+            foreach (var propertyName in GuestUserPropertyNames)
+            {
+                if (string.Equals(propertyName, name, System.StringComparison.OrdinalIgnoreCase))
+                    return propertyName;
+            }
+            return null;
+        }
+
+        private static readonly string[] GuestUserPropertyNames = { "email", "type" };
+    }
+}
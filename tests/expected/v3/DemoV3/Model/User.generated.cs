@@ -0,0 +1,209 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using System.Collections.Generic;
+using System.Linq;
+using System;
+using System.Collections.Immutable;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonObject(MemberSerialization.OptIn)]
+    public partial class User : AnyUser {
+        public const string UserObjectName = "user";
+        [JsonProperty("name", Required = Required.Always)]
+        public virtual string Name { get; set; }
+
+        [JsonProperty("address")]
+        public virtual Address Address { get; set; } = null;
+
+        [JsonConverter(typeof(CustomJsonDateConverter))]
+		[JsonProperty("birthdate")]
+        public virtual System.DateTime? Birthdate { get; set; } = null;
+
+        [JsonProperty("emails")]
+        public virtual ICollection<string> Emails { get; set; } = new List<string>();
+
+        // constant values for "type"
+        public const string TypeSimpleValue = "simple";
+
+        /// <summary>
+        /// immutable array containing all allowed values for "type"
+        /// </summary>
+        public static readonly ImmutableArray<string> AllowedValuesForType = ImmutableArray.Create(TypeSimpleValue);
+
+        [JsonIgnore]
+        private string _type = TypeSimpleValue;
+
+        [JsonProperty("type", Required = Required.Always)]
+        public virtual string Type {
+            get {
+                return _type;
+            }
+            set {
+                if (!AllowedValuesForType.Contains(value))
+                {
+                    var allowedValues = string.Join(", ", AllowedValuesForType.Select(v=>v == null ? "null" : v.ToString()));
+                    throw new ArgumentOutOfRangeException("type",
+                        $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                }
+                _type = value;
+            }
+        }
+
+        // constant values for "ageGroup"
+        public const int AgeGroup18Value = 18;
+		public const int AgeGroup40Value = 40;
+		public const int AgeGroup70Value = 70;
+		public const int AgeGroup120Value = 120;
+
+        /// <summary>
+        /// immutable array containing all allowed values for "ageGroup"
+        /// </summary>
+        public static readonly ImmutableArray<int> AllowedValuesForAgeGroup = ImmutableArray.Create(AgeGroup18Value, AgeGroup40Value, AgeGroup70Value, AgeGroup120Value);
+
+        [JsonIgnore]
+        private int _ageGroup = AgeGroup40Value;
+
+        [JsonProperty("ageGroup")]
+        public virtual int AgeGroup {
+            get {
+                return _ageGroup;
+            }
+            set {
+                if (!AllowedValuesForAgeGroup.Contains(value))
+                {
+                    var allowedValues = string.Join(", ", AllowedValuesForAgeGroup.Select(v=>v == null ? "null" : v.ToString()));
+                    throw new ArgumentOutOfRangeException("ageGroup",
+                        $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                }
+                _ageGroup = value;
+            }
+        }
+
+        public User ToUser() {
+            var item = new User();
+            item.UpdateWithUser(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithUser(User other) {
+            Name = other.Name;
+			Address = other.Address?.ToAddress();
+			Birthdate = other.Birthdate;
+			Emails = other.Emails.ToList();
+			Type = other.Type;
+			AgeGroup = other.AgeGroup;
+        }
+
+        /// <summary>
+        /// Merges all fields of User that are present in the passed object with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUser(User other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other.Name != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Name = other.Name;
+			if (other.Address != null && Address != null)
+			    Address.MergeWithAddress(other.Address, mergeSettings);
+			else if (other.Address != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Address = other.Address?.ToAddress();
+			if (other.Birthdate != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Birthdate = other.Birthdate;
+			if (other.Emails != null && Emails != null && mergeSettings.MergeArrayHandling != MergeArrayHandling.Replace) {
+			    var merged = JArray.FromObject(Emails);
+			    merged.Merge(JArray.FromObject(other.Emails), mergeSettings);
+			    Emails = merged.ToObject<ICollection<string>>();
+			} else if (other.Emails != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Emails = other.Emails?.ToList();
+			if (other.Type != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Type = other.Type;
+			AgeGroup = other.AgeGroup;
+        }
+
+        /// <summary>
+        /// Merges all fields of User that are present in the passed JToken with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUser(JToken other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other is JObject otherObject)
+            {
+                foreach (var property in otherObject.Properties())
+                    MergePropertyUser(property, mergeSettings);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties.
+        /// Like in deserialization, a field whose name only differs in case is used if no name matches exactly
+        /// </summary>
+        protected bool MergePropertyUser(JProperty property, JsonMergeSettings mergeSettings) {
+            if (property.Value.Type == JTokenType.Null && mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Ignore)
+                return true;
+            if (MergePropertyUser(property.Name, property, mergeSettings))
+                return true;
+            var name = FindPropertyNameUser(property.Name);
+            return name != null && MergePropertyUser(name, property, mergeSettings);
+        }
+
+        /// <summary>
+        /// Merges a JSON property into the field with exactly the given JSON name. Returns false for unknown names
+        /// </summary>
+        protected bool MergePropertyUser(string name, JProperty property, JsonMergeSettings mergeSettings) {
+            switch (name) {
+                case "name":
+					Name = property.Value.ToObject<string>();
+					return true;
+				case "address":
+					if (property.Value.Type == JTokenType.Object && Address != null)
+					    Address.MergeWithAddress(property.Value, mergeSettings);
+					else
+					    Address = property.Value.ToObject<Address>();
+					return true;
+				case "birthdate":
+					Birthdate = property.Value.ToObject<System.DateTime?>();
+					return true;
+				case "emails":
+					if (property.Value.Type == JTokenType.Array && Emails != null && mergeSettings.MergeArrayHandling != MergeArrayHandling.Replace) {
+					    var merged = JArray.FromObject(Emails);
+					    merged.Merge(property.Value, mergeSettings);
+					    Emails = merged.ToObject<ICollection<string>>();
+					} else
+					    Emails = property.Value.ToObject<ICollection<string>>();
+					return true;
+				case "type":
+					Type = property.Value.ToObject<string>();
+					return true;
+				case "ageGroup":
+					AgeGroup = property.Value.ToObject<int>();
+					return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Returns the JSON name of the field that matches the passed name case-insensitively, or null
+        /// </summary>
+        protected static string FindPropertyNameUser(string name) {
+            foreach (var propertyName in UserPropertyNames)
+            {
+                if (string.Equals(propertyName, name, System.StringComparison.OrdinalIgnoreCase))
+                    return propertyName;
+            }
+            return null;
+        }
+
+        private static readonly string[] UserPropertyNames = { "name", "address", "birthdate", "emails", "type", "ageGroup" };
+    }
+}
@@ -0,0 +1,105 @@
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonObject(MemberSerialization.OptIn)]
+    public partial class UserWithId : User, AnyCompleteUser {
+        public const string UserWithIdObjectName = "userWithId";
+        [JsonProperty("id")]
+        public virtual string Id { get; set; }
+
+        [JsonProperty("registrationDate")]
+        public virtual System.DateTime RegistrationDate { get; set; }
+
+        public UserWithId ToUserWithId() {
+            var item = new UserWithId();
+            item.UpdateWithUserWithId(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithUserWithId(UserWithId other) {
+            UpdateWithUser(other);
+			Id = other.Id;
+			RegistrationDate = other.RegistrationDate;
+        }
+
+        /// <summary>
+        /// Merges all fields of UserWithId that are present in the passed object with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUserWithId(UserWithId other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            MergeWithUser(other, mergeSettings);
+			if (other.Id != null || mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Merge)
+			    Id = other.Id;
+			RegistrationDate = other.RegistrationDate;
+        }
+
+        /// <summary>
+        /// Merges all fields of UserWithId that are present in the passed JToken with the current object.
+        /// If merge settings are not omitted, Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUserWithId(JToken other, JsonMergeSettings mergeSettings = null) {
+            mergeSettings ??= new JsonMergeSettings()
+            {
+                MergeArrayHandling = MergeArrayHandling.Replace,
+                MergeNullValueHandling = MergeNullValueHandling.Merge
+            };
+            if (other is JObject otherObject)
+            {
+                foreach (var property in otherObject.Properties())
+                    MergePropertyUserWithId(property, mergeSettings);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties.
+        /// Like in deserialization, a field whose name only differs in case is used if no name matches exactly
+        /// </summary>
+        protected bool MergePropertyUserWithId(JProperty property, JsonMergeSettings mergeSettings) {
+            if (property.Value.Type == JTokenType.Null && mergeSettings.MergeNullValueHandling == MergeNullValueHandling.Ignore)
+                return true;
+            if (MergePropertyUserWithId(property.Name, property, mergeSettings))
+                return true;
+            var name = FindPropertyNameUserWithId(property.Name);
+            return name != null && MergePropertyUserWithId(name, property, mergeSettings);
+        }
+
+        /// <summary>
+        /// Merges a JSON property into the field with exactly the given JSON name. Returns false for unknown names
+        /// </summary>
+        protected bool MergePropertyUserWithId(string name, JProperty property, JsonMergeSettings mergeSettings) {
+            switch (name) {
+                case "id":
+					Id = property.Value.ToObject<string>();
+					return true;
+				case "registrationDate":
+					RegistrationDate = property.Value.ToObject<System.DateTime>();
+					return true;
+            }
+            return MergePropertyUser(name, property, mergeSettings);
+        }
+
+        /// <summary>
+        /// Returns the JSON name of the field that matches the passed name case-insensitively, or null
+        /// </summary>
+        protected static string FindPropertyNameUserWithId(string name) {
+            foreach (var propertyName in UserWithIdPropertyNames)
+            {
+                if (string.Equals(propertyName, name, System.StringComparison.OrdinalIgnoreCase))
+                    return propertyName;
+            }
+            return FindPropertyNameUser(name);
+        }
+
+        private static readonly string[] UserWithIdPropertyNames = { "id", "registrationDate" };
+    }
+}
@@ -0,0 +1,370 @@
+using System;
+using System.Buffers;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text;
+using System.Threading.Tasks;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.Azure.WebJobs;
+using Microsoft.Azure.WebJobs.Extensions.Http;
+using Microsoft.Extensions.Logging;
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization.Metadata;
+
+using DemoV3.Model;
+using Demov3.Errors;
+
+namespace DemoV3
+{
+    /// AUTO GENERATED CLASS
+    public class DemoV3Functions
+    {
+        private readonly ILogger<DemoV3Functions> _logger;
+        private readonly IDemoV3ServiceFactory _service;
+        public DemoV3Functions(ILogger<DemoV3Functions> logger, IDemoV3ServiceFactory service) {
+            _logger = logger;
+            _service = service;
+        }
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UsersGetAsync")]
+        public async Task<IActionResult> UsersGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "users")]
+            HttpRequest request)
+        {
+            try {
+                var result = await _service.Instance(request).UsersGetAsync();
+                return JsonResponse(result, DemoV3ModelJsonContext.Default.IEnumerableAnyCompleteUser, 200);
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UsersGetAsync", "users", "get");
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPostAsync")]
+        public async Task<IActionResult> UserPostAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "post", Route = "users")]
+            HttpRequest request)
+        {
+            try {
+                var discriminator = await ReadDiscriminator(request, "type");
+                var result =  discriminator switch
+                {
+                    "simple" => await _service.Instance(request).UserPostAsync(await ParseJson(request, DemoV3ModelJsonContext.Default.User)),
+					"guest" => await _service.Instance(request).UserPostAsync(await ParseJson(request, DemoV3ModelJsonContext.Default.GuestUser)),
+                    _ => throw CaffoaJsonParseError.WrongContent("type", discriminator, new [] { "simple", "guest" })
+                };
+
+                return JsonResponse(result, DemoV3ModelJsonContext.Default.AnyCompleteUser, 201);
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserPostAsync", "users", "post");
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPutAsync")]
+        public async Task<IActionResult> UserPutAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "put", Route = "users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                var discriminator = await ReadDiscriminator(request, "type");
+                var (result, code) =  discriminator switch
+                {
+                    "simple" => await _service.Instance(request).UserPutAsync(userId, await ParseJson(request, DemoV3ModelJsonContext.Default.User)),
+					"guest" => await _service.Instance(request).UserPutAsync(userId, await ParseJson(request, DemoV3ModelJsonContext.Default.GuestUser)),
+                    _ => throw CaffoaJsonParseError.WrongContent("type", discriminator, new [] { "simple", "guest" })
+                };
+
+                return JsonResponse(result, DemoV3ModelJsonContext.Default.AnyCompleteUser, code);
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserPutAsync", "users/{userId}", "put", ("userId", userId));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserPatchAsync")]
+        public async Task<IActionResult> UserPatchAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "patch", Route = "users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                var result = await _service.Instance(request).UserPatchAsync(userId, await ParseJson(request, DemoV3ModelJsonContext.Default.JsonObject));
+                return JsonResponse(result, DemoV3ModelJsonContext.Default.UserWithId, 200);
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserPatchAsync", "users/{userId}", "patch", ("userId", userId));
+		        throw;
+            }
+        }
+
+        /// <summary>
+        /// auto-generated function invocation.
+        ///</summary>
+        [FunctionName("UserGetAsync")]
+        public async Task<IActionResult> UserGetAsync(
+            [HttpTrigger(AuthorizationLevel.Function, "get", Route = "users/{userId}")]
+            HttpRequest request, string userId)
+        {
+            try {
+                var result = await _service.Instance(request).UserGetAsync(userId);
+                return JsonResponse(result, DemoV3ModelJsonContext.Default.UserWithId, 200);
+            } catch(CaffoaClientError err) {
+                return err.Result;
+            } catch (Exception e) {
+                LogException(e, request, "UserGetAsync", "users/{userId}", "get", ("userId", userId));
+		        throw;
+            }
+        }
+        /// <summary>
+        /// deserializes the request body asynchronously, chunk by chunk, without reading it into a string.
+        /// EnableBuffering keeps a copy of the bytes that were read (in memory, and in a temporary file for large
+        /// bodies), so that the body can be read again, e.g. for exception logging
+        /// </summary>
+        public static async Task<T> ParseJson<T>(HttpRequest request, JsonTypeInfo<T> typeInfo)
+        {
+            request.EnableBuffering();
+            if (!await HasContent(request.Body))
+                throw CaffoaJsonParseError.NoContent();
+            try {
+                return await JsonSerializer.DeserializeAsync(request.Body, typeInfo);
+            } catch (Exception e) {
+                throw CaffoaJsonParseError.FromException(e);
+            }
+        }
+
+        /// <summary>
+        /// reads until the first character that is not whitespace, and rewinds the stream
+        /// </summary>
+        private static async Task<bool> HasContent(Stream s)
+        {
+            var buffer = ArrayPool<byte>.Shared.Rent(256);
+            try {
+                int read;
+                while ((read = await s.ReadAsync(buffer, 0, buffer.Length)) > 0)
+                {
+                    for (var i = 0; i < read; i++)
+                    {
+                        // whitespace and the UTF-8 byte order mark
+                        if (buffer[i] != ' ' && buffer[i] != '\t' && buffer[i] != '\r' && buffer[i] != '\n'
+                            && buffer[i] != 0xEF && buffer[i] != 0xBB && buffer[i] != 0xBF)
+                            return true;
+                    }
+                }
+                return false;
+            } finally {
+                ArrayPool<byte>.Shared.Return(buffer);
+                s.Position = 0;
+            }
+        }
+
+        /// <summary>
+        /// reads the discriminator of a oneOf body with a forward-only reader, without materializing the body.
+        /// Reading stops at the discriminator, afterwards the buffered body is rewound for ParseJson
+        /// </summary>
+        public static async Task<string> ReadDiscriminator(HttpRequest request, string propertyName)
+        {
+            request.EnableBuffering();
+            if (!await HasContent(request.Body))
+                throw CaffoaJsonParseError.NoContent();
+            var scanner = new DiscriminatorScanner(propertyName);
+            var buffer = ArrayPool<byte>.Shared.Rent(4096);
+            try {
+                var length = 0;
+                while (true)
+                {
+                    if (length == buffer.Length)
+                    {
+                        // a single token does not fit into the buffer
+                        var larger = ArrayPool<byte>.Shared.Rent(buffer.Length * 2);
+                        Buffer.BlockCopy(buffer, 0, larger, 0, length);
+                        ArrayPool<byte>.Shared.Return(buffer);
+                        buffer = larger;
+                    }
+                    var read = await request.Body.ReadAsync(buffer, length, buffer.Length - length);
+                    length += read;
+                    if (scanner.Scan(new ReadOnlySpan<byte>(buffer, 0, length), read == 0))
+                        return scanner.Value;
+                    if (read == 0)
+                        return null;
+                    length -= scanner.Consumed;
+                    Buffer.BlockCopy(buffer, scanner.Consumed, buffer, 0, length);
+                }
+            } catch (JsonException e) {
+                throw CaffoaJsonParseError.FromException(e);
+            } finally {
+                ArrayPool<byte>.Shared.Return(buffer);
+                request.Body.Position = 0;
+            }
+        }
+
+        private class DiscriminatorScanner
+        {
+            private readonly byte[] _propertyName;
+            private JsonReaderState _state;
+            private bool _started;
+            private bool _isValue;
+
+            public DiscriminatorScanner(string propertyName)
+            {
+                _propertyName = Encoding.UTF8.GetBytes(propertyName);
+            }
+
+            public string Value { get; private set; }
+
+            /// <summary>
+            /// the number of bytes of the last block that were read and are not needed for the next block
+            /// </summary>
+            public int Consumed { get; private set; }
+
+            /// <summary>
+            /// returns true as soon as the discriminator is read, or if the body is not a JSON object
+            /// </summary>
+            public bool Scan(ReadOnlySpan<byte> data, bool isFinalBlock)
+            {
+                var offset = 0;
+                if (!_started)
+                {
+                    if (data.Length < 3 && !isFinalBlock)
+                    {
+                        Consumed = 0;
+                        return false;
+                    }
+                    _started = true;
+                    if (data.StartsWith(new byte[] { 0xEF, 0xBB, 0xBF }))
+                        offset = 3;
+                }
+                var reader = new Utf8JsonReader(data.Slice(offset), isFinalBlock, _state);
+                while (reader.Read())
+                {
+                    if (_isValue)
+                    {
+                        Value = reader.TokenType switch
+                        {
+                            JsonTokenType.String => reader.GetString(),
+                            JsonTokenType.Number or JsonTokenType.True or JsonTokenType.False =>
+                                Encoding.UTF8.GetString(reader.ValueSpan),
+                            _ => null
+                        };
+                        return true;
+                    }
+                    if (reader.CurrentDepth == 0 && reader.TokenType != JsonTokenType.StartObject)
+                        return true;
+                    if (reader.CurrentDepth == 1 && reader.TokenType == JsonTokenType.PropertyName)
+                        _isValue = reader.ValueTextEquals(_propertyName);
+                }
+                _state = reader.CurrentState;
+                Consumed = offset + (int)reader.BytesConsumed;
+                return false;
+            }
+        }
+
+        public static T ToObject<T>(JsonObject jObject, JsonTypeInfo<T> typeInfo)
+        {
+            try {
+                return jObject.Deserialize(typeInfo);
+            } catch (Exception e) {
+                throw CaffoaJsonParseError.FromException(e);
+            }
+        }
+
+        public static IActionResult JsonResponse<T>(T value, JsonTypeInfo<T> typeInfo, int statusCode)
+        {
+            return new ContentResult
+            {
+                Content = JsonSerializer.Serialize(value, typeInfo),
+                ContentType = "application/json; charset=utf-8",
+                StatusCode = statusCode
+            };
+        }
+
+        /// <summary>
+        /// settings for the request payload that is logged with unhandled exceptions.
+        /// Set LogPayload to false or PayloadSampleRate to 0 to never read the payload
+        /// </summary>
+        public static bool LogPayload { get; set; } = true;
+        public static int MaxPayloadBytes { get; set; } = 8192;
+        public static double PayloadSampleRate { get; set; } = 1.0;
+        [ThreadStatic] private static Random _payloadSampler;
+
+        public void LogException(Exception e, HttpRequest request, string functionName, string route, string operation,
+            params (string, object)[] namedParams)
+        {
+            var scope = new Dictionary<string, object>
+            {
+                ["FunctionName"] = functionName,
+                ["Route"] = route,
+                ["Operation"] = operation,
+                ["ExecptionType"] = e.GetType().Name
+            };
+            foreach (var (name, value) in namedParams)
+            {
+                scope["p_" + name] = value;
+            }
+            if (LogPayload && MaxPayloadBytes > 0 && PayloadSampleRate > 0
+                && (PayloadSampleRate >= 1 || (_payloadSampler ??= new Random()).NextDouble() < PayloadSampleRate))
+            {
+                scope["Payload"] = GetPayloadForExceptionLogging(request, out var truncated);
+                scope["PayloadTruncated"] = truncated;
+            }
+            using (_logger.BeginScope(scope))
+            {
+                _logger.LogCritical(e, "{FunctionName} failed: {Error}", functionName, e.Message);
+            }
+        }
+
+        /// <summary>
+        /// returns the first MaxPayloadBytes of the payload as base64. If ParseJson buffered the body,
+        /// it is read again from the start, otherwise the rest of the body is read
+        /// </summary>
+        private static string GetPayloadForExceptionLogging(HttpRequest req, out bool truncated)
+        {
+            truncated = false;
+            byte[] buffer = null;
+	        try
+	        {
+		        if (req.ContentLength == 0 || req.Body == null)
+                    return "no payload";
+                if (req.Body.CanSeek)
+                    req.Body.Position = 0;
+                var maxBytes = MaxPayloadBytes;
+                buffer = ArrayPool<byte>.Shared.Rent(maxBytes);
+                var length = 0;
+                int read;
+                while (length < maxBytes && (read = req.Body.Read(buffer, length, maxBytes - length)) > 0)
+                    length += read;
+                truncated = length == maxBytes && (req.ContentLength == null || req.ContentLength > maxBytes);
+                return Convert.ToBase64String(buffer, 0, length);
+	        }
+	        catch (Exception e)
+	        {
+		        return "error while reading payload: " + e.Message;
+	        }
+	        finally
+	        {
+		        if (buffer != null)
+			        ArrayPool<byte>.Shared.Return(buffer);
+	        }
+        }
+    }
+}
\ No newline at end of file
@@ -0,0 +1,118 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+using System.Collections.Generic;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	public partial class Address : IJsonOnDeserialized {
+        public const string AddressObjectName = "address";
+        [JsonPropertyName("street"), JsonRequired]
+        public virtual string Street { get; set; }
+
+        [JsonPropertyName("postalCode"), JsonRequired]
+        public virtual string PostalCode { get; set; }
+
+        [JsonPropertyName("city"), JsonRequired]
+        public virtual string City { get; set; }
+
+        [JsonPropertyName("country"), JsonRequired]
+        public virtual string Country { get; set; }
+
+        [JsonPropertyName("flags")]
+        public virtual Dictionary<string, string> Flags { get; set; } = new Dictionary<string, string>();
+
+        public Address ToAddress() {
+            var item = new Address();
+            item.UpdateWithAddress(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithAddress(Address other) {
+            Street = other.Street;
+			PostalCode = other.PostalCode;
+			City = other.City;
+			Country = other.Country;
+			Flags = other.Flags;
+        }
+
+        /// <summary>
+        /// Merges all fields of Address that are present in the passed object with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithAddress(Address other) {
+            Street = other.Street;
+			PostalCode = other.PostalCode;
+			City = other.City;
+			Country = other.Country;
+			if (other.Flags != null && Flags != null) {
+			    var merged = JsonSerializer.SerializeToNode(Flags, DemoV3ModelJsonContext.Default.DictionaryStringString);
+			    DemoV3ModelJsonContext.Merge(merged, JsonSerializer.SerializeToNode(other.Flags, DemoV3ModelJsonContext.Default.DictionaryStringString));
+			    Flags = merged.Deserialize(DemoV3ModelJsonContext.Default.DictionaryStringString);
+			} else
+			    Flags = other.Flags == null ? null : new Dictionary<string, string>(other.Flags);
+        }
+
+        /// <summary>
+        /// Merges all fields of Address that are present in the passed JsonNode with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithAddress(JsonNode other) {
+            if (other is JsonObject otherObject)
+            {
+                foreach (var property in otherObject)
+                    MergePropertyAddress(property);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties
+        /// </summary>
+        protected bool MergePropertyAddress(KeyValuePair<string, JsonNode> property) {
+            switch (property.Key) {
+                case "street":
+					Street = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "postalCode":
+					PostalCode = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "city":
+					City = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "country":
+					Country = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "flags":
+					if (property.Value is JsonObject && Flags != null) {
+					    var merged = JsonSerializer.SerializeToNode(Flags, DemoV3ModelJsonContext.Default.DictionaryStringString);
+					    DemoV3ModelJsonContext.Merge(merged, property.Value);
+					    Flags = merged.Deserialize(DemoV3ModelJsonContext.Default.DictionaryStringString);
+					} else
+					    Flags = property.Value.Deserialize(DemoV3ModelJsonContext.Default.DictionaryStringString);
+					return true;
+            }
+            return false;
+        }
+
+        void IJsonOnDeserialized.OnDeserialized() {
+            CheckRequiredAddress();
+        }
+
+        /// <summary>
+        /// Throws a JsonException if a required field is null
+        /// </summary>
+        public void CheckRequiredAddress() {
+            if (Street == null)
+				throw new JsonException("Required property 'street' not found in JSON or is null");
+			if (PostalCode == null)
+				throw new JsonException("Required property 'postalCode' not found in JSON or is null");
+			if (City == null)
+				throw new JsonException("Required property 'city' not found in JSON or is null");
+			if (Country == null)
+				throw new JsonException("Required property 'country' not found in JSON or is null");
+        }
+    }
+}
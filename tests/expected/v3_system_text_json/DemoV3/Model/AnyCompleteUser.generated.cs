@@ -0,0 +1,10 @@
+using System.Text.Json.Serialization;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonDerivedType(typeof(UserWithId))]
+	[JsonDerivedType(typeof(GuestUser))]
+    public interface AnyCompleteUser {
+        string Type { get; }
+    }
+}
@@ -0,0 +1,10 @@
+using System.Text.Json.Serialization;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	[JsonDerivedType(typeof(User))]
+	[JsonDerivedType(typeof(GuestUser))]
+    public interface AnyUser {
+        string Type { get; }
+    }
+}
@@ -0,0 +1,60 @@
+using System;
+using System.Collections.Generic;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+    /// <summary>
+    /// source generated serialization for all models, request bodies and responses.
+    /// Add a partial class with [JsonSourceGenerationOptions] to change the serialization options
+    /// </summary>
+    [JsonSerializable(typeof(JsonObject))]
+    [JsonSerializable(typeof(JsonNode))]
+    [JsonSerializable(typeof(Dictionary<string, string>))]
+    [JsonSerializable(typeof(string))]
+    [JsonSerializable(typeof(int))]
+    [JsonSerializable(typeof(long))]
+    [JsonSerializable(typeof(double))]
+    [JsonSerializable(typeof(bool))]
+    [JsonSerializable(typeof(Guid))]
+    [JsonSerializable(typeof(DateTime))]
+    [JsonSerializable(typeof(IEnumerable<string>))]
+    [JsonSerializable(typeof(IEnumerable<int>))]
+    [JsonSerializable(typeof(IEnumerable<long>))]
+    [JsonSerializable(typeof(IEnumerable<double>))]
+    [JsonSerializable(typeof(IEnumerable<bool>))]
+    [JsonSerializable(typeof(IEnumerable<Guid>))]
+    [JsonSerializable(typeof(IEnumerable<DateTime>))]
+    [JsonSerializable(typeof(Error))]
+    [JsonSerializable(typeof(IEnumerable<Error>))]
+    [JsonSerializable(typeof(User))]
+    [JsonSerializable(typeof(IEnumerable<User>))]
+    [JsonSerializable(typeof(GuestUser))]
+    [JsonSerializable(typeof(IEnumerable<GuestUser>))]
+    [JsonSerializable(typeof(UserWithId))]
+    [JsonSerializable(typeof(IEnumerable<UserWithId>))]
+    [JsonSerializable(typeof(AnyUser))]
+    [JsonSerializable(typeof(IEnumerable<AnyUser>))]
+    [JsonSerializable(typeof(AnyCompleteUser))]
+    [JsonSerializable(typeof(IEnumerable<AnyCompleteUser>))]
+    [JsonSerializable(typeof(Pricing))]
+    [JsonSerializable(typeof(IEnumerable<Pricing>))]
+    [JsonSerializable(typeof(Address))]
+    [JsonSerializable(typeof(IEnumerable<Address>))]
+    public partial class DemoV3ModelJsonContext : JsonSerializerContext {
+        /// <summary>
+        /// Merges other into target. Objects are merged recursively, arrays and null values replace existing values
+        /// </summary>
+        public static void Merge(JsonNode target, JsonNode other) {
+            if (target is not JsonObject targetObject || other is not JsonObject otherObject)
+                return;
+            foreach (var property in otherObject) {
+                if (property.Value is JsonObject otherChild && targetObject[property.Key] is JsonObject targetChild)
+                    Merge(targetChild, otherChild);
+                else
+                    targetObject[property.Key] = property.Value?.DeepClone();
+            }
+        }
+    }
+}
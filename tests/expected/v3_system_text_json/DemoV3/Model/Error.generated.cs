@@ -0,0 +1,86 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+using System.Collections.Generic;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	public partial class Error : IJsonOnDeserialized {
+        public const string ErrorObjectName = "error";
+        /// <summary>
+		/// Single string based code describing the error.
+		/// </summary>
+		[JsonPropertyName("status"), JsonRequired]
+        public virtual string Status { get; set; }
+
+        /// <summary>
+		/// Human readable error message.
+		/// </summary>
+		[JsonPropertyName("message"), JsonRequired]
+        public virtual string Message { get; set; }
+
+        public Error ToError() {
+            var item = new Error();
+            item.UpdateWithError(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithError(Error other) {
+            Status = other.Status;
+			Message = other.Message;
+        }
+
+        /// <summary>
+        /// Merges all fields of Error that are present in the passed object with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithError(Error other) {
+            Status = other.Status;
+			Message = other.Message;
+        }
+
+        /// <summary>
+        /// Merges all fields of Error that are present in the passed JsonNode with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithError(JsonNode other) {
+            if (other is JsonObject otherObject)
+            {
+                foreach (var property in otherObject)
+                    MergePropertyError(property);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties
+        /// </summary>
+        protected bool MergePropertyError(KeyValuePair<string, JsonNode> property) {
+            switch (property.Key) {
+                case "status":
+					Status = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "message":
+					Message = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+            }
+            return false;
+        }
+
+        void IJsonOnDeserialized.OnDeserialized() {
+            CheckRequiredError();
+        }
+
+        /// <summary>
+        /// Throws a JsonException if a required field is null
+        /// </summary>
+        public void CheckRequiredError() {
+            if (Status == null)
+				throw new JsonException("Required property 'status' not found in JSON or is null");
+			if (Message == null)
+				throw new JsonException("Required property 'message' not found in JSON or is null");
+        }
+    }
+}
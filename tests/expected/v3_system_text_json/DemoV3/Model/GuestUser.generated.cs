@@ -0,0 +1,107 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+using System;
+using System.Collections.Immutable;
+using System.Linq;
+using System.Collections.Generic;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	public partial class GuestUser : AnyUser, AnyCompleteUser, IJsonOnDeserialized {
+        public const string GuestUserObjectName = "guestUser";
+        [JsonPropertyName("email"), JsonRequired]
+        public virtual string Email { get; set; }
+
+        // constant values for "type"
+        public const string TypeGuestValue = "guest";
+
+        /// <summary>
+        /// immutable array containing all allowed values for "type"
+        /// </summary>
+        public static readonly ImmutableArray<string> AllowedValuesForType = ImmutableArray.Create(TypeGuestValue);
+
+        [JsonIgnore]
+        private string _type = TypeGuestValue;
+
+        [JsonPropertyName("type"), JsonRequired]
+        public virtual string Type {
+            get {
+                return _type;
+            }
+            set {
+                if (!AllowedValuesForType.Contains(value))
+                {
+                    var allowedValues = string.Join(", ", AllowedValuesForType.Select(v=>v == null ? "null" : v.ToString()));
+                    throw new ArgumentOutOfRangeException("type",
+                        $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                }
+                _type = value;
+            }
+        }
+
+        public GuestUser ToGuestUser() {
+            var item = new GuestUser();
+            item.UpdateWithGuestUser(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithGuestUser(GuestUser other) {
+            Email = other.Email;
+			Type = other.Type;
+        }
+
+        /// <summary>
+        /// Merges all fields of GuestUser that are present in the passed object with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithGuestUser(GuestUser other) {
+            Email = other.Email;
+			Type = other.Type;
+        }
+
+        /// <summary>
+        /// Merges all fields of GuestUser that are present in the passed JsonNode with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithGuestUser(JsonNode other) {
+            if (other is JsonObject otherObject)
+            {
+                foreach (var property in otherObject)
+                    MergePropertyGuestUser(property);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties
+        /// </summary>
+        protected bool MergePropertyGuestUser(KeyValuePair<string, JsonNode> property) {
+            switch (property.Key) {
+                case "email":
+					Email = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "type":
+					Type = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+            }
+            return false;
+        }
+
+        void IJsonOnDeserialized.OnDeserialized() {
+            CheckRequiredGuestUser();
+        }
+
+        /// <summary>
+        /// Throws a JsonException if a required field is null
+        /// </summary>
+        public void CheckRequiredGuestUser() {
+            if (Email == null)
+				throw new JsonException("Required property 'email' not found in JSON or is null");
+			if (Type == null)
+				throw new JsonException("Required property 'type' not found in JSON or is null");
+        }
+    }
+}
@@ -0,0 +1,98 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+using System;
+using System.Collections.Immutable;
+using System.Linq;
+using System.Collections.Generic;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	public partial class Pricing : IJsonOnDeserialized {
+        public const string PricingObjectName = "pricing";
+        // constant values for "price"
+        public const double Price32_99Value = 32.99;
+		public const double Price33_99Value = 33.99;
+		public const double Price44_99Value = 44.99;
+
+        /// <summary>
+        /// immutable array containing all allowed values for "price"
+        /// </summary>
+        public static readonly ImmutableArray<double?> AllowedValuesForPrice = ImmutableArray.Create(Price32_99Value, Price33_99Value, Price44_99Value, (double?)null);
+
+        [JsonIgnore]
+        private double? _price = null;
+
+        [JsonPropertyName("price")]
+        public virtual double? Price {
+            get {
+                return _price;
+            }
+            set {
+                if (!AllowedValuesForPrice.Contains(value))
+                {
+                    var allowedValues = string.Join(", ", AllowedValuesForPrice.Select(v=>v == null ? "null" : v.ToString()));
+                    throw new ArgumentOutOfRangeException("price",
+                        $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                }
+                _price = value;
+            }
+        }
+
+        public Pricing ToPricing() {
+            var item = new Pricing();
+            item.UpdateWithPricing(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithPricing(Pricing other) {
+            Price = other.Price;
+        }
+
+        /// <summary>
+        /// Merges all fields of Pricing that are present in the passed object with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithPricing(Pricing other) {
+            Price = other.Price;
+        }
+
+        /// <summary>
+        /// Merges all fields of Pricing that are present in the passed JsonNode with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithPricing(JsonNode other) {
+            if (other is JsonObject otherObject)
+            {
+                foreach (var property in otherObject)
+                    MergePropertyPricing(property);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties
+        /// </summary>
+        protected bool MergePropertyPricing(KeyValuePair<string, JsonNode> property) {
+            switch (property.Key) {
+                case "price":
+					Price = property.Value.Deserialize(DemoV3ModelJsonContext.Default.NullableDouble);
+					return true;
+            }
+            return false;
+        }
+
+        void IJsonOnDeserialized.OnDeserialized() {
+            CheckRequiredPricing();
+        }
+
+        /// <summary>
+        /// Throws a JsonException if a required field is null
+        /// </summary>
+        public void CheckRequiredPricing() {
+            
+        }
+    }
+}
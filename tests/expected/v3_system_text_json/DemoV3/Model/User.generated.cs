@@ -0,0 +1,173 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+using System.Collections.Generic;
+using System.Linq;
+using System;
+using System.Collections.Immutable;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	public partial class User : AnyUser, IJsonOnDeserialized {
+        public const string UserObjectName = "user";
+        [JsonPropertyName("name"), JsonRequired]
+        public virtual string Name { get; set; }
+
+        [JsonPropertyName("address")]
+        public virtual Address Address { get; set; } = null;
+
+        [JsonConverter(typeof(CustomJsonDateConverter))]
+		[JsonPropertyName("birthdate")]
+        public virtual System.DateTime? Birthdate { get; set; } = null;
+
+        [JsonPropertyName("emails")]
+        public virtual ICollection<string> Emails { get; set; } = new List<string>();
+
+        // constant values for "type"
+        public const string TypeSimpleValue = "simple";
+
+        /// <summary>
+        /// immutable array containing all allowed values for "type"
+        /// </summary>
+        public static readonly ImmutableArray<string> AllowedValuesForType = ImmutableArray.Create(TypeSimpleValue);
+
+        [JsonIgnore]
+        private string _type = TypeSimpleValue;
+
+        [JsonPropertyName("type"), JsonRequired]
+        public virtual string Type {
+            get {
+                return _type;
+            }
+            set {
+                if (!AllowedValuesForType.Contains(value))
+                {
+                    var allowedValues = string.Join(", ", AllowedValuesForType.Select(v=>v == null ? "null" : v.ToString()));
+                    throw new ArgumentOutOfRangeException("type",
+                        $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                }
+                _type = value;
+            }
+        }
+
+        // constant values for "ageGroup"
+        public const int AgeGroup18Value = 18;
+		public const int AgeGroup40Value = 40;
+		public const int AgeGroup70Value = 70;
+		public const int AgeGroup120Value = 120;
+
+        /// <summary>
+        /// immutable array containing all allowed values for "ageGroup"
+        /// </summary>
+        public static readonly ImmutableArray<int> AllowedValuesForAgeGroup = ImmutableArray.Create(AgeGroup18Value, AgeGroup40Value, AgeGroup70Value, AgeGroup120Value);
+
+        [JsonIgnore]
+        private int _ageGroup = AgeGroup40Value;
+
+        [JsonPropertyName("ageGroup")]
+        public virtual int AgeGroup {
+            get {
+                return _ageGroup;
+            }
+            set {
+                if (!AllowedValuesForAgeGroup.Contains(value))
+                {
+                    var allowedValues = string.Join(", ", AllowedValuesForAgeGroup.Select(v=>v == null ? "null" : v.ToString()));
+                    throw new ArgumentOutOfRangeException("ageGroup",
+                        $"{value} is not allowed. Allowed values: [{allowedValues}]");
+                }
+                _ageGroup = value;
+            }
+        }
+
+        public User ToUser() {
+            var item = new User();
+            item.UpdateWithUser(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithUser(User other) {
+            Name = other.Name;
+			Address = other.Address?.ToAddress();
+			Birthdate = other.Birthdate;
+			Emails = other.Emails.ToList();
+			Type = other.Type;
+			AgeGroup = other.AgeGroup;
+        }
+
+        /// <summary>
+        /// Merges all fields of User that are present in the passed object with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUser(User other) {
+            Name = other.Name;
+			if (other.Address != null && Address != null)
+			    Address.MergeWithAddress(other.Address);
+			else
+			    Address = other.Address?.ToAddress();
+			Birthdate = other.Birthdate;
+			Emails = other.Emails?.ToList();
+			Type = other.Type;
+			AgeGroup = other.AgeGroup;
+        }
+
+        /// <summary>
+        /// Merges all fields of User that are present in the passed JsonNode with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUser(JsonNode other) {
+            if (other is JsonObject otherObject)
+            {
+                foreach (var property in otherObject)
+                    MergePropertyUser(property);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties
+        /// </summary>
+        protected bool MergePropertyUser(KeyValuePair<string, JsonNode> property) {
+            switch (property.Key) {
+                case "name":
+					Name = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "address":
+					if (property.Value is JsonObject && Address != null)
+					    Address.MergeWithAddress(property.Value);
+					else
+					    Address = property.Value.Deserialize(DemoV3ModelJsonContext.Default.Address);
+					return true;
+				case "birthdate":
+					Birthdate = property.Value.Deserialize(DemoV3ModelJsonContext.Default.NullableDateTime);
+					return true;
+				case "emails":
+					Emails = property.Value.Deserialize(DemoV3ModelJsonContext.Default.ICollectionString);
+					return true;
+				case "type":
+					Type = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "ageGroup":
+					AgeGroup = property.Value.Deserialize(DemoV3ModelJsonContext.Default.Int32);
+					return true;
+            }
+            return false;
+        }
+
+        void IJsonOnDeserialized.OnDeserialized() {
+            CheckRequiredUser();
+        }
+
+        /// <summary>
+        /// Throws a JsonException if a required field is null
+        /// </summary>
+        public void CheckRequiredUser() {
+            if (Name == null)
+				throw new JsonException("Required property 'name' not found in JSON or is null");
+			if (Type == null)
+				throw new JsonException("Required property 'type' not found in JSON or is null");
+        }
+    }
+}
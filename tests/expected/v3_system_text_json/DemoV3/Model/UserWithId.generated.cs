@@ -0,0 +1,79 @@
+using System.Text.Json;
+using System.Text.Json.Nodes;
+using System.Text.Json.Serialization;
+using System.Collections.Generic;
+
+namespace DemoV3.Model {
+    /// AUTOGENERED BY caffoa ///
+	public partial class UserWithId : User, AnyCompleteUser, IJsonOnDeserialized {
+        public const string UserWithIdObjectName = "userWithId";
+        [JsonPropertyName("id")]
+        public virtual string Id { get; set; }
+
+        [JsonPropertyName("registrationDate")]
+        public virtual System.DateTime RegistrationDate { get; set; }
+
+        public UserWithId ToUserWithId() {
+            var item = new UserWithId();
+            item.UpdateWithUserWithId(this);
+            return item;
+        }
+
+        /// <summary>
+        /// Replaces all fields with the data of the passed object
+        /// </summary>
+        public void UpdateWithUserWithId(UserWithId other) {
+            UpdateWithUser(other);
+			Id = other.Id;
+			RegistrationDate = other.RegistrationDate;
+        }
+
+        /// <summary>
+        /// Merges all fields of UserWithId that are present in the passed object with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUserWithId(UserWithId other) {
+            MergeWithUser(other);
+			Id = other.Id;
+			RegistrationDate = other.RegistrationDate;
+        }
+
+        /// <summary>
+        /// Merges all fields of UserWithId that are present in the passed JsonNode with the current object.
+        /// Arrays will be replaced and null value will replace existing values
+        /// </summary>
+        public void MergeWithUserWithId(JsonNode other) {
+            if (other is JsonObject otherObject)
+            {
+                foreach (var property in otherObject)
+                    MergePropertyUserWithId(property);
+            }
+        }
+
+        /// <summary>
+        /// Merges a single JSON property into the matching field. Returns false for unknown properties
+        /// </summary>
+        protected bool MergePropertyUserWithId(KeyValuePair<string, JsonNode> property) {
+            switch (property.Key) {
+                case "id":
+					Id = property.Value.Deserialize(DemoV3ModelJsonContext.Default.String);
+					return true;
+				case "registrationDate":
+					RegistrationDate = property.Value.Deserialize(DemoV3ModelJsonContext.Default.DateTime);
+					return true;
+            }
+            return MergePropertyUser(property);
+        }
+
+        void IJsonOnDeserialized.OnDeserialized() {
+            CheckRequiredUserWithId();
+        }
+
+        /// <summary>
+        /// Throws a JsonException if a required field is null
+        /// </summary>
+        public void CheckRequiredUserWithId() {
+            CheckRequiredUser();
+        }
+    }
+}
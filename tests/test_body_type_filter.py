@@ -0,0 +1,70 @@
+import pytest
+
+from caffoa.body_type_filter import BodyTypeFilter
+from caffoa.model import EndPoint
+
+
+def endpoint(operation: str, method: str = "post", path: str = "/users") -> EndPoint:
+    return EndPoint(operation, operation, path, method, list(), list(), True)
+
+
+def body_type(config: list, *args) -> str:
+    return BodyTypeFilter(config).body_type(endpoint(*args))
+
+
+def test_exact_rules():
+    config = [dict(type="JObject", filter=dict(operations=["user-patch"], methods=["PATCH"]))]
+    assert body_type(config, "user-patch") == "JObject"
+    assert body_type(config, "user-put", "patch") == "JObject"
+    assert body_type(config, "user-patch-all") is None
+    assert body_type(config, "user-put", "put") is None
+
+
+def test_wildcard_rules():
+    config = [dict(type="JObject", filter=dict(operations=["admin-*", "user-?et"]))]
+    assert body_type(config, "admin-delete") == "JObject"
+    assert body_type(config, "user-get") == "JObject"
+    assert body_type(config, "user-reset") is None
+    assert body_type(config, "super-admin-delete") is None
+
+
+def test_regex_rules():
+    config = [dict(type="JObject", filter=dict(operationPatterns=["^legacy-.*$", "(?i)old-(?P<name>\\w+)",
+                                                                 "(?P<name>new)-x"]))]
+    assert body_type(config, "legacy-user") == "JObject"
+    assert body_type(config, "OLD-user") == "JObject"
+    assert body_type(config, "new-x") == "JObject"
+    assert body_type(config, "new-user") is None
+    assert body_type(config, "my-legacy-user") is None
+
+
+def test_invalid_regex_names_rule():
+    with pytest.raises(Warning, match="requestBodyType #2"):
+        BodyTypeFilter([dict(type="A", filter=dict(operationPatterns=["a.*"])),
+                        dict(type="B", filter=dict(operationPatterns=["(unclosed"]))])
+
+
+def test_path_prefix_rules():
+    config = [dict(type="JObject", filter=dict(paths=["/admin/"]))]
+    assert body_type(config, "a", "post", "/admin") == "JObject"
+    assert body_type(config, "a", "post", "/admin/users/{id}") == "JObject"
+    assert body_type(config, "a", "post", "/administrators") is None
+    assert body_type([dict(type="JObject", filter=dict(paths=["/"]))], "a", "post", "/users") == "JObject"
+
+
+def test_first_matching_rule_wins():
+    config = [dict(type="A", filter=dict(paths=["/users"])),
+              dict(type="B", filter=dict(operations=["user-*"], methods=["post"])),
+              dict(type="C", filter=dict(operationPatterns=["user-.*"]))]
+    assert body_type(config, "user-post", "post", "/users") == "A"
+    assert body_type(config, "user-post", "put", "/other") == "B"
+    assert body_type(config[2:] + config[:2], "user-post", "post", "/users") == "C"
+    assert body_type(config, "other", "put", "/other") is None
+
+
+def test_additional_imports():
+    config = [dict(type="JObject", filter=dict(methods=["patch"])),
+              dict(type="JsonObject", filter=dict(methods=["put"]))]
+    assert BodyTypeFilter(config).additional_imports(endpoint("a", "patch")) == ["Newtonsoft.Json.Linq"]
+    assert BodyTypeFilter(config).additional_imports(endpoint("a", "put")) == ["System.Text.Json.Nodes"]
+    assert BodyTypeFilter(config).additional_imports(endpoint("a", "get")) == []
@@ -0,0 +1,45 @@
+"""
+compiles the generated demo and the models of merge.openapi.yml together with the C# tests in tests/dotnet,
+and runs them.
+Skipped if dotnet is not installed or the packages cannot be restored.
+Set CAFFOA_NEWTONSOFT_JSON_PATH to a Newtonsoft.Json.dll to build without the Newtonsoft.Json package.
+"""
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import SPEC_FOLDER
+from test_generated_output import CASES
+
+DOTNET = shutil.which("dotnet")
+PROJECT_FOLDER = os.path.join(SPEC_FOLDER, "dotnet")
+
+pytestmark = pytest.mark.skipif(DOTNET is None, reason="dotnet is not installed")
+
+
+@pytest.mark.parametrize("case, serializer", [("v3", "newtonsoft"), ("v3_system_text_json", "systemTextJson")])
+def test_generated_code(generator, case, serializer):
+    config = CASES[case]()
+    shutil.copy(os.path.join(SPEC_FOLDER, "merge.openapi.yml"), generator.path("merge.openapi.yml"))
+    config["services"].append(dict(apiPath="merge.openapi.yml",
+                                   model=dict(namespace="CaffoaTests.Merge", targetFolder="demo/Merge")))
+    generator.run(config)
+    project = generator.path("dotnet")
+    shutil.copytree(PROJECT_FOLDER, project)
+    output = generator.path("bin")
+    args = [DOTNET, "build", project, "-o", output, f"-p:GeneratedFolder={generator.path('demo')}",
+            f"-p:Serializer={serializer}"]
+    if os.environ.get("CAFFOA_NEWTONSOFT_JSON_PATH"):
+        args.append(f"-p:NewtonsoftJsonPath={os.environ['CAFFOA_NEWTONSOFT_JSON_PATH']}")
+    env = dict(os.environ, DOTNET_CLI_TELEMETRY_OPTOUT="1", DOTNET_NOLOGO="1")
+    result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True,
+                            env=env, timeout=600)
+    if "error NU1" in result.stdout:
+        pytest.skip(f"packages cannot be restored:\n{result.stdout}")
+    assert result.returncode == 0, result.stdout
+    result = subprocess.run([DOTNET, os.path.join(output, "CaffoaTests.dll")], stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, universal_newlines=True, env=env, timeout=600)
+    assert result.returncode == 0, result.stdout
+    assert "all checks passed" in result.stdout
@@ -0,0 +1,58 @@
+import json
+import logging
+
+from caffoa.duplication_handler import DuplicationHandler
+from conftest import demo_config
+
+
+def test_once_skips_names_generated_earlier(caplog):
+    handler = DuplicationHandler("Once ")
+    handler.set_service("a.yml")
+    assert handler.should_generate("User", "A.Model", "shape")
+    handler.store_generated("User", "A.Model", "shape")
+    handler.set_service("b.yml")
+    with caplog.at_level(logging.WARNING):
+        assert not handler.should_generate("User", "B.Model", "shape")
+    assert "differs" not in caplog.text
+    assert "Skipping User" in caplog.text
+
+
+def test_overwrite_generates_again():
+    handler = DuplicationHandler("overwrite")
+    handler.store_generated("User", "A.Model", "shape")
+    assert handler.should_generate("User", "A.Model", "shape")
+
+
+def test_different_shapes_are_reported(caplog):
+    handler = DuplicationHandler("once")
+    handler.set_service("a.yml")
+    handler.store_generated("User", "Model", "shape a")
+    handler.set_service("b.yml")
+    with caplog.at_level(logging.WARNING):
+        handler.should_generate("User", "Model", "shape b")
+    assert "User in b.yml (Model) differs from User in a.yml (Model)" in caplog.text
+
+
+def test_registry_reports_moved_names(tmp_path, caplog):
+    file_name = str(tmp_path / "duplicates.json")
+    handler = DuplicationHandler("once", file_name)
+    handler.set_service("a.yml")
+    handler.store_generated("User", "Model", "shape")
+    handler.save()
+    with open(file_name, "r", encoding="utf-8") as f:
+        assert json.load(f)["names"]["User"] == dict(service="a.yml", namespace="Model", shape="shape")
+    handler = DuplicationHandler("once", file_name)
+    handler.set_service("b.yml")
+    with caplog.at_level(logging.INFO):
+        handler.store_generated("User", "Model", "shape")
+    assert "User is now generated by b.yml instead of a.yml" in caplog.text
+
+
+def test_services_sharing_a_namespace_write_each_model_once(generator, caplog):
+    config = demo_config(3)
+    config["services"].append(dict(apiPath="openapi.yml", config=dict(), model=config["services"][0]["model"]))
+    with caplog.at_level(logging.WARNING):
+        rendered = generator.run(config)
+    assert rendered.count("demo/DemoV3/Model/User.generated.cs") == 1
+    assert "Skipping User, already written earlier" in caplog.text
+    assert "differs" not in caplog.text
@@ -0,0 +1,57 @@
+"""
+compares the generated demo with the expected output in tests/expected.
+After an intended change of the output, run the tests with CAFFOA_UPDATE_EXPECTED=1 to update the expected files.
+"""
+import os
+import shutil
+
+import pytest
+import yaml
+
+from conftest import SPEC_FOLDER
+
+REPO_FOLDER = os.path.dirname(SPEC_FOLDER)
+EXPECTED_FOLDER = os.path.join(SPEC_FOLDER, "expected")
+
+
+def demo_config(version: int) -> dict:
+    with open(os.path.join(REPO_FOLDER, f"caffoav{version}.yml"), "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    for service in config["services"]:
+        service["apiPath"] = "openapi.yml"
+    return config
+
+
+def system_text_json_config() -> dict:
+    config = demo_config(3)
+    config["config"]["serializer"] = "systemTextJson"
+    for item in config["config"]["requestBodyType"]:
+        item["type"] = "JsonObject"
+    return config
+
+
+CASES = dict(v1=lambda: demo_config(1), v2=lambda: demo_config(2), v3=lambda: demo_config(3),
+             v3_system_text_json=system_text_json_config)
+
+
+def read_tree(folder: str) -> dict:
+    files = dict()
+    for root, _, names in os.walk(folder):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, "r", encoding="utf-8") as f:
+                files[os.path.relpath(path, folder).replace(os.sep, "/")] = f.read()
+    return files
+
+
+@pytest.mark.parametrize("case", list(CASES))
+def test_generated_output(generator, case):
+    generator.run(CASES[case]())
+    expected_folder = os.path.join(EXPECTED_FOLDER, case)
+    if os.environ.get("CAFFOA_UPDATE_EXPECTED"):
+        shutil.rmtree(expected_folder, ignore_errors=True)
+        shutil.copytree(generator.path("demo"), expected_folder)
+    generated, expected = read_tree(generator.path("demo")), read_tree(expected_folder)
+    assert sorted(generated) == sorted(expected)
+    for name, content in expected.items():
+        assert generated[name] == content, name
@@ -0,0 +1,149 @@
+import os
+
+import pytest
+
+from caffoa import output
+from caffoa.manifest import GenerationManifest, fingerprint
+from conftest import demo_config
+
+
+@pytest.mark.parametrize("version", [1, 2, 3])
+@pytest.mark.parametrize("split", [None, "tags", 2])
+def test_unchanged_spec_renders_nothing(generator, version, split):
+    config = demo_config(version) if split is None else demo_config(version, split=split)
+    assert generator.run(config)
+    for _ in range(2):
+        assert generator.run(config) == []
+
+
+def test_only_changed_shards_are_rendered(generator):
+    config = demo_config(3, split="tags")
+    generator.run(config)
+    with open(generator.path("openapi.yml"), "r", encoding="utf-8") as f:
+        spec = f.read()
+    with open(generator.path("openapi.yml"), "w", encoding="utf-8") as f:
+        f.write(spec.replace("description: update a user\n", "description: update an existing user\n"))
+    assert generator.run(config) == ["demo/DemoV3/DemoV3Functions.Default.generated.cs",
+                                     "demo/DemoV3/IDemoV3Service.Default.generated.cs"]
+
+
+@pytest.mark.parametrize("clean", [True, False])
+def test_stale_shards_are_removed(generator, clean):
+    config = demo_config(3, split="tags")
+    config["config"]["clearGeneratedFiles"] = clean
+    generator.run(config)
+    shards = ["demo/DemoV3/DemoV3Functions.User.generated.cs", "demo/DemoV3/IDemoV3Service.User.generated.cs"]
+    assert set(shards) <= set(generator.files())
+    with open(generator.path("openapi.yml"), "r", encoding="utf-8") as f:
+        spec = f.read()
+    with open(generator.path("openapi.yml"), "w", encoding="utf-8") as f:
+        f.write(spec.replace("      tags:\n        - user\n", ""))
+    generator.run(config)
+    assert not set(shards) & set(generator.files())
+    assert "demo/DemoV3/DemoV3Functions.Default.generated.cs" in generator.files()
+
+
+def test_shards_are_removed_without_split(generator):
+    config = demo_config(3, split=2)
+    config["config"]["clearGeneratedFiles"] = False
+    generator.run(config)
+    assert "demo/DemoV3/DemoV3Functions.Part1.generated.cs" in generator.files()
+    del config["services"][0]["function"]["split"]
+    generator.run(config)
+    assert [name for name in generator.files() if name.count(".") > 2] == []
+    assert "demo/DemoV3/DemoV3Functions.generated.cs" in generator.files()
+
+
+def test_full_renders_everything(generator):
+    config = demo_config(3)
+    rendered = generator.run(config)
+    assert generator.run(config, "--full") == rendered
+    config["config"]["incremental"] = False
+    assert generator.run(config) == rendered
+
+
+def test_changed_generated_file_is_rendered_again(generator):
+    config = demo_config(3)
+    generator.run(config)
+    file_name = generator.path("demo/DemoV3/Model/User.generated.cs")
+    with open(file_name, "r", encoding="utf-8") as f:
+        content = f.read()
+    with open(file_name, "a", encoding="utf-8") as f:
+        f.write("// changed\n")
+    assert generator.run(config) == ["demo/DemoV3/Model/User.generated.cs"]
+    with open(file_name, "r", encoding="utf-8") as f:
+        assert f.read() == content
+
+
+def test_unreadable_manifest_renders_everything(generator):
+    config = demo_config(3)
+    rendered = generator.run(config)
+    with open(generator.path(".caffoa-manifest.json"), "w", encoding="utf-8") as f:
+        f.write("{")
+    assert generator.run(config) == rendered
+    assert generator.run(config) == []
+
+
+def test_stale_files_are_removed_only_if_recorded(generator):
+    config = demo_config(3)
+    config["config"]["clearGeneratedFiles"] = False
+    generator.run(config)
+    own_file = generator.path("demo/DemoV3/Model/User.cs")
+    with open(own_file, "w", encoding="utf-8") as f:
+        f.write("// not generated\n")
+    config["services"][0]["model"]["excludes"] = ["pricing"]
+    generator.run(config)
+    assert "demo/DemoV3/Model/Pricing.generated.cs" in generator.files()
+    generator.run(config, "--clean")
+    assert "demo/DemoV3/Model/Pricing.generated.cs" not in generator.files()
+    assert "demo/DemoV3/Model/User.cs" in generator.files()
+
+
+def test_clean_keeps_files_of_other_configs(generator):
+    first, second = demo_config(3), demo_config(2)
+    generator.run(first, config_file="first.yml")
+    first_files = generator.files()
+    generator.run(second, "--clean", config_file="second.yml")
+    assert set(first_files) < set(generator.files())
+    second["services"][0]["model"]["excludes"] = ["pricing"]
+    generator.run(second, "--clean", config_file="second.yml")
+    assert "demo/DemoV2/Model/Pricing.generated.cs" not in generator.files()
+    assert set(first_files) < set(generator.files())
+
+
+def test_files_are_written_only_if_changed(tmp_path):
+    file_name = str(tmp_path / "file.cs")
+    output.init()
+    assert output.write(file_name, "content")
+    mtime = os.stat(file_name).st_mtime_ns
+    assert not output.write(file_name, "content")
+    assert not output.write_stream(file_name, ["con", "tent"])
+    assert os.stat(file_name).st_mtime_ns == mtime
+    assert output.write_stream(file_name, ["new ", "content"])
+    with open(file_name, "r", encoding="utf-8") as f:
+        assert f.read() == "new content"
+    assert (output.get().written, output.get().unchanged) == (2, 2)
+    assert os.listdir(str(tmp_path)) == ["file.cs"]  # no temporary files are left
+
+
+def test_manifest_detects_changes(tmp_path):
+    file_name = str(tmp_path / "file.cs")
+    manifest_file = str(tmp_path / "manifest.json")
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write("content")
+    generated = GenerationManifest(manifest_file, True)
+    generated.record(file_name, "inputs")
+    generated.save()
+    assert GenerationManifest(manifest_file, True).is_current(file_name, "inputs")
+    assert not GenerationManifest(manifest_file, True).is_current(file_name, "other inputs")
+    assert not GenerationManifest(manifest_file, False).is_current(file_name, "inputs")
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write("changed")
+    assert not GenerationManifest(manifest_file, True).is_current(file_name, "inputs")
+    os.unlink(file_name)
+    assert not GenerationManifest(manifest_file, True).is_current(file_name, "inputs")
+
+
+def test_fingerprint_is_stable():
+    assert fingerprint(dict(a=1, b=[1, 2])) == fingerprint(dict(b=[1, 2], a=1))
+    assert fingerprint(dict(a=1)) != fingerprint(dict(a=2))
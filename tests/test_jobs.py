@@ -0,0 +1,75 @@
+import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from caffoa import generator as generator_module
+from conftest import demo_config
+
+OTHER_SPEC = """openapi: "3.0.2"
+info:
+  title: Other API
+  version: "1.0"
+paths: {}
+components:
+  schemas:
+    address:
+      type: object
+      properties:
+        street:
+          type: string
+    location:
+      type: object
+      properties:
+        name:
+          type: string
+"""
+
+
+def run(generator, caplog, config: dict, *args: str):
+    """
+    generates from scratch, and returns the generated files and the log
+    """
+    shutil.rmtree(generator.path("demo"), ignore_errors=True)
+    if os.path.exists(generator.path(".caffoa-manifest.json")):
+        os.unlink(generator.path(".caffoa-manifest.json"))
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        generator.run(config, *args)
+    files = dict()
+    for name in generator.files():
+        with open(generator.path(name), "rb") as f:
+            files[name] = f.read()
+    return files, [(record.levelname, record.getMessage()) for record in caplog.records]
+
+
+def test_parallel_output_is_identical(generator, caplog, monkeypatch):
+    executors = list()
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            executors.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(generator_module, "ProcessPoolExecutor", RecordingExecutor)
+    with open(generator.path("other.openapi.yml"), "w", encoding="utf-8") as f:
+        f.write(OTHER_SPEC)
+    config = demo_config(3)
+    config["services"].append(dict(apiPath="openapi.yml", model=dict(namespace="DemoV3.Model",
+                                                                      targetFolder="demo/DemoV3/Model")))
+    config["services"].append(dict(apiPath="other.openapi.yml", model=dict(namespace="DemoV3.Model",
+                                                                            targetFolder="demo/DemoV3/Model")))
+    serial_files, serial_log = run(generator, caplog, config)
+    assert executors == []
+    parallel_files, parallel_log = run(generator, caplog, config, "--jobs", "3")
+    assert executors == [dict(max_workers=3)]
+    assert parallel_files == serial_files
+    assert parallel_log == serial_log
+    # services are written in order: the second one only skips, the third one reports its different address
+    messages = [message for _, message in serial_log]
+    differs = messages.index("Address in other.openapi.yml (DemoV3.Model) differs from Address in openapi.yml "
+                             "(DemoV3.Model)")
+    assert messages.count("Skipping Address, already written earlier") == 2
+    assert messages[:differs].count("Skipping Address, already written earlier") == 1
+    assert any(message.startswith("Writing class Location") for message in messages[differs:])
+    assert "demo/DemoV3/Model/Location.generated.cs" in serial_files
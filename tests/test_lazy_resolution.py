@@ -0,0 +1,57 @@
+import shutil
+
+import pytest
+
+from caffoa import openapi_file
+from conftest import demo_config
+
+UNUSED_SCHEMA = """    unused:
+      type: object
+      properties:
+        other:
+          $ref: "#/components/schemas/unusedChild"
+    unusedChild:
+      type: string
+
+  responses:
+"""
+
+
+def read_files(generator) -> dict:
+    files = dict()
+    for name in generator.files():
+        with open(generator.path(name), "r", encoding="utf-8") as f:
+            files[name] = f.read()
+    return files
+
+
+@pytest.mark.parametrize("includes", [None, ["anyUser"]])
+def test_lazy_resolution_equals_full_resolution(generator, monkeypatch, includes):
+    with open(generator.path("openapi.yml"), "r", encoding="utf-8") as f:
+        spec = f.read()
+    with open(generator.path("openapi.yml"), "w", encoding="utf-8") as f:
+        f.write(spec.replace("  responses:\n", UNUSED_SCHEMA, 1))
+    pruned = list()
+    original_prune = openapi_file.prune_spec
+
+    def prune_spec(*args):
+        result = original_prune(*args)
+        pruned.append(sorted(result["components"]["schemas"]))
+        return result
+
+    monkeypatch.setattr(openapi_file, "prune_spec", prune_spec)
+    config = demo_config(3)
+    if includes is None:
+        del config["services"][0]["model"]
+    else:
+        config["services"][0]["model"]["includes"] = includes
+
+    generator.run(config)
+    full = read_files(generator)
+    shutil.rmtree(generator.path("demo"))
+    config["config"]["lazyResolution"] = True
+    generator.run(config, "--full")
+    assert read_files(generator) == full
+    assert len(pruned) == 1
+    assert "unused" not in pruned[0] and "unusedChild" not in pruned[0]
+    assert "user" in pruned[0]
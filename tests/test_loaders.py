@@ -0,0 +1,75 @@
+import datetime
+
+import pytest
+import yaml
+
+from caffoa import loaders
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("yes", "yes"), ("on", "on"), ("No", "No"), ("true", True), ("False", False),
+    ("010", 10), ("0o10", 8), ("0x1F", 31), ("-0b11", -3), ("1_000", 1000),
+    ("1.5", 1.5), ("1e3", 1000.0), (".inf", float("inf")), ("1.0.0", "1.0.0"), ("3.0.2", "3.0.2"),
+    ("~", None), ("2021-01-01", datetime.date(2021, 1, 1)),
+])
+def test_yaml_core_schema_scalars(text, expected):
+    from prance.util import formats
+    assert loaders.load_yaml(f"value: {text}") == dict(value=expected)
+    # the same as prance's own parser
+    assert formats.parse_spec(f"value: {text}", "spec.yml") == dict(value=expected)
+
+
+def test_yaml_duplicate_keys_are_errors():
+    with pytest.raises(yaml.YAMLError, match="duplicate key"):
+        loaders.load_yaml("a: 1\nb: 2\na: 3\n")
+    assert loaders.load_yaml("base: &base {a: 1}\nchild:\n  <<: *base\n  a: 2\n")["child"] == dict(a=2)
+
+
+def test_config_keeps_yaml_1_1_semantics():
+    assert loaders.load_config("value: yes") == dict(value=True)
+
+
+def test_json():
+    assert loaders.load_json('{"a": [1, 2.5, "x", null]}') == dict(a=[1, 2.5, "x", None])
+    assert loaders.load_json('{"big": 123456789012345678901234567890, "nan": NaN}')["big"] == \
+           123456789012345678901234567890
+
+
+def test_invalid_specs_are_passed_to_prance():
+    from prance.util import formats
+    with pytest.raises(formats.ParseError):
+        loaders._parse_spec("{ invalid", "spec.json")
+
+
+def test_parsed_files_are_cached_per_file(tmp_path):
+    file_name = str(tmp_path / "spec.yml")
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write("a: [1]\n")
+    files = loaders.ParsedFiles()
+    assert files.get(file_name, "a: [1]\n") is None
+    files.store(file_name, "a: [1]\n", dict(a=[1]))
+    first = files.get(file_name, "a: [1]\n")
+    assert first == dict(a=[1])
+    first["a"].append(2)  # every caller gets its own copy
+    assert files.get(file_name, "a: [1]\n") == dict(a=[1])
+    assert files.get(file_name, "a: [2]\n") is None  # changed within the resolution of the timestamp
+    assert (files.hits, files.misses) == (2, 2)
+
+
+def test_fast_spec_parsing_patches_prance_temporarily(tmp_path):
+    from prance.util import formats
+    original = formats.parse_spec
+    file_name = str(tmp_path / "spec.yml")
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write("value: yes\n")
+    loaders.ParsedFiles.instance = None
+    with loaders.fast_spec_parsing():
+        assert formats.parse_spec is loaders.parse_spec
+        with loaders.fast_spec_parsing():
+            assert formats.parse_spec is loaders.parse_spec
+        assert formats.parse_spec is loaders.parse_spec
+        assert formats.parse_spec("value: yes\n", file_name) == dict(value="yes")
+        assert formats.parse_spec("value: yes\n", file_name) == dict(value="yes")
+    assert formats.parse_spec is original
+    assert not hasattr(formats, "_caffoa_original_parse_spec")
+    assert loaders.parsed_files().hits == 1
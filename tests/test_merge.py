@@ -0,0 +1,42 @@
+import os
+import re
+import shutil
+
+import pytest
+
+from conftest import SPEC_FOLDER
+
+
+def generate(generator, serializer: str) -> str:
+    shutil.copy(os.path.join(SPEC_FOLDER, "merge.openapi.yml"), generator.path("merge.openapi.yml"))
+    config = dict(config=dict(version=3, serializer=serializer),
+                  services=[dict(apiPath="merge.openapi.yml",
+                                 model=dict(namespace="Merge.Model", targetFolder="demo/Merge"))])
+    generator.run(config)
+    with open(generator.path("demo/Merge/Item.generated.cs"), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("serializer", ["newtonsoft", "systemTextJson"])
+def test_merge_cases_are_unique(generator, serializer):
+    labels = re.findall(r'case "(\w+)":', generate(generator, serializer))
+    assert labels == ["id", "ID", "label", "count", "tags", "nested", "owner"]
+
+
+def test_merge_finds_names_case_insensitively(generator):
+    content = generate(generator, "newtonsoft")
+    assert 'ItemPropertyNames = { "id", "ID", "label", "count", "tags", "nested", "owner" };' in content
+    assert "ToLowerInvariant" not in content
+    with open(generator.path("demo/Merge/NamedItem.generated.cs"), "r", encoding="utf-8") as f:
+        derived = f.read()
+    assert "return MergePropertyItem(name, property, mergeSettings);" in derived
+    assert "return FindPropertyNameItem(name);" in derived
+
+
+@pytest.mark.parametrize("serializer", ["newtonsoft", "systemTextJson"])
+def test_interfaces_are_replaced(generator, serializer):
+    content = generate(generator, serializer)
+    assert "Nested.MergeWithNested(" in content
+    assert "Owner.MergeWith" not in content
+    assert "ToOwner()" not in content
+    assert "Owner = other.Owner;" in content
@@ -0,0 +1,34 @@
+from caffoa.model_parser import ModelParser
+from caffoa.naming import NameIndex, SCHEMA_PREFIX
+from caffoa.spec_cache import CachedParser
+
+SPEC = dict(components=dict(schemas={
+    "user": dict(type="object", properties=dict(address={"$ref": SCHEMA_PREFIX + "address"})),
+    "address": dict(type="object", properties=dict(street=dict(type="string"))),
+    "userId": dict(type="string")}))
+
+
+def test_names_are_kept_per_prefix_and_suffix():
+    names = NameIndex(SPEC)
+    prefixed = names.naming("Pre", "")
+    assert prefixed.class_name_from_ref(SCHEMA_PREFIX + "user") == "PreUser"
+    suffixed = names.naming("", "Suf")
+    assert suffixed.class_name_from_ref(SCHEMA_PREFIX + "user") == "UserSuf"
+    assert prefixed.class_name("user") == "PreUser"
+    assert names.naming("Pre", "") is prefixed
+    assert names.naming(None, None) is names.naming("", "")
+    assert names.naming("", "").class_name("userId") == "UserId"
+
+
+def test_changed_prefix_is_used_by_model_parser():
+    parser = ModelParser()
+    parser.names = NameIndex(SPEC)
+    parser.prefix = "Pre"
+    assert [model.name for model in parser.parse(CachedParser(SPEC))] == ["PreUser", "PreAddress"]
+    assert "PreUserId" in parser.known_types
+    parser.prefix, parser.suffix = "", "Suf"
+    parser.known_types = dict()
+    models = parser.parse(CachedParser(SPEC))
+    assert [model.name for model in models] == ["UserSuf", "AddressSuf"]
+    assert [prop.typename for prop in models[0].properties] == ["AddressSuf"]
+    assert list(parser.known_types) == ["UserIdSuf"]
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from caffoa import manifest, output
+from caffoa.function_writer import FunctionWriter
+from caffoa.openapi_file import OpenApiFile
+
+DEFAULTS = {"enabled": True, "maxBytes": 8192, "sampleRate": 1.0}
+
+
+def payload_logging_config(payload_logging: dict) -> dict:
+    return OpenApiFile("openapi.yml", 3, dict()).payload_logging_config(dict(payloadLogging=payload_logging),
+                                                                         DEFAULTS)
+
+
+@pytest.mark.parametrize("payload_logging, message", [
+    (dict(maxBytes=-1), "maxBytes must be a non-negative number"),
+    (dict(maxBytes=True), "maxBytes must be a non-negative number"),
+    (dict(maxBytes="8k"), "maxBytes must be a non-negative number"),
+    (dict(sampleRate=1.5), "sampleRate must be between 0 and 1"),
+    (dict(sampleRate=False), "sampleRate must be between 0 and 1"),
+    (dict(enabled="yes"), "enabled must be true or false"),
+    (dict(rate=1), "payloadLogging can only contain"),
+])
+def test_invalid_payload_logging(payload_logging, message):
+    with pytest.raises(Warning, match=message):
+        payload_logging_config(payload_logging)
+
+
+def test_payload_logging_defaults():
+    assert payload_logging_config(dict()) == DEFAULTS
+    assert payload_logging_config(dict(maxBytes=0, sampleRate=0)) == dict(enabled=True, maxBytes=0, sampleRate=0)
+    assert OpenApiFile("openapi.yml", 3, dict(payloadLogging=dict(enabled=False))).payload_logging_config(
+        dict(), DEFAULTS) == dict(DEFAULTS, enabled=False)
+
+
+def test_payload_logging_is_rendered(tmp_path, monkeypatch):
+    monkeypatch.setattr(manifest.GenerationManifest, "instance", None)
+    output.init()
+    writer = FunctionWriter(3, "Demo", "Demo", str(tmp_path), "IDemoService")
+    os.makedirs(writer.error_folder)
+    writer.payload_logging = dict(enabled=False, maxBytes=0, sampleRate=0.25)
+    writer.write([])
+    with open(str(tmp_path / "DemoFunctions.generated.cs"), "r", encoding="utf-8") as f:
+        content = f.read()
+    assert "LogPayload { get; set; } = false;" in content
+    assert "MaxPayloadBytes { get; set; } = 0;" in content
+    assert "PayloadSampleRate { get; set; } = 0.25;" in content
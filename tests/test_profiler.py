@@ -0,0 +1,64 @@
+import json
+import tracemalloc
+
+from caffoa import profiler
+from caffoa.profiler import Profiler
+from conftest import demo_config
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def process_time(self) -> float:
+        return self.now / 2
+
+
+def test_nested_phases_are_not_counted_twice(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(profiler, "time", clock)
+    profile = Profiler(False)
+    profile.service = "service"
+    profile.start("rendering")
+    clock.now = 1.0
+    profile.start("file I/O")
+    clock.now = 4.0
+    profile.stop()
+    clock.now = 5.0
+    profile.start("file I/O")
+    clock.now = 6.0
+    profile.stop()
+    clock.now = 10.0
+    profile.stop()
+    assert profile.results == dict(service={
+        "file I/O": dict(wall=4.0, cpu=2.0, peak=0, calls=2),
+        "rendering": dict(wall=6.0, cpu=3.0, peak=0, calls=1)})
+
+
+def test_merge_adds_times_and_keeps_peak():
+    profile = Profiler(False)
+    profile.add("service", "rendering", 1.0, 0.5, 100)
+    profile.merge(dict(service=dict(rendering=dict(wall=2.0, cpu=1.0, peak=50, calls=3)),
+                       other=dict(parsing=dict(wall=1.0, cpu=1.0, peak=200, calls=1))))
+    assert profile.results == dict(service=dict(rendering=dict(wall=3.0, cpu=1.5, peak=100, calls=4)),
+                                   other=dict(parsing=dict(wall=1.0, cpu=1.0, peak=200, calls=1)))
+
+
+def test_profile_writes_report(generator):
+    tracing = tracemalloc.is_tracing()
+    try:
+        generator.run(demo_config(3), "--profile", "profile.json")
+    finally:
+        profiler.init(False)
+        if not tracing:
+            tracemalloc.stop()
+    with open(generator.path("profile.json"), "r", encoding="utf-8") as f:
+        report = json.load(f)
+    phases = report["services"]["#0 openapi.yml"]
+    for name in ("spec resolution", "object parsing", "endpoint parsing", "rendering", "file I/O"):
+        assert phases[name]["calls"] > 0
+        assert phases[name]["wall"] >= 0
+    assert "config load" in report["services"][""]
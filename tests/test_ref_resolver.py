@@ -0,0 +1,48 @@
+import pytest
+
+from caffoa.ref_resolver import LocalRefResolver, escape_pointer, rename_translated_schemas, unescape_pointer
+
+
+def test_pointer_escaping():
+    assert escape_pointer("a/b~c") == "a~1b~0c"
+    assert unescape_pointer(escape_pointer("a/b~c")) == "a/b~c"
+
+
+def test_translated_schemas_are_renamed():
+    address = {"type": "object"}
+    shared = {"$ref": "#/components/schemas/base.openapi.yml_schemas_address"}
+    spec = {"components": {"schemas": {"base.openapi.yml_schemas_address": address,
+                                       "user": {"properties": {"home": shared, "work": shared}},
+                                       "other": {"$ref": "#/components/schemas/user"}}},
+            "paths": {"/": {"get": {"responses": [shared]}}}}
+    renamed = rename_translated_schemas(spec)
+    assert renamed == {"#/components/schemas/base.openapi.yml_schemas_address": "#/components/schemas/address"}
+    assert spec["components"]["schemas"]["address"] is address
+    assert "base.openapi.yml_schemas_address" not in spec["components"]["schemas"]
+    assert shared == {"$ref": "#/components/schemas/address"}
+    assert spec["components"]["schemas"]["other"] == {"$ref": "#/components/schemas/user"}
+    assert rename_translated_schemas({"components": {"schemas": {"user": {}}}}) == dict()
+    assert rename_translated_schemas(dict()) == dict()
+
+
+def test_local_references_are_followed():
+    user = {"type": "object"}
+    spec = {"components": {"schemas": {"user": user,
+                                       "alias": {"$ref": "#/components/schemas/user"},
+                                       "a/b": {"$ref": "#/components/schemas/alias"}},
+                           "list": [{"$ref": "#/components/schemas/user"}]}}
+    resolver = LocalRefResolver(spec)
+    assert resolver.resolve({"$ref": "#/components/schemas/a~1b"}) is user
+    assert resolver.resolve({"$ref": "#/components/list/0"}) is user
+    assert resolver.resolved["#/components/schemas/a~1b"] is user
+    assert resolver.resolve(user) is user
+    assert resolver.resolve({"$ref": "other.yml#/user"}) == {"$ref": "other.yml#/user"}
+
+
+def test_invalid_references_raise_warnings():
+    spec = {"components": {"schemas": {"a": {"$ref": "#/components/schemas/b"},
+                                       "b": {"$ref": "#/components/schemas/a"}}}}
+    with pytest.raises(Warning, match="circular reference"):
+        LocalRefResolver(spec).resolve({"$ref": "#/components/schemas/a"})
+    with pytest.raises(Warning, match="cannot resolve reference"):
+        LocalRefResolver(spec).resolve({"$ref": "#/components/schemas/missing"})
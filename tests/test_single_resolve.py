@@ -0,0 +1,26 @@
+from caffoa import openapi_file
+from conftest import demo_config
+
+
+def test_spec_is_resolved_once_per_service(generator, monkeypatch):
+    resolved = list()
+    original_parser = openapi_file.ResolvingParser
+
+    def resolving_parser(name, *args, **kwargs):
+        resolved.append(name)
+        return original_parser(name, *args, **kwargs)
+
+    monkeypatch.setattr(openapi_file, "ResolvingParser", resolving_parser)
+    config = demo_config(3)
+    config["services"].append(dict(apiPath="openapi.yml", model=dict(namespace="Other.Model",
+                                                                      targetFolder="demo/Other/Model")))
+    generator.run(config)
+    # the model and the endpoints of the first service share one resolved spec
+    assert resolved == ["openapi.yml", "openapi.yml"]
+
+
+def test_model_and_function_share_the_parser(generator):
+    handler = openapi_file.OpenApiFile("openapi.yml", 3, dict())
+    assert handler.model_parser() is handler.function_parser()
+    assert handler.names() is handler.names()
+    assert handler.refs() is handler.refs()
@@ -0,0 +1,84 @@
+import logging
+import os
+
+from caffoa.spec_cache import SpecCache
+from conftest import demo_config
+
+
+def write(file_name: str, content: str):
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def test_key_depends_on_all_referenced_files(generator):
+    cache = SpecCache(generator.path("cache"))
+    assert sorted(os.path.basename(name) for name in cache.referenced_files("openapi.yml")) == \
+           ["base.openapi.yml", "openapi.yml"]
+    key = cache.key("openapi.yml", "options")
+    assert key == cache.key("openapi.yml", "options")
+    assert key != cache.key("openapi.yml", "other options")
+    with open("base.openapi.yml", "a", encoding="utf-8") as f:
+        f.write("\n# changed\n")
+    assert key != cache.key("openapi.yml", "options")
+
+
+def test_remote_references_are_not_cached(tmp_path):
+    spec = str(tmp_path / "spec.yml")
+    write(spec, "components:\n  schemas:\n    a:\n      $ref: 'https://example.com/spec.yml#/a'\n")
+    cache = SpecCache(str(tmp_path / "cache"))
+    assert cache.key(spec, "") is None
+    cache.store(None, dict())
+    assert cache.load(None) is None
+    assert not os.path.exists(str(tmp_path / "cache"))
+
+
+def test_references_are_read_from_the_parsed_spec(tmp_path):
+    spec = str(tmp_path / "spec.yml")
+    write(spec, "# $ref: 'comment.yml'\n"
+                "components:\n"
+                "  schemas:\n"
+                "    a:\n"
+                "      description: \"see $ref: 'description.yml'\"\n"
+                "      $ref: 'other.yml#/components/schemas/b'\n")
+    write(str(tmp_path / "other.yml"), "components:\n  schemas:\n    b:\n      type: string\n")
+    assert sorted(os.path.basename(name) for name in SpecCache.referenced_files(spec)) == ["other.yml", "spec.yml"]
+
+
+def test_missing_references_are_not_cached(tmp_path):
+    spec = str(tmp_path / "spec.yml")
+    write(spec, "components:\n  schemas:\n    a:\n      $ref: 'missing.yml#/a'\n")
+    assert SpecCache.referenced_files(spec) is None
+    assert SpecCache(str(tmp_path / "cache")).key(spec, "") is None
+    write(spec, "components: [")
+    assert SpecCache.referenced_files(spec) is None
+
+
+def test_store_and_load(tmp_path):
+    cache = SpecCache(str(tmp_path))
+    assert cache.load("missing") is None
+    cache.store("key", dict(openapi="3.0.2"))
+    assert cache.load("key") == dict(openapi="3.0.2")
+    write(str(tmp_path / "broken.pickle"), "not a pickle")
+    assert cache.load("broken") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = SpecCache(str(tmp_path), max_size_mb=1)
+    data = "x" * (300 * 1024)
+    for number, key in enumerate(["a", "b", "c"]):
+        cache.store(key, data)
+        os.utime(str(tmp_path / f"{key}.pickle"), (1000 + number, 1000 + number))
+    cache.load("a")  # a is now the most recently used entry
+    cache.store("d", data)
+    assert sorted(os.listdir(str(tmp_path))) == ["a.pickle", "c.pickle", "d.pickle"]
+
+
+def test_generation_uses_cache(generator, caplog):
+    config = demo_config(3)
+    generator.run(config, "--full", cache=True)
+    expected = {name: open(generator.path(name), encoding="utf-8").read() for name in generator.files()}
+    assert os.listdir(generator.path(".caffoa-cache"))
+    with caplog.at_level(logging.INFO):
+        generator.run(config, "--full", cache=True)
+    assert "Using cached specification for openapi.yml" in caplog.text
+    assert {name: open(generator.path(name), encoding="utf-8").read() for name in generator.files()} == expected
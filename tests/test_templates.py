@@ -0,0 +1,66 @@
+from caffoa.function_writer import FunctionWriter
+from caffoa.interface_writer import InterfaceWriter
+from caffoa.manifest import fingerprint
+from caffoa.model import EndPoint
+from caffoa.templates import Template
+
+
+def endpoint(operation: str) -> EndPoint:
+    return EndPoint(operation, operation, "/users", "get", list(), list(), False)
+
+
+def test_template_renders_like_format():
+    text = "{A} and {B!r:>6} {{literal}}"
+    assert Template(text).format(A=1, B="x") == text.format(A=1, B="x")
+    assert Template(text).format_map(dict(A=1, B="x")) == text.format(A=1, B="x")
+
+
+def test_sections_split_at_the_field():
+    template = Template("head {A} {{x}}\n{METHODS}\nfoot {B} {METHODS}")
+    header, footer = template.sections("METHODS")
+    assert header.format(A=1) == "head 1 {x}\n"
+    assert footer.format(B=2, METHODS="m") == "\nfoot 2 m"
+    assert template.sections("METHODS")[0] is header
+
+
+def test_sections_do_not_change_the_template():
+    template = Template("head {METHODS} foot")
+    before = fingerprint(vars(template))
+    template.sections("METHODS")
+    assert fingerprint(vars(template)) == before
+
+
+def test_functions_are_streamed_method_by_method(tmp_path):
+    writer = FunctionWriter(3, "Demo", "Demo", str(tmp_path), "IDemoService")
+    rendered = list()
+
+    def format_endpoint(ep: EndPoint) -> str:
+        rendered.append(ep.name)
+        return f"method {ep.name}"
+
+    writer.format_endpoint = format_endpoint
+    template = Template("class {CLASSNAME} {{\n{METHODS}\n}}")
+    chunks = writer.stream_class([endpoint("a"), endpoint("b")], template, dict(CLASSNAME="Demo"))
+    assert next(chunks) == "class Demo {\n"
+    assert rendered == []
+    assert next(chunks) == "method a"
+    assert rendered == ["a"]
+    assert list(chunks) == ["\n\n", "method b", "\n}"]
+    assert rendered == ["a", "b"]
+
+
+def test_interface_is_streamed_method_by_method(tmp_path):
+    writer = InterfaceWriter(3, "Demo", "Demo", str(tmp_path))
+    rendered = list()
+
+    def format_endpoints(ep: EndPoint) -> list:
+        rendered.append(ep.name)
+        return [f"method {ep.name}", f"overload {ep.name}"]
+
+    writer.format_endpoints = format_endpoints
+    template = Template("interface {CLASSNAME} {{\n{METHODS}\n}}")
+    chunks = writer.stream_interface([endpoint("a"), endpoint("b")], template, dict(CLASSNAME="IDemo"))
+    assert next(chunks) == "interface IDemo {\n"
+    assert rendered == []
+    assert "".join(chunks) == "method a\n\noverload a\n\nmethod b\n\noverload b\n}"
+    assert rendered == ["a", "b"]
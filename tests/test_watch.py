@@ -0,0 +1,93 @@
+import os
+from argparse import Namespace
+
+import pytest
+
+from caffoa.openapi_file import OpenApiFile
+from caffoa.watcher import Watcher
+from conftest import demo_config
+
+OTHER_SPEC = """openapi: "3.0.2"
+info:
+  title: Other API
+  version: "1.0"
+paths: {}
+components:
+  schemas:
+    location:
+      type: object
+      properties:
+        street:
+          type: string
+"""
+
+
+def touch(file_name: str, append: str = ""):
+    with open(file_name, "a", encoding="utf-8") as f:
+        f.write(append)
+    stat = os.stat(file_name)
+    os.utime(file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def watcher(generator, monkeypatch):
+    """
+    a watcher for two services: the demo (openapi.yml, which references base.openapi.yml)
+    and a model of other.openapi.yml. Records which spec files are resolved.
+    """
+    with open(generator.path("other.openapi.yml"), "w", encoding="utf-8") as f:
+        f.write(OTHER_SPEC)
+    config = demo_config(3)
+    config["services"].append(dict(apiPath="other.openapi.yml",
+                                   model=dict(namespace="Other.Model", targetFolder="demo/Other/Model")))
+    generator.run(config)
+    resolved = list()
+    original_resolve = OpenApiFile._resolve
+
+    def resolve(handler):
+        resolved.append(handler.name)
+        return original_resolve(handler)
+
+    monkeypatch.setattr(OpenApiFile, "_resolve", resolve)
+    watcher = Watcher(Namespace(config="caffoa.yml", clean=False, no_cache=True, full=False, jobs=1, profile=None))
+    watcher.load()
+    watcher.regenerate(list())
+    watcher.update_watched()
+    watcher.resolved = resolved
+    assert resolved == ["openapi.yml", "other.openapi.yml"]
+    resolved.clear()
+    return watcher
+
+
+def test_only_changed_service_is_resolved_again(watcher, generator):
+    touch(generator.path("base.openapi.yml"), "\n# changed\n")
+    changed = watcher.changed_files()
+    assert changed == [generator.path("base.openapi.yml")]
+    handlers = list(watcher.handlers)
+    watcher.regenerate(changed)
+    assert watcher.resolved == ["openapi.yml"]
+    assert watcher.handlers[0] is not handlers[0]
+    assert watcher.handlers[1] is handlers[1]
+
+    watcher.update_watched()
+    assert watcher.changed_files() == []
+    watcher.regenerate(watcher.changed_files())
+    assert watcher.resolved == ["openapi.yml"]
+
+
+def test_config_change_reuses_resolved_specs(watcher, generator):
+    expected = {name: open(generator.path(name), encoding="utf-8").read() for name in generator.files()}
+    touch(generator.path("caffoa.yml"))
+    watcher.regenerate(watcher.changed_files())
+    assert watcher.resolved == []
+    assert {name: open(generator.path(name), encoding="utf-8").read() for name in generator.files()} == expected
+
+    with open(generator.path("caffoa.yml"), "r", encoding="utf-8") as f:
+        config = f.read()
+    with open(generator.path("caffoa.yml"), "w", encoding="utf-8") as f:
+        f.write(config.replace("namespace: Other.Model", "namespace: Changed.Model"))
+    touch(generator.path("other.openapi.yml"), "\n# changed\n")
+    watcher.regenerate([generator.path("caffoa.yml"), generator.path("other.openapi.yml")])
+    assert watcher.resolved == ["other.openapi.yml"]
+    with open(generator.path("demo/Other/Model/Location.generated.cs"), "r", encoding="utf-8") as f:
+        assert "namespace Changed.Model" in f.read()